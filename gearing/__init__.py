@@ -0,0 +1,64 @@
+"""
+Mesin pengolahan data (tanpa Streamlit) untuk Dashboard Gearing Ratio
+dan Outstanding Penjaminan.
+
+Submodul dimuat saat namanya pertama kali diakses (gearing.compute_gearing,
+dst.), sehingga `from gearing.memory import ...` tidak ikut memuat
+duckdb, pyarrow, figures, dan modul berat lainnya.
+"""
+
+import importlib
+
+# ===============================
+# EKSPOR (nama -> submodul)
+# ===============================
+_EKSPOR = {
+    "cache": ("DiskCache", "content_hash"),
+    "clean": ("categorical_to_numeric", "clean_gearing", "clean_penjaminan_sheet", "to_categorical"),
+    "cube": ("aggregate_from_cube", "build_cube", "rollup", "rollup_numeric"),
+    "dataset": (
+        "load_gearing",
+        "load_gearing_stream",
+        "load_penjaminan",
+        "load_penjaminan_duckdb",
+        "load_penjaminan_stream",
+    ),
+    "downsample": ("downsample", "lttb_indices"),
+    "duck": ("duckdb_supports", "penjaminan_duckdb"),
+    "engine": ("aggregate_penjaminan", "compute_gearing", "dedup_audited", "pivot_periode_jenis"),
+    "figures": ("bar_figure", "data_hash", "dual_axis_figure", "figure_json"),
+    "loader": ("arrow_columns", "is_arrow_file", "read_arrow", "read_table", "read_workbook"),
+    "lru": ("LRUCache",),
+    "memory": ("MemoryBudget", "MemoryBudgetExceeded", "estimate_load_bytes"),
+    "nilai": ("format_values", "parse_value_series"),
+    "periode": (
+        "add_periode_columns",
+        "bulan_id",
+        "bulan_map",
+        "clear_periode_memo",
+        "parse_periode_series",
+        "sort_periode",
+    ),
+    "shared": ("SharedDatasets", "estimate_nbytes"),
+    "store": ("AggregateStore", "period_hashes"),
+    "stream": ("should_stream", "stream_gearing_csv", "stream_penjaminan_csv"),
+    "synth": ("make_gearing", "make_penjaminan", "write_gearing", "write_penjaminan"),
+    "worker": ("Cancelled", "JobPool", "Progress"),
+}
+
+_MODUL = {nama: modul for modul, names in _EKSPOR.items() for nama in names}
+
+__all__ = sorted(_MODUL)
+
+
+def __getattr__(name):
+    modul = _MODUL.get(name)
+    if modul is None:
+        raise AttributeError(f"module 'gearing' has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"gearing.{modul}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
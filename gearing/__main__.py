@@ -0,0 +1,5 @@
+import sys
+
+from gearing.cli import main
+
+sys.exit(main())
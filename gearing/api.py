@@ -0,0 +1,386 @@
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import tempfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from gearing.cache import DiskCache, content_hash
+from gearing.cli import EKSTENSI, _deteksi_mode, _nama_file, aggregate_file
+from gearing.cube import aggregate_from_cube
+from gearing.engine import PENJAMINAN_GROUP, aggregate_penjaminan, compute_gearing
+from gearing.loader import single_sheet_name
+from gearing.lru import LRUCache
+from gearing.shared import SharedDatasets
+
+# ===============================
+# API JSON LOKAL (GEARING RATIO & AGREGAT PENJAMINAN)
+# ===============================
+DEFAULT_HOST = os.environ.get("GEARING_API_HOST", "127.0.0.1")
+DEFAULT_PORT = int(os.environ.get("GEARING_API_PORT", "8765"))
+MAX_UPLOAD_MB = int(os.environ.get("GEARING_API_MAX_MB", "512"))
+RESULTS_MAX_MB = int(os.environ.get("GEARING_API_RESULTS_MB", "512"))
+
+# Naikkan jika perhitungan / format hasil berubah (kunci cache disk hasil)
+API_VERSION = 2
+
+MODES = ("auto", "gearing", "penjaminan")
+PREFIX_PENJAMINAN = "penjaminan_"
+_DIGEST = re.compile(r"[0-9a-f]{64}")
+
+
+class ApiError(Exception):
+    """Error yang dikirim ke klien sebagai {"error": ...} dengan status HTTP."""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def _records(df):
+    """DataFrame -> list dict siap JSON (NaN -> null)."""
+    return json.loads(df.to_json(orient="records", date_format="iso"))
+
+
+def dataset_id(digest, mode, name):
+    """
+    Id dataset hasil upload: hash isi file + mode terpilih + format, dan
+    untuk Penjaminan satu tabel nama sheet dari nama file (Proyeksi.csv
+    memakai Tenor). Isi sama dengan mode / nama berbeda = hasil berbeda.
+    """
+    lower = str(name).lower()
+    sheet = single_sheet_name(name) if mode == "penjaminan" and not lower.endswith(".xlsx") else ""
+    varian = f"{digest}:{os.path.splitext(lower)[1]}:{mode}:{sheet}"
+    return hashlib.sha256(varian.encode("utf-8")).hexdigest()
+
+
+def _sheets(outputs):
+    """{nama sheet: DataFrame} dari hasil "penjaminan_<sheet>"."""
+    return {
+        key[len(PREFIX_PENJAMINAN):]: df
+        for key, df in outputs.items() if key.startswith(PREFIX_PENJAMINAN)
+    }
+
+
+class GearingApi:
+    """
+    Hasil Gearing Ratio / agregat Penjaminan per dataset (lihat dataset_id).
+
+    Hasil dihitung sekali per id (permintaan bersamaan menunggu hasil
+    yang sama), disimpan di memori dan di cache disk. Hash isi file yang
+    pernah di-upload ke dashboard atau batch juga dikenali lewat cache
+    hasil parsing-nya. Respons JSON di-cache per path beserta ETag-nya.
+    """
+
+    def __init__(self, cache=None, results_max_bytes=RESULTS_MAX_MB * 1024 * 1024, max_responses=1024):
+        self.cache = cache
+        self.results = SharedDatasets(max_bytes=results_max_bytes)
+        self.responses = LRUCache(maxsize=max_responses)
+
+    # ===============================
+    # HASIL PER DATASET
+    # ===============================
+    def _simpan(self, dataset, hasil):
+        if self.cache is not None:
+            self.cache.put(
+                f"api-v{API_VERSION}-{dataset}", hasil["outputs"],
+                {"mode": hasil["mode"], "rows": hasil["rows"]},
+            )
+
+    def _hasil_tersimpan(self, dataset):
+        hit = None if self.cache is None else self.cache.get(f"api-v{API_VERSION}-{dataset}")
+        if hit is None:
+            return None
+        frames, meta = hit
+        return {"mode": meta["mode"], "rows": meta["rows"], "outputs": frames}
+
+    def upload(self, body, name, mode="auto"):
+        """Parse + agregasi isi file `body`; kembalikan (id dataset, hasil)."""
+        if not name or not name.lower().endswith(EKSTENSI):
+            raise ApiError(415, "Nama file wajib (?name=...) dengan ekstensi " + " / ".join(EKSTENSI))
+        if mode not in MODES:
+            raise ApiError(400, f"mode harus salah satu dari {', '.join(MODES)}")
+        digest = content_hash(body)
+
+        with tempfile.TemporaryDirectory(prefix="gearing-api-") as tmp:
+            path = os.path.join(tmp, os.path.basename(name))
+            with open(path, "wb") as f:
+                f.write(body)
+
+            def hitung():
+                hasil = self._hasil_tersimpan(dataset)
+                if hasil is None:
+                    agregat = aggregate_file(path, mode, self.cache, digest=digest)
+                    hasil = {k: agregat[k] for k in ("mode", "rows", "outputs")}
+                    self._simpan(dataset, hasil)
+                return hasil
+
+            try:
+                # Mode auto ditentukan dulu (header saja) agar ikut id dataset
+                if mode == "auto":
+                    mode = _deteksi_mode(path)
+                dataset = dataset_id(digest, mode, name)
+                return dataset, self.results.acquire(dataset, None, hitung)
+            except ValueError as e:
+                raise ApiError(422, str(e)) from e
+
+    def dataset(self, digest):
+        """Hasil untuk id dataset / hash isi `digest` (memori, cache disk, atau cache parsing dashboard)."""
+        if not _DIGEST.fullmatch(digest):
+            raise ApiError(404, "Hash dataset tidak valid")
+        try:
+            return self.results.acquire(digest, None, lambda: self._dari_cache(digest))
+        except KeyError:
+            raise ApiError(404, "Dataset tidak dikenal; upload file lewat POST /datasets") from None
+
+    def _dari_cache(self, digest):
+        if self.cache is None:
+            raise KeyError(digest)
+
+        hasil = self._hasil_tersimpan(digest)
+        if hasil is not None:
+            return hasil
+
+        # Hasil parsing dashboard / batch di cache disk yang sama. File yang
+        # sama bisa ter-upload ke halaman yang salah: parsing Gearing tanpa
+        # kolom Jenis dilewati.
+        hasil = None
+        gearing = self.cache.get(f"gearing-{digest}")
+        gearing_stream = self.cache.get(f"gearing-stream-{digest}")
+        if gearing is not None and "Jenis" in gearing[0]["data"].columns:
+            df = gearing[0]["data"]
+            hasil = {"mode": "gearing", "rows": len(df), "outputs": {"gearing_ratio": compute_gearing(df)}}
+        elif gearing_stream is not None and "Jenis" in gearing_stream[0]["reduced"].columns:
+            frames, meta = gearing_stream
+            hasil = {
+                "mode": "gearing", "rows": meta["info"]["n_rows"],
+                "outputs": {"gearing_ratio": compute_gearing(frames["reduced"])},
+            }
+        elif (hit := self.cache.get(f"penjaminan-{digest}")) is not None:
+            sheets, meta = hit
+            hasil = {
+                "mode": "penjaminan", "rows": sum(len(d) for d in sheets.values()),
+                "outputs": {
+                    f"{PREFIX_PENJAMINAN}{_nama_file(sheet)}": aggregate_penjaminan(d)
+                    for sheet, d in sheets.items() if meta["info"][sheet]["status"] == "ok"
+                },
+            }
+        else:
+            for jalur in ("stream", "duckdb"):
+                hit = self.cache.get(f"penjaminan-{jalur}-{digest}")
+                if hit is None:
+                    continue
+                frames, meta = hit
+                sheet = meta.get("sheet", "CSV")
+                outputs = {}
+                if "cube" in frames:
+                    outputs[f"{PREFIX_PENJAMINAN}{_nama_file(sheet)}"] = aggregate_from_cube(
+                        frames["cube"], PENJAMINAN_GROUP
+                    )
+                hasil = {"mode": "penjaminan", "rows": meta["info"].get("n_rows", 0), "outputs": outputs}
+                break
+
+        if hasil is None:
+            raise KeyError(digest)
+        self._simpan(digest, hasil)
+        return hasil
+
+    # ===============================
+    # RESPONS JSON (CACHE + ETAG)
+    # ===============================
+    def respond(self, key, build):
+        """(body, etag) untuk `key`; `build()` hanya dipanggil jika belum di-cache."""
+        def buat():
+            body = json.dumps(build(), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            return body, '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+        return self.responses.get_or_compute(key, buat)
+
+    def get(self, path, query):
+        """Jawaban GET `path` sebagai (body, etag); lempar ApiError jika tidak ada."""
+        bagian = [unquote(p) for p in path.strip("/").split("/") if p]
+
+        if bagian == ["health"]:
+            body = json.dumps({"status": "ok", "results": self.results.stats()}).encode("utf-8")
+            return body, None
+
+        if len(bagian) < 2 or bagian[0] != "datasets":
+            raise ApiError(404, "Endpoint tidak dikenal")
+        digest, sisa = bagian[1], bagian[2:]
+        kolom = [c for c in ",".join(query.get("columns", [])).split(",") if c]
+        key = (digest, tuple(sisa), tuple(kolom))
+
+        # Respons untuk hash yang sama tidak berubah: cek cache sebelum hasil
+        hit = self.responses.get(key)
+        if hit is not None:
+            return hit
+
+        hasil = self.dataset(digest)
+        outputs = hasil["outputs"]
+
+        def pilih(df):
+            hilang = [c for c in kolom if c not in df.columns]
+            if hilang:
+                raise ApiError(400, f"Kolom tidak dikenal: {', '.join(hilang)}")
+            return df[kolom] if kolom else df
+
+        if not sisa:
+            return self.respond(key, lambda: {
+                "dataset": digest,
+                "mode": hasil["mode"],
+                "rows": hasil["rows"],
+                "results": [
+                    {"name": name, "rows": len(df), "columns": list(map(str, df.columns))}
+                    for name, df in outputs.items()
+                ],
+            })
+
+        if sisa == ["gearing"]:
+            if "gearing_ratio" not in outputs:
+                raise ApiError(404, "Dataset ini bukan file Gearing Ratio")
+            return self.respond(key, lambda: {
+                "dataset": digest, "data": _records(pilih(outputs["gearing_ratio"])),
+            })
+
+        if sisa[0] == "penjaminan" and len(sisa) <= 2:
+            sheets = _sheets(outputs)
+            if hasil["mode"] != "penjaminan":
+                raise ApiError(404, "Dataset ini bukan file Outstanding Penjaminan")
+            if len(sisa) == 1:
+                return self.respond(key, lambda: {
+                    "dataset": digest,
+                    "sheets": {sheet: _records(pilih(df)) for sheet, df in sheets.items()},
+                })
+            sheet = _nama_file(sisa[1])
+            if sheet not in sheets:
+                raise ApiError(404, f"Sheet '{sisa[1]}' tidak ada; tersedia: {', '.join(sheets)}")
+            return self.respond(key, lambda: {
+                "dataset": digest, "sheet": sheet, "data": _records(pilih(sheets[sheet])),
+            })
+
+        raise ApiError(404, "Endpoint tidak dikenal")
+
+
+# ===============================
+# SERVER HTTP (STDLIB)
+# ===============================
+def _etag_cocok(header, etag):
+    if not header or etag is None:
+        return False
+    tags = [t.strip().removeprefix("W/") for t in header.split(",")]
+    return "*" in tags or etag in tags
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "GearingAPI/1"
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+    def _kirim(self, status, body=b"", etag=None):
+        self.send_response(status)
+        if etag is not None:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+        if status != 304:
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if status != 304 and self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _layani(self, fn):
+        try:
+            status, (body, etag) = fn()
+        except ApiError as e:
+            status, body, etag = e.status, json.dumps({"error": str(e)}).encode("utf-8"), None
+        except Exception as e:  # satu request gagal tidak mematikan server
+            self.log_error("%s: %s", type(e).__name__, e)
+            status, body, etag = 500, json.dumps({"error": f"{type(e).__name__}: {e}"}).encode("utf-8"), None
+
+        if status == 200 and _etag_cocok(self.headers.get("If-None-Match"), etag):
+            status = 304
+        self._kirim(status, body, etag)
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        self._layani(lambda: (200, self.server.api.get(url.path, parse_qs(url.query))))
+
+    do_HEAD = do_GET
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+
+        def upload():
+            if url.path.rstrip("/") != "/datasets":
+                raise ApiError(404, "Endpoint tidak dikenal")
+            query = parse_qs(url.query)
+            try:
+                n = int(self.headers.get("Content-Length", ""))
+            except ValueError:
+                raise ApiError(411, "Header Content-Length wajib") from None
+            if n > MAX_UPLOAD_MB * 1024 * 1024:
+                self.close_connection = True
+                raise ApiError(413, f"File melebihi batas {MAX_UPLOAD_MB} MB (GEARING_API_MAX_MB)")
+            name = query.get("name", [self.headers.get("X-Filename", "")])[0]
+            mode = query.get("mode", ["auto"])[0]
+            digest, hasil = self.server.api.upload(self.rfile.read(n), name, mode)
+            body = json.dumps({
+                "dataset": digest,
+                "mode": hasil["mode"],
+                "rows": hasil["rows"],
+                "results": list(hasil["outputs"]),
+                "url": f"/datasets/{digest}",
+            }).encode("utf-8")
+            return 201, (body, None)
+
+        self._layani(upload)
+
+
+def make_server(host=DEFAULT_HOST, port=DEFAULT_PORT, api=None, quiet=False):
+    """ThreadingHTTPServer yang melayani `api` (GearingApi); jalankan dengan serve_forever()."""
+    server = ThreadingHTTPServer((host, port), _Handler)
+    server.daemon_threads = True
+    server.api = api or GearingApi()
+    server.quiet = quiet
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m gearing.api",
+        description="API JSON lokal untuk hasil Gearing Ratio dan agregat Outstanding Penjaminan.",
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument(
+        "--cache-dir", default=None,
+        help="Cache disk hasil parsing (default sama dengan dashboard, GEARING_CACHE_DIR)",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Tanpa cache disk (hanya memori)")
+    parser.add_argument("--quiet", action="store_true", help="Tanpa log per request")
+    args = parser.parse_args(argv)
+
+    cache = None
+    if not args.no_cache:
+        try:
+            cache = DiskCache(args.cache_dir) if args.cache_dir else DiskCache()
+        except OSError as e:
+            print(f"Cache disk tidak tersedia ({e}); hanya memakai memori", file=sys.stderr)
+
+    server = make_server(args.host, args.port, GearingApi(cache), quiet=args.quiet)
+    print(f"API berjalan di http://{args.host}:{server.server_port}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
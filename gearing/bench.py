@@ -0,0 +1,256 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+
+import pandas as pd
+
+from gearing import periode
+from gearing.clean import clean_gearing, clean_penjaminan_sheet
+from gearing.cube import build_cube
+from gearing.engine import aggregate_penjaminan, compute_gearing
+from gearing.loader import PENJAMINAN_KOLOM, PENJAMINAN_POSISI, read_table, read_workbook
+from gearing.metrics import append_jsonl
+from gearing.nilai import parse_value_series
+from gearing.synth import (
+    EXCEL_MAX_ROWS,
+    make_gearing,
+    make_penjaminan,
+    parse_rows,
+    write_gearing,
+    write_penjaminan,
+)
+
+# ===============================
+# BENCHMARK PIPELINE
+# ===============================
+DEFAULT_BENCH_LOG = os.environ.get("GEARING_BENCH_LOG", "bench_results.jsonl")
+DEFAULT_SIZES = "10k,100k,1m"
+DEFAULT_FORMATS = "csv,parquet"
+
+
+def _ukur(fn, repeat, setup=None):
+    """Jalankan `fn` sebanyak `repeat` kali; kembalikan (hasil terakhir, daftar detik)."""
+    waktu, hasil = [], None
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        t0 = time.perf_counter()
+        hasil = fn()
+        waktu.append(time.perf_counter() - t0)
+    return hasil, waktu
+
+
+def _memo_kosong():
+    # parse_periode diukur dingin (tanpa memo dari run sebelumnya)
+    periode.clear_periode_memo()
+
+
+def _git_commit():
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, timeout=5,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def bench_gearing(n_rows, fmt, tmp_dir, repeat=3, seed=0):
+    """Ukur tahap pipeline Gearing untuk satu ukuran dan format file."""
+    path = os.path.join(tmp_dir, f"gearing-{n_rows}.{fmt}")
+    write_gearing(make_gearing(n_rows, seed=seed), path)
+    name = os.path.basename(path)
+
+    hasil = {}
+    raw, hasil["load"] = _ukur(lambda: read_table(path, name), repeat)
+    _, hasil["parse_periode"] = _ukur(
+        lambda: periode.parse_periode_series(raw["Periode"]), repeat, setup=_memo_kosong
+    )
+    _, hasil["parse_value"] = _ukur(lambda: parse_value_series(raw["Value"]), repeat)
+    (df, _), hasil["clean"] = _ukur(lambda: clean_gearing(raw.copy()), repeat, setup=_memo_kosong)
+    _, hasil["gearing_ratio"] = _ukur(lambda: compute_gearing(df), repeat)
+    return {"rows": len(raw), "bytes": os.path.getsize(path), "stages": hasil}
+
+
+def bench_penjaminan(n_rows, fmt, tmp_dir, repeat=3, seed=0):
+    """
+    Ukur tahap pipeline Penjaminan: baca, bersihkan dan agregasi per sheet
+    (aggregate_penjaminan dan build_cube), dijumlah untuk semua sheet.
+    """
+    target = os.path.join(tmp_dir, f"penjaminan-{n_rows}" + (".xlsx" if fmt == "xlsx" else f".{fmt}"))
+    files = write_penjaminan(make_penjaminan(n_rows, seed=seed), target)
+
+    def baca():
+        raw = {}
+        for path in files:
+            sheets = read_workbook(
+                path, os.path.basename(path), posisi=PENJAMINAN_POSISI, kolom=PENJAMINAN_KOLOM
+            )
+            if fmt != "xlsx":
+                # Satu file per sheet: nama sheet = nama file
+                sheets = {os.path.splitext(os.path.basename(path))[0]: next(iter(sheets.values()))}
+            raw.update(sheets)
+        return raw
+
+    def bersihkan():
+        return {s: clean_penjaminan_sheet(d)[0] for s, d in raw.items()}
+
+    hasil = {}
+    raw, hasil["load"] = _ukur(baca, repeat)
+    _, hasil["parse_periode"] = _ukur(
+        lambda: [periode.parse_periode_series(d["Periode"]) for d in raw.values()],
+        repeat, setup=_memo_kosong,
+    )
+    _, hasil["parse_value"] = _ukur(
+        lambda: [parse_value_series(d["Value"]) for d in raw.values()], repeat
+    )
+    sheets, hasil["clean"] = _ukur(bersihkan, repeat)
+    _, hasil["sheet_aggregate"] = _ukur(
+        lambda: [aggregate_penjaminan(d) for d in sheets.values()], repeat
+    )
+    _, hasil["sheet_cube"] = _ukur(
+        lambda: [
+            build_cube(d, tenor=d.columns[3] if s == "Proyeksi" else None)
+            for s, d in sheets.items()
+        ],
+        repeat,
+    )
+    n = sum(len(d) for d in raw.values())
+    size = sum(os.path.getsize(p) for p in files)
+    return {"rows": n, "bytes": size, "stages": hasil}
+
+
+def run(sizes, formats, layouts=("gearing", "penjaminan"), repeat=3, out=DEFAULT_BENCH_LOG, label=None):
+    """
+    Jalankan benchmark untuk semua kombinasi ukuran x format x layout.
+
+    Setiap hasil tahap ditulis sebagai satu baris JSON ke `out` dengan
+    id run, commit git dan versi Python / pandas agar run dapat dibanding.
+    Mengembalikan DataFrame hasil run ini.
+    """
+    meta = {
+        "run": uuid.uuid4().hex[:12],
+        "ts": time.time(),
+        "label": label,
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+    }
+    fungsi = {"gearing": bench_gearing, "penjaminan": bench_penjaminan}
+    rows = []
+    with tempfile.TemporaryDirectory(prefix="gearing-bench-") as tmp_dir:
+        for n in sizes:
+            for fmt in formats:
+                if fmt == "xlsx" and n > EXCEL_MAX_ROWS:
+                    continue
+                for layout in layouts:
+                    hasil = fungsi[layout](n, fmt, tmp_dir, repeat=repeat)
+                    for stage, waktu in hasil["stages"].items():
+                        rec = dict(
+                            meta,
+                            layout=layout,
+                            size=n,
+                            format=fmt,
+                            rows=hasil["rows"],
+                            bytes=hasil["bytes"],
+                            stage=stage,
+                            min=round(min(waktu), 6),
+                            median=round(statistics.median(waktu), 6),
+                            repeat=len(waktu),
+                        )
+                        append_jsonl(out, rec)
+                        rows.append(rec)
+                        print(
+                            f"{layout:<10} {fmt:<8} {n:>11,} {stage:<16} "
+                            f"median {rec['median']:9.4f}s  min {rec['min']:9.4f}s",
+                            flush=True,
+                        )
+    return pd.DataFrame(rows)
+
+
+def read_results(path=DEFAULT_BENCH_LOG):
+    """Baca log hasil benchmark (JSON lines) menjadi DataFrame."""
+    rows = []
+    try:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    rows.append(json.loads(line))
+                except ValueError:
+                    continue
+    except OSError:
+        pass
+    return pd.DataFrame(rows)
+
+
+def compare(path=DEFAULT_BENCH_LOG, base=None, head=None):
+    """
+    Bandingkan dua run (default: dua run terakhir di log) per
+    (layout, format, size, stage). Kolom ratio = median head / median base.
+    """
+    log = read_results(path)
+    if log.empty:
+        return log
+    urutan = log.groupby("run")["ts"].min().sort_values().index.tolist()
+    head = head or urutan[-1]
+    base = base or (urutan[-2] if len(urutan) > 1 else urutan[-1])
+
+    keys = ["layout", "format", "size", "stage"]
+    a = log[log["run"] == base].set_index(keys)["median"].rename("base")
+    b = log[log["run"] == head].set_index(keys)["median"].rename("head")
+    df = pd.concat([a, b], axis=1).dropna().reset_index()
+    df["ratio"] = (df["head"] / df["base"]).round(3)
+    return df
+
+
+def _daftar(text):
+    return [t.strip() for t in str(text).split(",") if t.strip()]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m gearing.bench",
+        description="Benchmark pipeline Gearing / Penjaminan dengan data sintetis.",
+    )
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="mis. 10k,100k,1m,10m")
+    parser.add_argument("--formats", default=DEFAULT_FORMATS, help="csv, parquet, xlsx (xlsx maks. 1 juta baris)")
+    parser.add_argument("--layouts", default="gearing,penjaminan")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--out", default=DEFAULT_BENCH_LOG, help="Log hasil (JSON lines)")
+    parser.add_argument("--label", default=None, help="Catatan run, mis. nama branch")
+    parser.add_argument(
+        "--compare", nargs="*", metavar="RUN",
+        help="Bandingkan BASE [HEAD] di log (default: dua run terakhir) tanpa menjalankan benchmark",
+    )
+    args = parser.parse_args(argv)
+
+    if args.compare is not None:
+        df = compare(args.out, *args.compare[:2])
+        if df.empty:
+            print(f"Tidak ada hasil yang dapat dibandingkan di {args.out}")
+            return 1
+        print(df.to_string(index=False))
+        return 0
+
+    run(
+        [parse_rows(s) for s in _daftar(args.sizes)],
+        _daftar(args.formats),
+        layouts=_daftar(args.layouts),
+        repeat=max(1, args.repeat),
+        out=args.out,
+        label=args.label,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
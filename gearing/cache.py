@@ -0,0 +1,140 @@
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import tempfile
+import time
+
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401
+    _PARQUET = True
+except ImportError:
+    _PARQUET = False
+
+# Naikkan jika logika cleaning berubah agar entri lama tidak dipakai lagi
+CACHE_VERSION = 5
+
+DEFAULT_CACHE_DIR = os.environ.get(
+    "GEARING_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "gearing-ratio"),
+)
+DEFAULT_CACHE_MAX_MB = int(os.environ.get("GEARING_CACHE_MAX_MB", "1024"))
+
+
+def content_hash(data):
+    """SHA-256 isi file upload (bytes / file-like)."""
+    h = hashlib.sha256()
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        h.update(data)
+    else:
+        data.seek(0)
+        for chunk in iter(lambda: data.read(1 << 20), b""):
+            h.update(chunk)
+        data.seek(0)
+    return h.hexdigest()
+
+
+def _dir_size(path):
+    total = 0
+    for root, _, files in os.walk(path):
+        for f in files:
+            try:
+                total += os.path.getsize(os.path.join(root, f))
+            except OSError:
+                pass
+    return total
+
+
+class DiskCache:
+    """
+    Cache hasil parsing di disk, dikunci oleh hash isi file.
+
+    Setiap entri adalah folder berisi satu file Parquet per DataFrame
+    plus meta.json. Jika total ukuran melewati `max_bytes`, entri yang
+    paling lama tidak diakses dihapus (LRU berbasis mtime).
+    """
+
+    def __init__(self, root=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_CACHE_MAX_MB * 1024 * 1024):
+        self.root = root
+        self.max_bytes = max_bytes
+        os.makedirs(self.root, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.root, f"v{CACHE_VERSION}-{key}")
+
+    def get(self, key):
+        """Ambil (frames, meta) dari cache, atau None jika tidak ada."""
+        path = self._path(key)
+        meta_path = os.path.join(path, "meta.json")
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                manifest = json.load(f)
+            frames = {}
+            for name, entry in manifest["frames"]:
+                fpath = os.path.join(path, entry["file"])
+                if entry["format"] == "parquet":
+                    frames[name] = pd.read_parquet(fpath)
+                else:
+                    with open(fpath, "rb") as f:
+                        frames[name] = pickle.load(f)
+        except (OSError, ValueError, KeyError, pickle.UnpicklingError):
+            return None
+
+        # Tandai baru diakses (untuk LRU)
+        now = time.time()
+        try:
+            os.utime(meta_path, (now, now))
+        except OSError:
+            pass
+        return frames, manifest["meta"]
+
+    def put(self, key, frames, meta=None):
+        """Simpan dict {nama: DataFrame} + meta (harus bisa di-JSON)."""
+        path = self._path(key)
+        if os.path.exists(path):
+            return
+
+        tmp = tempfile.mkdtemp(dir=self.root, prefix=".tmp-")
+        try:
+            manifest = {"frames": [], "meta": meta or {}}
+            for i, (name, df) in enumerate(frames.items()):
+                entry = {"file": f"{i}.parquet", "format": "parquet"}
+                try:
+                    if not _PARQUET:
+                        raise ImportError("pyarrow tidak terpasang")
+                    df.to_parquet(os.path.join(tmp, entry["file"]))
+                except Exception:
+                    # Kolom campuran (mis. angka + teks) tidak bisa ke Parquet
+                    entry = {"file": f"{i}.pkl", "format": "pickle"}
+                    with open(os.path.join(tmp, entry["file"]), "wb") as f:
+                        pickle.dump(df, f, protocol=pickle.HIGHEST_PROTOCOL)
+                manifest["frames"].append([name, entry])
+
+            with open(os.path.join(tmp, "meta.json"), "w", encoding="utf-8") as f:
+                json.dump(manifest, f)
+            os.replace(tmp, path)
+        except OSError:
+            shutil.rmtree(tmp, ignore_errors=True)
+            return
+
+        self.evict()
+
+    def evict(self):
+        """Hapus entri paling lama diakses sampai total ukuran <= max_bytes."""
+        entries = []
+        for name in os.listdir(self.root):
+            path = os.path.join(self.root, name)
+            meta_path = os.path.join(path, "meta.json")
+            if name.startswith(".") or not os.path.isfile(meta_path):
+                continue
+            entries.append((os.path.getmtime(meta_path), _dir_size(path), path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
@@ -0,0 +1,130 @@
+import numpy as np
+import pandas as pd
+
+from gearing.nilai import parse_value_series
+from gearing.periode import add_periode_columns
+
+GEARING_REQUIRED = ["Periode", "Value"]
+
+# Kolom dimensi yang disimpan sebagai categorical (dictionary-encoded)
+GEARING_KATEGORI = ["Jenis", "Periode_Raw"]
+PENJAMINAN_KATEGORI = ["Periode", "KUR/PEN", "Dimensi", "Metrics"]
+
+
+def to_categorical(df, cols):
+    """Ubah kolom teks (object / string) di `cols` menjadi categorical, in-place."""
+    for col in cols:
+        if col not in df.columns:
+            continue
+        dtype = df[col].dtype
+        if pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype):
+            df[col] = df[col].astype("category")
+    return df
+
+
+def categorical_to_numeric(s):
+    """pd.to_numeric untuk Series categorical: konversi hanya pada kategori unik."""
+    if not isinstance(s.dtype, pd.CategoricalDtype):
+        return pd.to_numeric(s, errors="coerce")
+    cats = pd.to_numeric(pd.Series(s.cat.categories), errors="coerce").to_numpy(dtype="float64")
+    codes = s.cat.codes.to_numpy()
+    values = np.where(codes >= 0, cats[codes], np.nan)
+    return pd.Series(values, index=s.index)
+
+
+def clean_gearing(df):
+    """
+    Bersihkan tabel Gearing Ratio (layout Periode / Jenis / Value).
+
+    Menambahkan kolom periode (Year, Month, SortKey, Periode_Label),
+    flag Is_Audited dan mengubah Value ke float. Mengembalikan tuple
+    (df, jumlah Value yang gagal di-parse). Melempar ValueError jika
+    kolom wajib tidak ada.
+    """
+    for col in GEARING_REQUIRED:
+        if col not in df.columns:
+            raise ValueError(f"Kolom '{col}' tidak ditemukan")
+
+    # ===============================
+    # PARSING PERIODE (VEKTOR, HANYA STRING UNIK)
+    # ===============================
+    df = add_periode_columns(df, "Periode")
+
+    # ===============================
+    # FLAG AUDITED (PRIORITAS)
+    # ===============================
+    df["Is_Audited"] = df["Periode_Raw"].str.contains(
+        "audit", case=False, na=False
+    ).astype(int)
+
+    # ===============================
+    # CLEAN VALUE (AMAN FORMAT INDONESIA)
+    # ===============================
+    df["Value"], n_gagal = parse_value_series(df["Value"])
+
+    # ===============================
+    # KATEGORI (Periode_Label urut kronologis)
+    # ===============================
+    order_periode_label(df)
+    to_categorical(df, GEARING_KATEGORI)
+    return df, n_gagal
+
+
+def order_periode_label(df):
+    """Jadikan Periode_Label categorical berurutan kronologis (SortKey), in-place."""
+    labels = df.drop_duplicates("SortKey").sort_values("SortKey")["Periode_Label"]
+    df["Periode_Label"] = pd.Categorical(
+        df["Periode_Label"].astype(str), categories=labels.astype(str), ordered=True
+    )
+    return df
+
+
+def clean_penjaminan_sheet(df_raw):
+    """
+    Bersihkan satu sheet Outstanding Penjaminan.
+
+    Kolom dipetakan berdasarkan posisi: kolom 1 = Periode, kolom 2 =
+    KUR/PEN, kolom 3 = Dimensi (nama aslinya dipakai sebagai label UI).
+    Mengembalikan tuple (df, info) dengan info["status"] salah satu dari
+    "ok", "kosong", "struktur" (kolom < 5) atau "value" (tanpa kolom Value).
+    """
+    info = {"status": "ok", "dimensi_label": None, "n_gagal": 0}
+
+    if df_raw.empty:
+        info["status"] = "kosong"
+        return df_raw, info
+
+    # ===============================
+    # VALIDASI STRUKTUR MINIMAL
+    # ===============================
+    cols = list(df_raw.columns)
+
+    if len(cols) < 5:
+        info["status"] = "struktur"
+        return df_raw, info
+
+    # ===============================
+    # MAPPING BERDASARKAN POSISI KOLOM
+    # ===============================
+    COL_PERIODE = cols[0]
+    COL_KURPEN = cols[1]
+    COL_DIMENSI = cols[2]   # <<< KUNCI UTAMA
+
+    info["dimensi_label"] = str(COL_DIMENSI)  # Untuk UI
+
+    df = df_raw.rename(columns={
+        COL_PERIODE: "Periode",
+        COL_KURPEN: "KUR/PEN",
+        COL_DIMENSI: "Dimensi"
+    })
+
+    # ===============================
+    # CLEAN VALUE
+    # ===============================
+    if "Value" not in df.columns:
+        info["status"] = "value"
+        return df, info
+
+    df["Value"], info["n_gagal"] = parse_value_series(df["Value"])
+    to_categorical(df, PENJAMINAN_KATEGORI)
+    return df, info
@@ -0,0 +1,261 @@
+import argparse
+import hashlib
+import os
+import re
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pandas as pd
+
+from gearing.cache import DiskCache, content_hash
+from gearing.cube import aggregate_from_cube
+from gearing.dataset import (
+    load_gearing,
+    load_gearing_stream,
+    load_penjaminan,
+    load_penjaminan_duckdb,
+    load_penjaminan_stream,
+)
+from gearing.loader import ARROW_EKSTENSI, KOLOM_SHEET, arrow_columns, is_arrow_file
+from gearing.duck import duckdb_supports
+from gearing.engine import PENJAMINAN_GROUP, aggregate_penjaminan, compute_gearing
+from gearing.stream import CHUNK_ROWS, should_stream
+
+EKSTENSI = (".csv", ".xlsx") + ARROW_EKSTENSI
+
+
+def _nama_file(text):
+    return re.sub(r"[^0-9A-Za-z_.-]+", "_", str(text)).strip("_") or "sheet"
+
+
+def _tulis(df, path, fmt):
+    if fmt == "parquet":
+        df.to_parquet(f"{path}.parquet", index=False)
+    else:
+        df.to_csv(f"{path}.csv", index=False)
+
+
+def _deteksi_mode(path):
+    """
+    Workbook multi-sheet (atau Parquet / Arrow berkolom Sheet) dianggap
+    Penjaminan. File satu tabel dikenali dari header: kolom Metrics tanpa
+    Jenis = Penjaminan (mis. Tenor.csv), selain itu Gearing Ratio.
+    """
+    if os.path.isdir(path):
+        return "penjaminan"
+    if path.lower().endswith(".xlsx"):
+        with pd.ExcelFile(path) as xl:
+            if len(xl.sheet_names) > 1:
+                return "penjaminan"
+            header = xl.parse(xl.sheet_names[0], nrows=0).columns
+    elif is_arrow_file(path):
+        header = arrow_columns(path)
+        if KOLOM_SHEET in header:
+            return "penjaminan"
+    else:
+        header = pd.read_csv(path, nrows=0).columns
+    if "Metrics" in header and "Jenis" not in header:
+        return "penjaminan"
+    return "gearing"
+
+
+def aggregate_file(path, mode="auto", cache=None, chunksize=None, digest=None):
+    """
+    Parse + agregasi satu file tanpa menulis hasil (dipakai batch dan API).
+
+    CSV dibaca per chunk (memori terbatas) jika `chunksize` diberikan atau
+    ukurannya melewati batas streaming. Mengembalikan dict berisi mode,
+    rows, outputs ({nama: DataFrame}: "gearing_ratio" atau
+    "penjaminan_<sheet>") dan durasi (detik) load_s / aggregate_s.
+    """
+    name = os.path.basename(path)
+    if mode == "auto":
+        mode = _deteksi_mode(path)
+
+    stream = name.lower().endswith(".csv") and (
+        chunksize is not None or should_stream(name, os.path.getsize(path))
+    )
+    chunksize = chunksize or CHUNK_ROWS
+    duck = mode == "penjaminan" and duckdb_supports(name) and os.path.isfile(path)
+
+    t0 = time.perf_counter()
+    # CSV besar (per chunk), DuckDB dan Parquet / Arrow (memory map)
+    # dibaca dari path; file lain dibaca utuh sebagai bytes
+    if stream or duck or is_arrow_file(name) or os.path.isdir(path):
+        data = path
+        if cache is not None and digest is None and os.path.isfile(path):
+            with open(path, "rb") as f:
+                digest = content_hash(f)
+    else:
+        with open(path, "rb") as f:
+            data = f.read()
+        if cache is not None and digest is None:
+            digest = content_hash(data)
+
+    # DuckDB mengembalikan None untuk file yang harus lewat pandas
+    rows = 0
+    cubes = None
+    if duck:
+        hasil_duck = load_penjaminan_duckdb(data, name, digest, cache)
+        if hasil_duck is not None:
+            _, info, cubes = hasil_duck
+            rows = sum(i["n_rows"] for i in info.values())
+
+    if mode == "gearing" and stream:
+        _, df, _, stat = load_gearing_stream(data, digest, cache, chunksize)
+        rows = stat["n_rows"]
+    elif mode == "gearing":
+        df, _ = load_gearing(data, name, digest, cache)
+        rows = len(df)
+    elif cubes is None and stream:
+        _, info, cubes = load_penjaminan_stream(data, digest, cache, chunksize, name=name)
+        rows = sum(i["n_rows"] for i in info.values())
+    elif cubes is None:
+        sheets, info = load_penjaminan(data, name, digest, cache)
+        rows = sum(len(d) for d in sheets.values())
+    t1 = time.perf_counter()
+
+    if mode == "gearing":
+        outputs = {"gearing_ratio": compute_gearing(df)}
+    elif cubes is not None:
+        outputs = {
+            f"penjaminan_{_nama_file(sheet)}": aggregate_from_cube(cube, PENJAMINAN_GROUP)
+            for sheet, cube in cubes.items()
+        }
+    else:
+        outputs = {
+            f"penjaminan_{_nama_file(sheet)}": aggregate_penjaminan(d)
+            for sheet, d in sheets.items()
+            if info[sheet]["status"] == "ok"
+        }
+    t2 = time.perf_counter()
+
+    return {"mode": mode, "rows": rows, "outputs": outputs, "load_s": t1 - t0, "aggregate_s": t2 - t1}
+
+
+def process_file(path, out_dir, mode="auto", fmt="csv", cache_dir=None, chunksize=None, folder=None):
+    """
+    Proses satu file (parse + agregasi + tulis hasil).
+
+    Hasil ditulis ke `out_dir/<folder>` (default: nama file, lihat
+    nama_folder untuk batch). Mengembalikan dict ringkasan: file, mode,
+    status, rows, dan durasi (detik) per tahap load / aggregate / write.
+    """
+    hasil = {"file": path, "mode": mode, "status": "ok", "rows": 0,
+             "load_s": 0.0, "aggregate_s": 0.0, "write_s": 0.0, "error": ""}
+    target = os.path.join(out_dir, folder or _nama_file(os.path.basename(path)))
+    cache = DiskCache(cache_dir) if cache_dir else None
+
+    try:
+        if mode == "auto":
+            mode = _deteksi_mode(path)
+            hasil["mode"] = mode
+
+        agregat = aggregate_file(path, mode, cache, chunksize)
+        hasil.update(rows=agregat["rows"], load_s=agregat["load_s"], aggregate_s=agregat["aggregate_s"])
+
+        t0 = time.perf_counter()
+        os.makedirs(target, exist_ok=True)
+        for key, df_out in agregat["outputs"].items():
+            _tulis(df_out, os.path.join(target, key), fmt)
+        hasil["write_s"] = time.perf_counter() - t0
+    except Exception as e:  # satu file gagal tidak menghentikan batch
+        hasil["status"] = "error"
+        hasil["error"] = f"{type(e).__name__}: {e}"
+    return hasil
+
+
+def _is_dataset_sheet(path):
+    """Direktori Parquet terpartisi hive per Sheet (berisi sub-folder Sheet=...)."""
+    return any(n.startswith(f"{KOLOM_SHEET}=") for n in os.listdir(path))
+
+
+def cari_file(paths):
+    """Kumpulkan file .csv / .xlsx / .parquet / .arrow dari daftar file dan/atau direktori."""
+    files = []
+    for p in paths:
+        if os.path.isdir(p) and _is_dataset_sheet(p):
+            files.append(p)
+        elif os.path.isdir(p):
+            for root, dirs, names in os.walk(p):
+                # Dataset Parquet terpartisi per Sheet diproses sebagai satu file
+                for d in [d for d in dirs if _is_dataset_sheet(os.path.join(root, d))]:
+                    files.append(os.path.join(root, d))
+                    dirs.remove(d)
+                files.extend(
+                    os.path.join(root, n) for n in names
+                    if n.lower().endswith(EKSTENSI) and not n.startswith("~$")
+                )
+        elif p.lower().endswith(EKSTENSI):
+            files.append(p)
+    return sorted(files)
+
+
+def nama_folder(files):
+    """
+    Folder hasil per file = path relatif terhadap akar bersama semua input
+    (mis. 2024/data.csv -> 2024_data.csv), sehingga file bernama sama di
+    folder berbeda tidak saling menimpa. Nama yang tetap bentrok setelah
+    disanitasi diberi akhiran hash path.
+    """
+    if not files:
+        return {}
+    lengkap = {f: os.path.abspath(f) for f in files}
+    akar = os.path.commonpath(list(lengkap.values()))
+    if akar in lengkap.values():
+        akar = os.path.dirname(akar)
+    nama = {f: _nama_file(os.path.relpath(p, akar)) for f, p in lengkap.items()}
+    jumlah = Counter(nama.values())
+    return {
+        f: n if jumlah[n] == 1 else f"{n}-{hashlib.sha256(lengkap[f].encode()).hexdigest()[:8]}"
+        for f, n in nama.items()
+    }
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m gearing",
+        description="Proses batch file bulanan Gearing Ratio / Outstanding Penjaminan tanpa UI.",
+    )
+    parser.add_argument("inputs", nargs="+", help="File atau direktori berisi .csv / .xlsx / .parquet / .arrow")
+    parser.add_argument("-o", "--out", default="output", help="Direktori hasil (default: output)")
+    parser.add_argument("--mode", choices=["auto", "gearing", "penjaminan"], default="auto")
+    parser.add_argument("--format", choices=["csv", "parquet"], default="csv")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--cache-dir", default=None, help="Pakai cache disk hasil parsing")
+    parser.add_argument(
+        "--chunksize", type=int, default=None,
+        help="Baca CSV per chunk berisi N baris (otomatis untuk CSV besar)",
+    )
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    files = cari_file(args.inputs)
+    if not files:
+        print("Tidak ada file .csv / .xlsx / .parquet / .arrow yang ditemukan", file=sys.stderr)
+        return 1
+
+    os.makedirs(args.out, exist_ok=True)
+    folder = nama_folder(files)
+    rows = []
+    with ProcessPoolExecutor(max_workers=max(1, args.workers)) as pool:
+        futures = [
+            pool.submit(
+                process_file, f, args.out, args.mode, args.format, args.cache_dir, args.chunksize,
+                folder[f],
+            )
+            for f in files
+        ]
+        for fut in as_completed(futures):
+            r = fut.result()
+            rows.append(r)
+            total = r["load_s"] + r["aggregate_s"] + r["write_s"]
+            print(f"[{r['status']}] {r['file']} ({r['mode']}, {r['rows']:,} baris, {total:.2f}s) {r['error']}")
+
+    timing = pd.DataFrame(rows).sort_values("file")
+    timing.to_csv(os.path.join(args.out, "timing.csv"), index=False)
+    return 0 if (timing["status"] == "ok").all() else 2
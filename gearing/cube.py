@@ -0,0 +1,56 @@
+from gearing.clean import categorical_to_numeric
+
+CUBE_KEYS = ["Periode", "KUR/PEN", "Dimensi", "Tenor", "Metrics"]
+
+
+def build_cube(df, tenor=None):
+    """
+    Pra-agregasi satu sheet Penjaminan per (Periode, KUR/PEN, Dimensi,
+    Tenor, Metrics).
+
+    `tenor` adalah nama kolom yang dipakai sebagai Tenor (hanya sheet
+    Proyeksi); jika None, dimensi Tenor tidak dibuat. Setiap sel berisi
+    Total_Value (jumlah Value) dan n_value (jumlah Value yang tidak NaN).
+    Kunci NaN tetap disimpan agar hasil slice sama dengan filter baris.
+    """
+    data = df
+    if tenor is not None:
+        data = df.assign(Tenor=df[tenor])
+    keys = [k for k in CUBE_KEYS if k in data.columns]
+    return (
+        data.groupby(keys, observed=True, dropna=False, sort=False)["Value"]
+        .agg(Total_Value="sum", n_value="count")
+        .reset_index()
+    )
+
+
+def rollup(cube, by, keep_empty=False):
+    """
+    Jumlahkan cube (atau slice-nya) per kolom `by`.
+
+    Grup yang seluruh Value-nya NaN dibuang (setara dropna(subset=["Value"])
+    sebelum groupby), kecuali `keep_empty=True`.
+    """
+    out = (
+        cube.groupby(by, as_index=False, observed=True)
+        .agg(Total_Value=("Total_Value", "sum"), n_value=("n_value", "sum"))
+    )
+    if not keep_empty:
+        out = out[out["n_value"] > 0]
+    return out.drop(columns="n_value").reset_index(drop=True)
+
+
+def rollup_numeric(cube, by):
+    """rollup dengan kolom `by` dikonversi ke angka (mis. Tenor dalam tahun)."""
+    data = cube.assign(**{by: categorical_to_numeric(cube[by])}).dropna(subset=[by])
+    return rollup(data, by).sort_values(by, ignore_index=True)
+
+
+def aggregate_from_cube(cube, keys):
+    """Setara aggregate_penjaminan, dihitung dari cube (grup tanpa Value dibuang)."""
+    keys = [k for k in keys if k in cube.columns]
+    return (
+        cube[cube["n_value"] > 0]
+        .groupby(keys, as_index=False, observed=True, dropna=False)
+        .agg(Total_Value=("Total_Value", "sum"))
+    )
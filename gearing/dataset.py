@@ -0,0 +1,160 @@
+from gearing.clean import clean_gearing, clean_penjaminan_sheet
+from gearing.loader import (
+    PENJAMINAN_KOLOM,
+    PENJAMINAN_POSISI,
+    read_table,
+    read_workbook,
+    single_sheet_name,
+)
+from gearing.stream import CHUNK_ROWS, stream_gearing_csv, stream_penjaminan_csv
+from gearing.worker import report
+
+
+def load_gearing(file, name, digest=None, cache=None, progress=None):
+    """
+    Baca + bersihkan file Gearing Ratio.
+
+    Jika `cache` (DiskCache) dan `digest` diberikan, hasil bersih diambil
+    dari / disimpan ke cache sehingga upload ulang file yang sama tidak
+    mem-parse Excel lagi. `progress` (worker.Progress, opsional) menerima
+    tahap yang sedang berjalan. Mengembalikan tuple (df, n_gagal).
+    """
+    key = f"gearing-{digest}"
+    if cache is not None and digest:
+        report(progress, "membuka cache", 0.05)
+        hit = cache.get(key)
+        if hit is not None:
+            frames, meta = hit
+            return frames["data"], meta["n_gagal"]
+
+    report(progress, "membaca file", 0.1)
+    raw = read_table(file, name)
+    report(progress, "membersihkan data", 0.6)
+    df, n_gagal = clean_gearing(raw)
+
+    if cache is not None and digest:
+        report(progress, "menyimpan cache", 0.9)
+        cache.put(key, {"data": df}, {"n_gagal": n_gagal})
+    return df, n_gagal
+
+
+def load_penjaminan(file, name, digest=None, cache=None, progress=None):
+    """
+    Baca + bersihkan semua sheet Outstanding Penjaminan.
+
+    Mengembalikan tuple (sheets, info): dict {sheet: DataFrame} dan
+    dict {sheet: info} dari clean_penjaminan_sheet.
+    """
+    key = f"penjaminan-{digest}"
+    if cache is not None and digest:
+        report(progress, "membuka cache", 0.05)
+        hit = cache.get(key)
+        if hit is not None:
+            frames, meta = hit
+            info = meta["info"]
+            if str(name).lower().endswith(".csv") and len(frames) == 1:
+                # Isi sama bisa di-upload dengan nama lain: sheet = nama file ini
+                sheet = single_sheet_name(name)
+                frames = {sheet: next(iter(frames.values()))}
+                info = {sheet: next(iter(info.values()))}
+            return frames, info
+
+    report(progress, "membaca workbook", 0.1)
+    raw = read_workbook(file, name, posisi=PENJAMINAN_POSISI, kolom=PENJAMINAN_KOLOM)
+    sheets, info = {}, {}
+    for i, (sheet, df_raw) in enumerate(raw.items()):
+        report(progress, f"membersihkan sheet {sheet}", 0.5 + 0.4 * i / len(raw))
+        sheets[sheet], info[sheet] = clean_penjaminan_sheet(df_raw)
+
+    if cache is not None and digest:
+        report(progress, "menyimpan cache", 0.9)
+        cache.put(key, sheets, {"info": info})
+    return sheets, info
+
+
+def load_gearing_stream(file, digest=None, cache=None, chunksize=CHUNK_ROWS, progress=None):
+    """
+    Versi streaming load_gearing untuk CSV besar (memori terbatas).
+
+    Mengembalikan tuple (sample, reduced, hashes, info) dari
+    stream_gearing_csv; hasil disimpan ke `cache` seperti load_gearing.
+    """
+    key = f"gearing-stream-{digest}"
+    if cache is not None and digest:
+        hit = cache.get(key)
+        if hit is not None:
+            frames, meta = hit
+            return frames["sample"], frames["reduced"], frames["hashes"], meta["info"]
+
+    sample, reduced, hashes, info = stream_gearing_csv(file, chunksize, progress=progress)
+
+    if cache is not None and digest:
+        cache.put(key, {"sample": sample, "reduced": reduced, "hashes": hashes}, {"info": info})
+    return sample, reduced, hashes, info
+
+
+def load_penjaminan_stream(file, digest=None, cache=None, chunksize=CHUNK_ROWS, progress=None, name=None):
+    """
+    Versi streaming load_penjaminan untuk CSV besar.
+
+    Mengembalikan tuple (sheets, info, cubes): sheets berisi sampel baris
+    untuk preview dan cubes berisi cube agregat lengkap (build_cube),
+    keduanya dengan kunci sheet dari nama file `name` (single_sheet_name;
+    "CSV" jika tanpa nama). Sheet Proyeksi memakai kolom ke-4 sebagai Tenor.
+    """
+    sheet = single_sheet_name(name) if name else "CSV"
+    tenor = sheet.lower() == "proyeksi"
+    key = f"penjaminan-stream-{digest}" + ("-tenor" if tenor else "")
+    if cache is not None and digest:
+        hit = cache.get(key)
+        if hit is not None:
+            frames, meta = hit
+            cubes = {sheet: frames["cube"]} if "cube" in frames else {}
+            return {sheet: frames["sample"]}, {sheet: meta["info"]}, cubes
+
+    sample, cube, info = stream_penjaminan_csv(file, chunksize, tenor=tenor, progress=progress)
+    frames = {"sample": sample}
+    if cube is not None:
+        frames["cube"] = cube
+
+    if cache is not None and digest:
+        cache.put(key, frames, {"info": info, "sheet": sheet})
+    cubes = {sheet: cube} if cube is not None else {}
+    return {sheet: sample}, {sheet: info}, cubes
+
+
+def load_penjaminan_duckdb(file, name, digest=None, cache=None, progress=None):
+    """
+    Cube Penjaminan lewat backend DuckDB (lihat penjaminan_duckdb).
+
+    Format kembalian sama dengan load_penjaminan_stream: (sheets, info,
+    cubes). Mengembalikan None jika file harus diproses jalur pandas.
+    """
+    # Cube sheet Proyeksi memakai Tenor: nama file ikut menentukan hasil
+    tenor = single_sheet_name(name).lower() == "proyeksi"
+    key = f"penjaminan-duckdb-{digest}" + ("-tenor" if tenor else "")
+    if cache is not None and digest:
+        hit = cache.get(key)
+        if hit is not None:
+            frames, meta = hit
+            sheet = single_sheet_name(name)
+            cubes = {sheet: frames["cube"]} if "cube" in frames else {}
+            return {sheet: frames["sample"]}, {sheet: meta["info"]}, cubes
+
+    # Impor di sini: modul DuckDB hanya dimuat saat backend ini dipakai
+    from gearing.duck import penjaminan_duckdb
+
+    report(progress, "agregasi DuckDB", 0.2)
+    hasil = penjaminan_duckdb(file, name)
+    if hasil is None:
+        return None
+    sample, cube, info = hasil
+    sheet = single_sheet_name(name)
+    frames = {"sample": sample}
+    if cube is not None:
+        frames["cube"] = cube
+
+    if cache is not None and digest:
+        cache.put(key, frames, {"info": info, "sheet": sheet})
+    cubes = {sheet: cube} if cube is not None else {}
+    return {sheet: sample}, {sheet: info}, cubes
@@ -0,0 +1,54 @@
+import numpy as np
+
+# Di atas jumlah titik ini grafik memakai WebGL + downsampling
+MAX_POINTS = 1000
+
+
+def lttb_indices(y, n_out, keep=None):
+    """
+    Pilih index titik dengan Largest-Triangle-Three-Buckets (LTTB).
+
+    `y` diasumsikan berjarak sama di sumbu x (periode berurutan). Titik
+    pertama, terakhir, dan semua index di `keep` (mis. periode audited)
+    selalu dipertahankan. Mengembalikan array index terurut.
+    """
+    y = np.nan_to_num(np.asarray(y, dtype="float64"))
+    n = len(y)
+    keep = np.asarray([] if keep is None else keep, dtype=int)
+
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = np.arange(n, dtype="float64")
+    # Bucket untuk titik tengah (selain titik pertama & terakhir)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+
+    picked = np.empty(n_out, dtype=int)
+    picked[0] = 0
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        # Rata-rata bucket berikutnya sebagai titik ketiga segitiga
+        nlo, nhi = hi, edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[nlo:nhi].mean()
+        avg_y = y[nlo:nhi].mean()
+
+        area = np.abs(
+            (x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a])
+        )
+        a = lo + int(area.argmax())
+        picked[i + 1] = a
+    picked[-1] = n - 1
+
+    return np.union1d(picked, keep[(keep >= 0) & (keep < n)])
+
+
+def downsample(df, y, n_out=MAX_POINTS, keep_mask=None):
+    """
+    Kurangi baris df (urut periode) ke sekitar n_out titik dengan LTTB
+    pada kolom `y`. Baris dengan keep_mask True selalu dipertahankan.
+    """
+    if len(df) <= n_out:
+        return df
+    keep = None if keep_mask is None else np.flatnonzero(np.asarray(keep_mask, dtype=bool))
+    return df.iloc[lttb_indices(df[y].to_numpy(), n_out, keep)]
@@ -0,0 +1,165 @@
+import importlib.util
+import os
+import tempfile
+
+from gearing.clean import PENJAMINAN_KATEGORI, clean_penjaminan_sheet, to_categorical
+from gearing.loader import (
+    CSV_NA_VALUES,
+    IPC_EKSTENSI,
+    KOLOM_SHEET,
+    PARQUET_EKSTENSI,
+    PENJAMINAN_KOLOM,
+    PENJAMINAN_POSISI,
+    _pilih_kolom,
+    read_arrow,
+    single_sheet_name,
+)
+from gearing.stream import SAMPLE_ROWS
+
+# duckdb baru diimpor di _connect; cukup cek apakah terpasang
+DUCKDB_TERPASANG = importlib.util.find_spec("duckdb") is not None
+
+# ===============================
+# BACKEND AGREGASI PENJAMINAN
+# ===============================
+# auto = DuckDB jika terpasang, pandas = selalu pandas
+BACKEND = os.environ.get("GEARING_BACKEND", "auto")
+
+# Batas memori DuckDB; sisanya di-spill ke disk (out-of-core)
+DUCKDB_MEMORY = os.environ.get("GEARING_DUCKDB_MEMORY", "1GB")
+
+DUCKDB_EKSTENSI = (".csv",) + PARQUET_EKSTENSI + IPC_EKSTENSI
+
+_ANGKA = ("TINYINT", "SMALLINT", "INTEGER", "BIGINT", "HUGEINT", "FLOAT", "DOUBLE", "DECIMAL")
+
+
+def duckdb_supports(name):
+    """True jika DuckDB terpasang, tidak dimatikan, dan format file didukung."""
+    return DUCKDB_TERPASANG and BACKEND != "pandas" and str(name).lower().endswith(DUCKDB_EKSTENSI)
+
+
+def _q(col):
+    return '"' + str(col).replace('"', '""') + '"'
+
+
+def _connect():
+    import duckdb
+
+    con = duckdb.connect()
+    con.execute(f"SET memory_limit = '{DUCKDB_MEMORY}'")
+    con.execute(f"SET temp_directory = '{tempfile.gettempdir()}'")
+    return con
+
+
+def _relasi(con, file, name):
+    """
+    Relasi DuckDB atas file upload / path.
+
+    CSV dan Parquet dibaca langsung dari disk oleh DuckDB (upload ditulis
+    dulu ke file sementara), Arrow IPC lewat pyarrow.Table tanpa salin.
+    Mengembalikan tuple (relasi, path sementara atau None).
+    """
+    lower = str(name).lower()
+    if lower.endswith(IPC_EKSTENSI):
+        return con.from_arrow(read_arrow(file, name)), None
+
+    tmp = None
+    if isinstance(file, (str, os.PathLike)):
+        path = os.fspath(file)
+    else:
+        data = file.getbuffer() if hasattr(file, "getbuffer") else file
+        fd, tmp = tempfile.mkstemp(suffix=os.path.splitext(lower)[1])
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        path = tmp
+
+    if lower.endswith(PARQUET_EKSTENSI):
+        return con.read_parquet(path), tmp
+    # Token NA sama dengan pd.read_csv: "n/a" dst. kosong, bukan gagal parse
+    return con.read_csv(path, header=True, na_values=CSV_NA_VALUES), tmp
+
+
+def _ekspresi_value(kolom, tipe):
+    """Value -> DOUBLE; teks diparse seperti parse_value_series (format Indonesia)."""
+    if str(tipe).upper().startswith(_ANGKA):
+        return f"CAST({kolom} AS DOUBLE)"
+    teks = f"TRIM(CAST({kolom} AS VARCHAR))"
+    return f"TRY_CAST(REPLACE(REPLACE({teks}, '.', ''), ',', '.') AS DOUBLE)"
+
+
+def _ekspresi_kunci(kolom, tipe):
+    # Tanggal dikembalikan sebagai teks seperti pd.read_csv (tanpa parse_dates)
+    if str(tipe).upper().startswith(("DATE", "TIMESTAMP", "TIME")):
+        return f"CAST({kolom} AS VARCHAR)"
+    return kolom
+
+
+def penjaminan_duckdb(file, name, sheet=None, sample_rows=SAMPLE_ROWS):
+    """
+    Cube agregat satu sheet Penjaminan dihitung oleh DuckDB (out-of-core).
+
+    Hasil setara build_cube(clean_penjaminan_sheet(...)): kolom Periode,
+    KUR/PEN, Dimensi, (Tenor untuk sheet Proyeksi), Metrics, Total_Value
+    dan n_value. Hanya sampel baris yang dibawa ke pandas untuk preview.
+    Mengembalikan tuple (sample, cube, info), atau None jika file berisi
+    kolom Sheet (multi-sheet; ditangani jalur pandas).
+    """
+    sheet = sheet or single_sheet_name(name)
+    con = _connect()
+    rel, tmp = _relasi(con, file, name)
+    try:
+        cols = rel.columns
+        tipe = dict(zip(cols, [str(t) for t in rel.types]))
+        if KOLOM_SHEET in cols:
+            return None
+
+        # Kolom yang dipakai sama dengan jalur pandas (read_workbook)
+        cols = [cols[i] for i in _pilih_kolom(cols, PENJAMINAN_POSISI, set(PENJAMINAN_KOLOM))]
+        con.register("src", rel)
+        sample_raw = con.execute(
+            f"SELECT {', '.join(_q(c) for c in cols)} FROM src "
+            f"USING SAMPLE reservoir({int(sample_rows)} ROWS) REPEATABLE (0)"
+        ).df()
+        sample, info = clean_penjaminan_sheet(sample_raw)
+        info["n_rows"] = con.execute("SELECT COUNT(*) FROM src").fetchone()[0]
+
+        if info["n_rows"] == 0:
+            info["status"] = "kosong"
+        if info["status"] != "ok":
+            return sample, None, info
+
+        kunci = {"Periode": cols[0], "KUR/PEN": cols[1], "Dimensi": cols[2]}
+        # Sama dengan build_cube: Tenor = kolom ke-4 (Proyeksi) atau kolom bernama Tenor
+        if sheet.lower() == "proyeksi" or cols[3] == "Tenor":
+            kunci["Tenor"] = cols[3]
+        if "Metrics" in cols:
+            kunci["Metrics"] = "Metrics"
+
+        pilih = ", ".join(
+            f"{_ekspresi_kunci(_q(c), tipe[c])} AS {_q(k)}" for k, c in kunci.items()
+        )
+        group = ", ".join(_q(k) for k in kunci)
+        value = _ekspresi_value(_q("Value"), tipe["Value"])
+
+        cube = con.execute(f"""
+            WITH v AS (
+                SELECT {pilih}, {value} AS v, CAST({_q("Value")} AS VARCHAR) AS raw
+                FROM src
+            )
+            SELECT {group},
+                   COALESCE(SUM(v), 0) AS Total_Value,
+                   COUNT(v) AS n_value,
+                   SUM(CASE WHEN v IS NULL AND TRIM(raw) <> '' THEN 1 ELSE 0 END) AS n_gagal
+            FROM v
+            GROUP BY ALL
+            ORDER BY {group}
+        """).df()
+    finally:
+        con.close()
+        if tmp is not None:
+            os.remove(tmp)
+
+    info["n_gagal"] = int(cube.pop("n_gagal").sum())
+    cube["n_value"] = cube["n_value"].astype("int64")
+    to_categorical(cube, PENJAMINAN_KATEGORI)
+    return sample, cube, info
@@ -0,0 +1,156 @@
+import numpy as np
+import pandas as pd
+
+# ===============================
+# JENIS YANG DIPAKAI PERHITUNGAN
+# ===============================
+KUR_JENIS = ["KUR Gen 1", "KUR Gen 2"]
+PEN_JENIS = ["PEN Gen 1", "PEN Gen 2"]
+EKUITAS_JENIS = "Ekuitas KUR"
+SEMUA_JENIS = KUR_JENIS + PEN_JENIS + [EKUITAS_JENIS]
+
+TRILIUN = 1_000_000_000_000
+
+GEARING_COLUMNS = [
+    "SortKey", "Periode_Label",
+    "OS_KUR_Rp", "OS_KUR_T",
+    "Ekuitas_KUR_Rp", "Ekuitas_KUR_T",
+    "OS_KUR_PEN_Rp", "OS_KUR_PEN_T",
+    "Gearing_Ratio", "GR_KUR_PEN", "Is_Audited",
+]
+
+
+# ===============================
+# DEDUP PRIORITAS AUDITED
+# ===============================
+DEDUP_KEYS = ["SortKey", "Jenis"]
+
+
+def _kode_grup(df, keys, pos):
+    """Kode grup (int) per baris `pos` untuk kombinasi `keys`, lewat factorize (hash, O(n))."""
+    kode = np.zeros(len(pos), dtype="int64")
+    for key in keys:
+        col = df[key]
+        if isinstance(col.dtype, pd.CategoricalDtype):
+            k, n_uniq = col.cat.codes.to_numpy()[pos], len(col.cat.categories)
+        else:
+            k, uniq = pd.factorize(col.to_numpy()[pos])
+            n_uniq = len(uniq)
+        kode = kode * (n_uniq + 1) + k + 1
+    return kode
+
+
+def dedup_audited(df, keys=DEDUP_KEYS):
+    """
+    Pilih tepat satu baris per (periode, Jenis) tanpa sort (O(n)).
+
+    Aturan prioritas:
+    1. Baris dengan Value kosong (NaN) diabaikan.
+    2. Baris audited (Is_Audited = 1) mengalahkan baris unaudited.
+    3. Di antara baris dengan status audit sama, baris terakhir di file
+       yang dipakai.
+
+    Urutan baris input dipertahankan. Ringkasan stream_gearing_csv (satu
+    baris per (SortKey, Jenis, Is_Audited)) menghasilkan pilihan yang sama
+    dengan data penuh.
+    """
+    n = len(df)
+    pos = np.flatnonzero(df["Value"].notna().to_numpy())
+    grup = _kode_grup(df, keys, pos)
+
+    # Skor = status audit (prioritas utama) lalu posisi baris; ambil maksimum per grup
+    audit = df["Is_Audited"].to_numpy()[pos].astype("int64")
+    skor = pd.Series(audit * n + pos).groupby(grup, sort=False).max().to_numpy()
+    return df.iloc[np.sort(skor % max(n, 1))]
+
+
+def pivot_periode_jenis(df):
+    """
+    Pivot data bersih menjadi tabel SortKey x Jenis (satu nilai per sel).
+
+    Jika satu (periode, Jenis) punya beberapa baris, baris dipilih dengan
+    dedup_audited (audited diutamakan, lalu baris terakhir).
+    """
+    d = df[df["Jenis"].isin(SEMUA_JENIS)]
+    pivot = dedup_audited(d).set_index(DEDUP_KEYS)["Value"].unstack("Jenis")
+    pivot.columns = pivot.columns.astype(object)
+    # Periode yang semua Value-nya kosong tetap muncul (NaN)
+    periode = pd.Index(d["SortKey"].unique(), name="SortKey").sort_values()
+    return pivot.reindex(index=periode, columns=SEMUA_JENIS)
+
+
+def period_labels(df):
+    """Periode_Label per SortKey (Series ber-index SortKey)."""
+    return df.drop_duplicates("SortKey").set_index("SortKey")["Periode_Label"]
+
+
+def period_audited(df):
+    """1 jika periode punya baris audited, 0 jika tidak (Series ber-index SortKey)."""
+    return df.groupby("SortKey")["Is_Audited"].max()
+
+
+def gearing_from_pivot(pivot, labels, audited=None):
+    """
+    Hitung seri Gearing Ratio dari pivot SortKey x Jenis.
+
+    Setiap baris (periode) dihitung terpisah, sehingga hasil untuk
+    sebagian periode bisa digabung dengan hasil periode lain.
+    """
+    pivot = pivot.reindex(columns=SEMUA_JENIS)
+
+    out = pd.DataFrame(index=pivot.index)
+    out["OS_KUR_Rp"] = pivot[KUR_JENIS].sum(axis=1, min_count=1)
+    out["Ekuitas_KUR_Rp"] = pivot[EKUITAS_JENIS]
+    out["OS_KUR_PEN_Rp"] = pivot[KUR_JENIS + PEN_JENIS].sum(axis=1, min_count=1)
+
+    out["OS_KUR_T"] = out["OS_KUR_Rp"] / TRILIUN
+    out["Ekuitas_KUR_T"] = out["Ekuitas_KUR_Rp"] / TRILIUN
+    out["OS_KUR_PEN_T"] = out["OS_KUR_PEN_Rp"] / TRILIUN
+
+    out["Gearing_Ratio"] = out["OS_KUR_Rp"] / out["Ekuitas_KUR_Rp"]
+    out["GR_KUR_PEN"] = out["OS_KUR_PEN_Rp"] / out["Ekuitas_KUR_Rp"]
+
+    out["Periode_Label"] = labels.reindex(out.index).values
+    if audited is None:
+        out["Is_Audited"] = 0
+    else:
+        out["Is_Audited"] = audited.reindex(out.index).fillna(0).astype(int)
+    out.index.name = "SortKey"
+    out = out.reset_index().sort_values("SortKey", ignore_index=True)
+    return out[GEARING_COLUMNS]
+
+
+def compute_gearing(df):
+    """
+    Hitung kelima seri Gearing Ratio dalam satu kali pivot.
+
+    Input: DataFrame hasil clean_gearing (kolom SortKey, Periode_Label,
+    Jenis, Value, Is_Audited). Output: satu DataFrame per periode (urut
+    SortKey) berisi OS KUR, Ekuitas KUR, OS KUR+PEN, Gearing_Ratio
+    (OS KUR / Ekuitas) dan GR_KUR_PEN (OS KUR+PEN / Ekuitas).
+    """
+    if "Jenis" not in df.columns:
+        raise ValueError("Kolom 'Jenis' tidak ditemukan")
+
+    return gearing_from_pivot(
+        pivot_periode_jenis(df), period_labels(df), period_audited(df)
+    )
+
+
+# ===============================
+# AGREGASI OUTSTANDING PENJAMINAN
+# ===============================
+PENJAMINAN_GROUP = ["Periode", "KUR/PEN", "Dimensi", "Metrics"]
+
+
+def aggregate_penjaminan(df):
+    """
+    Total Value per (Periode, KUR/PEN, Dimensi, Metrics) untuk satu sheet
+    hasil clean_penjaminan_sheet.
+    """
+    keys = [c for c in PENJAMINAN_GROUP if c in df.columns]
+    return (
+        df.dropna(subset=["Value"])
+        .groupby(keys, as_index=False, observed=True, dropna=False)
+        .agg(Total_Value=("Value", "sum"))
+    )
@@ -0,0 +1,105 @@
+import hashlib
+import json
+
+import numpy as np
+import pandas as pd
+
+# ===============================
+# FACTORY GRAFIK PENJAMINAN (SPEC PLOTLY TANPA PLOTLY EXPRESS)
+# ===============================
+# Spec berupa dict biasa {"data": [...], "layout": {...}} yang langsung
+# dibangun dari array agregat; tidak perlu validasi Plotly Express.
+
+
+def _list(values):
+    """Array / Series -> list JSON (NaN -> null, numpy scalar -> Python)."""
+    arr = pd.Series(values).astype(object)
+    return arr.where(pd.notna(arr), None).tolist()
+
+
+def bar_figure(x, y, title=None, text_format=",.2f", text_suffix="",
+               xaxis_title=None, yaxis_title=None, height=None, xaxis=None):
+    """
+    Grafik batang satu seri dengan label nilai di atas batang
+    (setara px.bar(..., text=y) + update_traces(texttemplate=...)).
+    """
+    y = _list(y)
+    trace = {
+        "type": "bar",
+        "x": _list(x),
+        "y": y,
+        "text": y,
+        "texttemplate": f"%{{text:{text_format}}}{text_suffix}",
+        "textposition": "outside",
+    }
+    layout = {
+        "barmode": "relative",
+        "xaxis": dict(xaxis or {}, title={"text": xaxis_title}),
+        "yaxis": {"title": {"text": yaxis_title}},
+    }
+    if title:
+        layout["title"] = {"text": title}
+    if height:
+        layout["height"] = height
+    return {"data": [trace], "layout": layout}
+
+
+def bar_from_agg(agg, x, y="Total_Value", **opsi):
+    """bar_figure dari kolom DataFrame agregat (mis. hasil rollup)."""
+    return bar_figure(agg[x], agg[y], **opsi)
+
+
+def dual_axis_figure(x, y, y2, name, name2, title=None, yaxis_title=None, yaxis2_title=None):
+    """Dua seri batang berdampingan, seri kedua di sumbu Y kanan."""
+    x = _list(x)
+    return {
+        "data": [
+            {"type": "bar", "x": x, "y": _list(y), "name": name, "yaxis": "y"},
+            {"type": "bar", "x": x, "y": _list(y2), "name": name2, "yaxis": "y2"},
+        ],
+        "layout": {
+            "title": {"text": title},
+            "barmode": "group",
+            "yaxis": {"title": {"text": yaxis_title}},
+            "yaxis2": {"title": {"text": yaxis2_title}, "overlaying": "y", "side": "right"},
+        },
+    }
+
+
+def metrics_dual_figure(agg, title=None):
+    """
+    Grafik Metrics vs Jumlah Debitur dari rollup(..., "Metrics"): metrics
+    finansial (Triliun) di sumbu kiri, metrics berisi "debitur" di kanan.
+    """
+    debitur = agg["Metrics"].astype(str).str.lower().str.contains("debitur").to_numpy()
+    total = agg["Total_Value"].to_numpy(dtype="float64")
+    return dual_axis_figure(
+        agg["Metrics"],
+        np.where(debitur, np.nan, total / 1_000_000_000_000),
+        np.where(debitur, total, np.nan),
+        "Nilai Finansial (Triliun)",
+        "Jumlah Debitur",
+        title=title,
+        yaxis_title="Triliun Rupiah",
+        yaxis2_title="Jumlah Debitur",
+    )
+
+
+# ===============================
+# CACHE JSON FIGURE (KUNCI = HASH DATA AGREGAT)
+# ===============================
+def data_hash(df, **opsi):
+    """Hash isi DataFrame agregat (nilai + nama kolom) plus opsi grafik."""
+    h = hashlib.sha256()
+    h.update(json.dumps([list(map(str, df.columns)), opsi], sort_keys=True, default=str).encode())
+    h.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+def figure_json(cache, kind, df, build, **opsi):
+    """
+    JSON figure `build(df, **opsi)`, diambil dari `cache` (LRUCache) jika
+    data agregat dan opsi sama; figure hanya dibangun ulang jika berubah.
+    """
+    key = ("figure", kind, data_hash(df, **opsi))
+    return cache.get_or_compute(key, lambda: json.dumps(build(df, **opsi)))
@@ -0,0 +1,223 @@
+import io
+import os
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.dataset as pads
+    import pyarrow.ipc as paipc
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+# ===============================
+# KOLOM YANG DIPAKAI DASHBOARD PENJAMINAN
+# ===============================
+# 4 kolom pertama dibaca berdasarkan posisi (Periode, KUR/PEN, Dimensi, Tenor),
+# sisanya berdasarkan nama.
+PENJAMINAN_POSISI = 4
+PENJAMINAN_KOLOM = ["Metrics", "Value"]
+
+# ===============================
+# FORMAT KOLOMNAR (PARQUET / ARROW IPC)
+# ===============================
+PARQUET_EKSTENSI = (".parquet", ".pq")
+IPC_EKSTENSI = (".arrow", ".feather", ".ipc")
+ARROW_EKSTENSI = PARQUET_EKSTENSI + IPC_EKSTENSI
+
+# Kolom partisi: satu file Parquet / Arrow berisi banyak sheet Penjaminan
+KOLOM_SHEET = "Sheet"
+
+# ===============================
+# SEL KOSONG CSV
+# ===============================
+# Sama dengan token NA bawaan pd.read_csv; dipakai juga oleh DuckDB agar
+# sel "n/a", "NA", "NULL" dst. kosong di kedua jalur (bukan gagal parse)
+CSV_NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND",
+    "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+]
+
+
+def excel_engine():
+    """Engine baca Excel tercepat yang terpasang (calamine jika ada)."""
+    try:
+        import python_calamine  # noqa: F401
+    except ImportError:
+        return None
+    major, minor = (int(x) for x in pd.__version__.split(".")[:2])
+    if (major, minor) < (2, 2):
+        return None
+    return "calamine"
+
+
+def _as_buffer(file):
+    """Bungkus bytes / UploadedFile menjadi buffer yang bisa di-seek ulang."""
+    if isinstance(file, (bytes, bytearray, memoryview)):
+        return io.BytesIO(file)
+    if hasattr(file, "seek"):
+        file.seek(0)
+    return file
+
+
+def _pilih_kolom(header, posisi, nama):
+    """Index kolom yang dibaca: `posisi` kolom pertama + kolom bernama `nama`."""
+    header = list(header)
+    idx = set(range(min(posisi, len(header))))
+    idx.update(i for i, c in enumerate(header) if c in nama)
+    return sorted(idx)
+
+
+def single_sheet_name(name):
+    """
+    Nama sheet untuk file satu tabel = nama file tanpa ekstensi (mis.
+    Proyeksi.csv -> Proyeksi), sehingga penanganan khusus per sheet tetap
+    berlaku untuk upload satu file per sheet.
+    """
+    return os.path.splitext(os.path.basename(os.fspath(name)))[0] or "Sheet1"
+
+
+def is_arrow_file(name):
+    """True untuk file Parquet / Arrow IPC (Feather v2)."""
+    return str(name).lower().endswith(ARROW_EKSTENSI)
+
+
+def _arrow_source(file):
+    """
+    Sumber baca Arrow tanpa salin: path dipetakan ke memori (memory_map),
+    bytes / UploadedFile dibungkus langsung sebagai buffer Arrow.
+    """
+    if isinstance(file, (str, os.PathLike)):
+        return pa.memory_map(os.fspath(file), "r")
+    if hasattr(file, "getbuffer"):
+        return pa.BufferReader(pa.py_buffer(file.getbuffer()))
+    if isinstance(file, (bytes, bytearray, memoryview)):
+        return pa.BufferReader(pa.py_buffer(file))
+    return pa.BufferReader(pa.py_buffer(_as_buffer(file).read()))
+
+
+def read_arrow(file, name, columns=None):
+    """
+    Baca file Parquet / Arrow IPC menjadi pyarrow.Table.
+
+    Direktori dibaca sebagai dataset Parquet terpartisi (hive, mis.
+    ``Sheet=Bank/part-0.parquet``). `columns` membatasi kolom yang dibaca.
+    """
+    if pa is None:
+        raise ImportError("pyarrow diperlukan untuk membaca file Parquet / Arrow")
+
+    if isinstance(file, (str, os.PathLike)) and os.path.isdir(file):
+        return pads.dataset(file, format="parquet", partitioning="hive").to_table(columns=columns)
+
+    source = _arrow_source(file)
+    if str(name).lower().endswith(PARQUET_EKSTENSI):
+        return pq.read_table(source, columns=columns, memory_map=True)
+
+    table = paipc.open_file(source).read_all()
+    return table.select(columns) if columns is not None else table
+
+
+def _to_pandas(table):
+    # split_blocks + self_destruct: kolom numerik tanpa salinan tambahan
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
+def read_table(file, name):
+    """Baca satu tabel (CSV, Parquet / Arrow IPC, atau sheet pertama Excel)."""
+    if is_arrow_file(name):
+        return _to_pandas(read_arrow(file, name))
+    buf = _as_buffer(file)
+    if name.endswith(".csv"):
+        return pd.read_csv(buf, na_values=CSV_NA_VALUES, keep_default_na=False)
+    return pd.read_excel(buf, engine=excel_engine())
+
+
+def read_workbook(file, name, posisi=None, kolom=None):
+    """
+    Baca seluruh sheet workbook dalam satu kali buka file.
+
+    Mengembalikan dict {nama_sheet: DataFrame}; file CSV menjadi satu
+    sheet bernama nama file (single_sheet_name). File Parquet / Arrow dengan kolom "Sheet" (atau dataset
+    terpartisi per Sheet) dipecah menjadi satu sheet per nilai Sheet;
+    tanpa kolom itu seluruh file menjadi satu sheet bernama nama file.
+    Jika `posisi` / `kolom` diberikan, hanya `posisi` kolom pertama dan
+    kolom bernama `kolom` yang dibaca dari setiap sheet.
+    """
+    pangkas = posisi is not None or kolom is not None
+    posisi = posisi or 0
+    kolom = set(kolom or [])
+
+    if is_arrow_file(name) or (isinstance(file, (str, os.PathLike)) and os.path.isdir(file)):
+        return _read_arrow_sheets(file, name, posisi if pangkas else None, kolom)
+
+    buf = _as_buffer(file)
+
+    if name.endswith(".csv"):
+        usecols = None
+        if pangkas:
+            header = pd.read_csv(buf, nrows=0).columns
+            usecols = _pilih_kolom(header, posisi, kolom)
+            buf = _as_buffer(buf)
+        return {
+            single_sheet_name(name): pd.read_csv(
+                buf, usecols=usecols, na_values=CSV_NA_VALUES, keep_default_na=False
+            )
+        }
+
+    sheets = {}
+    with pd.ExcelFile(buf, engine=excel_engine()) as xl:
+        for sheet in xl.sheet_names:
+            usecols = None
+            if pangkas:
+                header = xl.parse(sheet, nrows=0).columns
+                usecols = _pilih_kolom(header, posisi, kolom)
+                if not usecols:
+                    sheets[sheet] = pd.DataFrame()
+                    continue
+            sheets[sheet] = xl.parse(sheet, usecols=usecols)
+    return sheets
+
+
+def _read_arrow_sheets(file, name, posisi, kolom):
+    table = read_arrow(file, name)
+
+    def pilih(part):
+        names = [c for c in part.column_names if c != KOLOM_SHEET]
+        if posisi is not None:
+            names = [names[i] for i in _pilih_kolom(names, posisi, kolom)]
+        return _to_pandas(part.select(names))
+
+    if KOLOM_SHEET not in table.column_names:
+        return {single_sheet_name(name): pilih(table)}
+
+    # Kolom partisi bisa berupa dictionary (dataset hive) -> samakan ke string
+    sheet_col = table[KOLOM_SHEET].cast(pa.string())
+    sheets = {}
+    for sheet in pc.unique(sheet_col).to_pylist():
+        if sheet is None:
+            continue
+        part = table.filter(pc.equal(sheet_col, sheet))
+        # Skema gabungan antar sheet: buang kolom yang kosong di sheet ini
+        part = part.select([c for c in part.column_names if part[c].null_count < part.num_rows])
+        sheets[sheet] = pilih(part)
+    return sheets
+
+
+def parquet_nbytes(file):
+    """
+    Ukuran data Parquet tanpa kompresi (byte) dari metadata row group,
+    tanpa membaca data. None untuk direktori / tanpa pyarrow.
+    """
+    if pa is None or (isinstance(file, (str, os.PathLike)) and os.path.isdir(file)):
+        return None
+    meta = pq.read_metadata(_arrow_source(file))
+    return sum(meta.row_group(i).total_byte_size for i in range(meta.num_row_groups))
+
+
+def arrow_columns(file):
+    """Nama kolom file Parquet / Arrow dari skema saja (tanpa membaca data)."""
+    if str(file).lower().endswith(PARQUET_EKSTENSI):
+        return pq.read_schema(file).names
+    return paipc.open_file(_arrow_source(file)).schema.names
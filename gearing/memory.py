@@ -0,0 +1,130 @@
+import os
+import threading
+import tracemalloc
+
+from gearing.shared import estimate_nbytes
+
+# ===============================
+# ANGGARAN MEMORI PER SESI
+# ===============================
+SESSION_BUDGET_MB = int(os.environ.get("GEARING_SESSION_MEM_MB", "2048"))
+
+# Ukur puncak memori sebenarnya per tahap dengan tracemalloc (mahal:
+# pandas bisa 5x lebih lambat); tanpa ini dipakai perkiraan ukuran data.
+TRACE_MEMORY = os.environ.get("GEARING_TRACE_MEMORY", "0") == "1"
+
+# Perkiraan rasio memori DataFrame hasil parsing terhadap ukuran file
+RASIO_EKSPANSI = {
+    ".csv": 3,
+    ".xlsx": 10,
+    ".parquet": 6,
+    ".pq": 6,
+    ".arrow": 2,
+    ".feather": 2,
+    ".ipc": 2,
+}
+
+
+# Rasio memori DataFrame terhadap ukuran data Parquet tanpa kompresi
+RASIO_PARQUET_PANDAS = 2
+
+
+class MemoryBudgetExceeded(MemoryError):
+    """Tahap akan melewati anggaran memori sesi."""
+
+
+def estimate_load_bytes(name, size, file=None):
+    """
+    Perkiraan memori (byte) DataFrame hasil parsing file `name` berukuran
+    `size`. Jika `file` Parquet diberikan, dipakai ukuran tanpa kompresi
+    dari metadata (tanpa membaca data); selain itu rasio per ekstensi.
+    """
+    ext = os.path.splitext(str(name).lower())[1]
+    if file is not None and ext in (".parquet", ".pq"):
+        from gearing.loader import parquet_nbytes
+
+        try:
+            nbytes = parquet_nbytes(file)
+        except (OSError, ValueError):
+            nbytes = None  # metadata rusak: error asli muncul saat parsing
+        if nbytes is not None:
+            return int(nbytes * RASIO_PARQUET_PANDAS)
+    return int((size or 0) * RASIO_EKSPANSI.get(ext, 4))
+
+
+class MemoryBudget:
+    """
+    Anggaran memori satu sesi dashboard.
+
+    `held` mencatat data yang dipegang sesi (dataset, hasil filter) per
+    nama; `check(extra)` melempar MemoryBudgetExceeded jika data yang
+    dipegang ditambah `extra` melewati `limit`. Puncak per tahap diukur
+    oleh StageTimer (lihat `measure`).
+    """
+
+    def __init__(self, limit_bytes=SESSION_BUDGET_MB * 1024 * 1024):
+        self.limit = limit_bytes
+        self.held = {}
+        self.peak = 0
+
+    @property
+    def used(self):
+        return sum(self.held.values())
+
+    def hold(self, name, obj):
+        """Catat `obj` (atau jumlah byte) sebagai data yang dipegang sesi, lalu cek anggaran."""
+        nbytes = obj if isinstance(obj, int) else estimate_nbytes(obj)
+        self.held[name] = nbytes
+        try:
+            self.check(0, name)
+        except MemoryBudgetExceeded:
+            del self.held[name]
+            raise
+        return nbytes
+
+    def release(self, name):
+        self.held.pop(name, None)
+
+    def check(self, extra=0, stage=None):
+        """Total memori (byte) jika tahap `stage` memakai `extra` byte lagi; lempar jika melewati anggaran."""
+        total = self.used + (extra or 0)
+        self.peak = max(self.peak, total)
+        if self.limit and total > self.limit:
+            raise MemoryBudgetExceeded(
+                f"Tahap '{stage}' membutuhkan ~{total / 1024 / 1024:,.0f} MB, melebihi anggaran "
+                f"memori sesi {self.limit / 1024 / 1024:,.0f} MB (GEARING_SESSION_MEM_MB)"
+            )
+        return total
+
+
+# tracemalloc bersifat global per proses: satu pengukuran sekaligus
+_trace_lock = threading.Lock()
+
+
+class _Pengukur:
+    """Puncak alokasi selama satu tahap (tracemalloc jika aktif)."""
+
+    def __init__(self, enabled=TRACE_MEMORY):
+        self.enabled = enabled and _trace_lock.acquire(blocking=False)
+        self.base = 0
+
+    def start(self):
+        if self.enabled:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            self.base = tracemalloc.get_traced_memory()[0]
+
+    def stop(self):
+        """Puncak alokasi tambahan (byte) selama tahap, atau None jika tidak diukur."""
+        if not self.enabled:
+            return None
+        try:
+            return max(0, tracemalloc.get_traced_memory()[1] - self.base)
+        finally:
+            _trace_lock.release()
+
+
+def measure(enabled=TRACE_MEMORY):
+    """Pengukur puncak memori untuk satu tahap (dipakai StageTimer)."""
+    return _Pengukur(enabled)
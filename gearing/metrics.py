@@ -0,0 +1,183 @@
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+import pandas as pd
+
+from gearing.cache import DEFAULT_CACHE_DIR
+from gearing.memory import measure
+
+# ===============================
+# LOG METRIK (JSON LINES)
+# ===============================
+DEFAULT_METRICS_LOG = os.environ.get(
+    "GEARING_METRICS_LOG", os.path.join(DEFAULT_CACHE_DIR, "metrics.jsonl")
+)
+# Log dirotasi (metrics.jsonl -> metrics.jsonl.1) setelah ukuran ini
+METRICS_MAX_BYTES = int(os.environ.get("GEARING_METRICS_MAX_MB", "50")) * 1024 * 1024
+
+_log_lock = threading.Lock()
+
+
+def append_jsonl(path, record):
+    """Tambahkan satu record ke log JSON lines (gagal tulis diabaikan)."""
+    if not path:
+        return
+    line = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+    with _log_lock:
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            if os.path.exists(path) and os.path.getsize(path) > METRICS_MAX_BYTES:
+                os.replace(path, path + ".1")
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(line)
+        except OSError:
+            pass
+
+
+class StageTimer:
+    """
+    Pencatat durasi dan jumlah baris per tahap pipeline dalam satu run.
+
+    Setiap tahap disimpan di `records` (untuk panel diagnostik) dan
+    langsung ditambahkan ke log JSON lines `log_path` (None = tanpa log).
+    Jika `budget` (memory.MemoryBudget) diberikan, perkiraan memori tahap
+    (`expected_bytes`) dicek sebelum tahap dimulai; itulah yang menolak
+    upload terlalu besar. Puncak yang terukur baru dicek setelah tahap
+    selesai, saat memorinya sudah terpakai (menghentikan tahap berikutnya).
+    """
+
+    def __init__(self, page, log_path=DEFAULT_METRICS_LOG, run_id=None, budget=None):
+        self.page = page
+        self.log_path = log_path
+        self.run_id = run_id or uuid.uuid4().hex[:12]
+        self.budget = budget
+        self.records = []
+
+    @contextmanager
+    def stage(self, name, rows=None, expected_bytes=None):
+        """
+        Ukur satu tahap: ``with timer.stage("load") as s: ...``.
+
+        Jumlah baris bisa diisi di dalam blok lewat ``s["rows"] = n``.
+        Puncak memori diukur tracemalloc (GEARING_TRACE_MEMORY=1), atau
+        diisi perkiraan ukuran data tahap lewat ``s["bytes"] = n``.
+        `expected_bytes` (mis. perkiraan dari ukuran file) dicek terhadap
+        anggaran sebelum blok dijalankan: upload terlalu besar ditolak
+        sebelum di-parse. Puncak tahap dicek sesudahnya, setelah alokasi.
+        """
+        if self.budget is not None and expected_bytes:
+            self.budget.check(expected_bytes, name)
+        rec = {"rows": rows, "bytes": None}
+        ukur = measure()
+        ukur.start()
+        t0 = time.perf_counter()
+        try:
+            yield rec
+        finally:
+            peak = ukur.stop()
+            if peak is None:
+                peak = rec["bytes"]
+            self.record(name, time.perf_counter() - t0, rec["rows"], peak)
+        if self.budget is not None and peak:
+            self.budget.check(peak, name)
+
+    def record(self, name, seconds, rows=None, peak_bytes=None):
+        rec = {
+            "ts": time.time(),
+            "run": self.run_id,
+            "page": self.page,
+            "stage": name,
+            "seconds": round(seconds, 6),
+            "rows": None if rows is None else int(rows),
+            "peak_mb": None if peak_bytes is None else round(peak_bytes / 1024 / 1024, 3),
+        }
+        self.records.append(rec)
+        append_jsonl(self.log_path, rec)
+
+    def frame(self):
+        """Tahap run ini sebagai DataFrame (stage, ms, rows, peak_mb)."""
+        df = pd.DataFrame(self.records, columns=["stage", "seconds", "rows", "peak_mb"])
+        return df.assign(ms=(df["seconds"] * 1000).round(1)).drop(columns="seconds")
+
+
+# ===============================
+# RINGKASAN p50 / p95
+# ===============================
+def read_log(path=DEFAULT_METRICS_LOG):
+    """Baca log JSON lines menjadi DataFrame (baris rusak dilewati)."""
+    rows = []
+    try:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    rows.append(json.loads(line))
+                except ValueError:
+                    continue
+    except OSError:
+        pass
+    return pd.DataFrame(rows, columns=["ts", "run", "page", "stage", "seconds", "rows", "peak_mb"])
+
+
+def summarize(log):
+    """p50 / p95 durasi (detik), jumlah sampel dan puncak memori maks per (page, stage)."""
+    if log.empty:
+        return pd.DataFrame(columns=["page", "stage", "count", "p50", "p95", "rows_p50", "peak_mb_max"])
+    return (
+        log.groupby(["page", "stage"])
+        .agg(
+            count=("seconds", "size"),
+            p50=("seconds", "median"),
+            p95=("seconds", lambda s: s.quantile(0.95)),
+            rows_p50=("rows", "median"),
+            peak_mb_max=("peak_mb", "max"),
+        )
+        .reset_index()
+    )
+
+
+def _label(text):
+    return str(text).replace("\\", "\\\\").replace('"', '\\"')
+
+
+def export_text(summary):
+    """
+    Ringkasan dalam format teks satu metrik per baris (gaya Prometheus):
+
+        gearing_stage_seconds{page="gearing",stage="load",quantile="0.5"} 0.123
+    """
+    lines = ["# TYPE gearing_stage_seconds summary"]
+    for r in summary.itertuples(index=False):
+        label = f'page="{_label(r.page)}",stage="{_label(r.stage)}"'
+        lines.append(f'gearing_stage_seconds{{{label},quantile="0.5"}} {r.p50:.6f}')
+        lines.append(f'gearing_stage_seconds{{{label},quantile="0.95"}} {r.p95:.6f}')
+        lines.append(f"gearing_stage_seconds_count{{{label}}} {int(r.count)}")
+        if pd.notna(r.peak_mb_max):
+            lines.append(f"gearing_stage_peak_mb{{{label}}} {r.peak_mb_max:.3f}")
+    return "\n".join(lines) + "\n"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m gearing.metrics",
+        description="Ringkas log metrik dashboard menjadi p50 / p95 per tahap.",
+    )
+    parser.add_argument("log", nargs="?", default=DEFAULT_METRICS_LOG)
+    parser.add_argument("--format", choices=["text", "csv"], default="text")
+    args = parser.parse_args(argv)
+
+    summary = summarize(read_log(args.log))
+    if args.format == "csv":
+        summary.to_csv(sys.stdout, index=False)
+    else:
+        sys.stdout.write(export_text(summary))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+
+_ANGKA_RE = r"^[+-]?(\d+(\.\d*)?|\.\d+)([eE][+-]?\d+)?$"
+
+
+def _parse_text_arrow(text):
+    arr = pa.array(np.asarray(text, dtype=object), type=pa.string(), from_pandas=True)
+    arr = pc.utf8_trim_whitespace(arr)
+    # Titik = pemisah ribuan, koma = desimal
+    arr = pc.replace_substring(arr, ".", "")
+    arr = pc.replace_substring(arr, ",", ".")
+    try:
+        hasil = arr.cast(pa.float64())
+    except pa.ArrowInvalid:
+        # Ada sel yang bukan angka: jadikan null lalu cast ulang
+        ok = pc.match_substring_regex(arr, _ANGKA_RE)
+        hasil = pc.if_else(ok, arr, None).cast(pa.float64())
+    return hasil.to_numpy(zero_copy_only=False)
+
+
+def _parse_text_pandas(text):
+    text = text.astype("string").str.strip()
+    text = text.str.replace(".", "", regex=False).str.replace(",", ".", regex=False)
+    return pd.to_numeric(text, errors="coerce").astype("float64").to_numpy()
+
+
+def _parse_text(text):
+    """Parse kolom string format Indonesia ("516.859.837.493,95") ke float."""
+    if pa is not None:
+        return _parse_text_arrow(text)
+    return _parse_text_pandas(text)
+
+
+def parse_value_series(values):
+    """
+    Parse kolom Value (format Indonesia) menjadi float64 secara vektor.
+
+    Kolom bertipe numerik dikembalikan apa adanya (hanya di-cast ke float).
+    Mengembalikan tuple (Series float64, jumlah sel yang gagal di-parse).
+    Sel kosong / NaN tidak dihitung sebagai gagal; TRUE / FALSE bukan
+    nominal, jadi NaN dan dihitung gagal.
+    """
+    values = pd.Series(values)
+
+    if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+        return values.astype("float64"), 0
+    # bool, kategori, tanggal, dst.: diperlakukan sebagai kolom object campuran
+    if not (pd.api.types.is_object_dtype(values) or pd.api.types.is_string_dtype(values)):
+        values = values.astype(object)
+
+    jenis = pd.api.types.infer_dtype(values, skipna=True)
+
+    if jenis in ("string", "empty"):
+        out = pd.Series(_parse_text(values), index=values.index, dtype="float64")
+        teks = True
+    elif jenis in ("integer", "floating", "mixed-integer-float", "decimal"):
+        out = pd.to_numeric(values, errors="coerce").astype("float64")
+        teks = False
+    else:
+        # Kolom object campuran (angka dari Excel + teks): pisahkan dulu
+        tipe = values.map(type, na_action="ignore")
+        is_text = tipe.eq(str)
+        out = pd.Series(np.nan, index=values.index, dtype="float64")
+        if is_text.any():
+            out[is_text] = _parse_text(values[is_text])
+        rest = ~is_text & values.notna() & ~tipe.isin([bool, np.bool_])
+        if rest.any():
+            out[rest] = pd.to_numeric(values[rest], errors="coerce")
+        teks = True
+
+    # Hitung sel gagal: tidak kosong tetapi hasilnya NaN
+    gagal = out.isna() & values.notna()
+    if teks and gagal.any():
+        kandidat = values[gagal]
+        gagal[kandidat.index] = ~kandidat.astype(str).str.strip().eq("")
+    return out, int(gagal.sum())
+
+
+def format_values(values, pattern):
+    """
+    Format Series angka dengan pattern str.format (mis. "Rp {:,.2f}").
+
+    NaN menjadi string kosong. Dipakai hanya pada baris yang ditampilkan
+    (satu halaman preview), bukan seluruh DataFrame.
+    """
+    values = pd.Series(values)
+    return values.map(pattern.format, na_action="ignore").fillna("")
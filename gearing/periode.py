@@ -0,0 +1,129 @@
+import pandas as pd
+
+from gearing.lru import LRUCache
+
+# ===============================
+# NAMA BULAN (INDONESIA & INGGRIS)
+# ===============================
+bulan_map = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4,
+    "may": 5, "mei": 5, "jun": 6, "jul": 7,
+    "aug": 8, "agu": 8, "sep": 9,
+    "oct": 10, "okt": 10,
+    "nov": 11, "dec": 12, "des": 12
+}
+
+bulan_id = {
+    1: "Jan", 2: "Feb", 3: "Mar", 4: "Apr",
+    5: "Mei", 6: "Jun", 7: "Jul", 8: "Agu",
+    9: "Sep", 10: "Okt", 11: "Nov", 12: "Des"
+}
+
+_BULAN_RE = r"(" + "|".join(bulan_map) + r")"
+_TAHUN_RE = r"(20\d{2}|\d{2})"
+
+# Memo hasil parsing per string mentah, dipakai lintas upload / rerun;
+# dibatasi (LRU) agar proses dashboard / API yang berjalan lama tidak
+# menyimpan setiap string Periode dari setiap upload.
+PERIODE_MEMO_MAX = 10_000
+_memo = LRUCache(maxsize=PERIODE_MEMO_MAX)
+
+
+def clear_periode_memo():
+    """Kosongkan memo parsing Periode (mis. untuk mengukur parsing dingin)."""
+    _memo.clear()
+
+
+def _resolve(texts):
+    """Parse daftar string unik menjadi DataFrame (Year, Month) tanpa loop per baris."""
+    s = pd.Series(texts, dtype=object)
+
+    # Coba parsing tanggal langsung (ISO, "Jan 2023", "2023-01-31", dll)
+    dt = pd.to_datetime(s, errors="coerce", format="mixed")
+    year = dt.dt.year.astype("Int64")
+    month = dt.dt.month.astype("Int64")
+
+    # Sisanya: cari nama bulan + tahun ("Des 2023 Audited", "Mei 23", ...)
+    gagal = dt.isna()
+    if gagal.any():
+        lower = s[gagal].str.lower()
+        bln = lower.str.extract(_BULAN_RE, expand=False).map(bulan_map)
+        thn = pd.to_numeric(
+            lower.str.extract(_TAHUN_RE, expand=False), errors="coerce"
+        )
+        thn = thn.where(thn >= 100, thn + 2000)
+        ok = bln.notna() & thn.notna()
+        year[gagal] = thn.where(ok).astype("Int64")
+        month[gagal] = bln.where(ok).astype("Int64")
+
+    return pd.DataFrame({"Year": year.values, "Month": month.values}, index=s.values)
+
+
+def parse_periode_series(periode):
+    """
+    Parse kolom Periode secara vektor.
+
+    Hanya string unik yang di-parse (dan di-memo), lalu hasilnya
+    dipetakan balik ke setiap baris. Mengembalikan DataFrame dengan
+    index sama seperti input dan kolom Year, Month, SortKey,
+    Periode_Label (NA untuk periode yang tidak dikenali).
+    """
+    periode = pd.Series(periode)
+    codes, uniques = pd.factorize(periode.astype(str))
+
+    # Salinan lokal: entri memo bisa tergusur selama fungsi ini berjalan
+    dikenal = {u: _memo.get(u) for u in uniques}
+    baru = [u for u, v in dikenal.items() if v is None]
+    if baru:
+        hasil = _resolve(baru)
+        for text, y, m in zip(hasil.index, hasil["Year"], hasil["Month"]):
+            dikenal[text] = (y, m)
+            _memo.put(text, (y, m))
+
+    lookup = pd.DataFrame(
+        [dikenal[u] for u in uniques],
+        index=uniques,
+        columns=["Year", "Month"],
+    ).astype("Int64")
+    lookup["SortKey"] = lookup["Year"] * 100 + lookup["Month"]
+    lookup["Periode_Label"] = (
+        lookup["Month"].map(bulan_id) + " " + lookup["Year"].astype(str)
+    ).where(lookup["Year"].notna())
+
+    # Petakan balik ke baris lewat kode factorize (bukan lookup string per baris);
+    # periode kosong (kode -1) menjadi NA, bukan periode unik terakhir
+    out = lookup.reset_index(drop=True).reindex(codes)
+    out.index = periode.index
+    return out
+
+
+def add_periode_columns(df, col="Periode"):
+    """
+    Tambahkan kolom Periode_Raw, Year, Month, SortKey, Periode_Label ke df.
+
+    Baris dengan periode yang tidak dikenali dibuang; kolom
+    Year/Month/SortKey dikembalikan sebagai integer.
+    """
+    # assign = frame baru tanpa salin data (Copy-on-Write); df pemanggil utuh
+    df = df.assign(Periode_Raw=df[col].astype(str))
+    parsed = parse_periode_series(df["Periode_Raw"])
+
+    valid = parsed["SortKey"].notna().to_numpy()
+    if not valid.all():
+        df = df.loc[valid]
+        parsed = parsed.loc[valid]
+    for c in ["Year", "Month", "SortKey"]:
+        df[c] = parsed[c].astype("int64")
+    df["Periode_Label"] = parsed["Periode_Label"].astype(str)
+    return df
+
+
+def sort_periode(values):
+    """Urutkan opsi Periode secara kronologis; yang tidak dikenali di akhir."""
+    values = list(values)
+    keys = parse_periode_series(pd.Series(values, dtype=object))["SortKey"].tolist()
+    urut = sorted(
+        zip(keys, values),
+        key=lambda kv: (pd.isna(kv[0]), 0 if pd.isna(kv[0]) else kv[0], str(kv[1])),
+    )
+    return [v for _, v in urut]
@@ -0,0 +1,184 @@
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+import pandas as pd
+
+# ===============================
+# STORE DATASET BERSAMA (SATU SALINAN PER PROSES)
+# ===============================
+DEFAULT_SHARED_MAX_MB = int(os.environ.get("GEARING_SHARED_MAX_MB", "2048"))
+
+# Referensi sesi yang tidak diperbarui selama ini dianggap sudah lepas
+# (sesi Streamlit bisa berakhir tanpa sempat memanggil release)
+DEFAULT_LEASE_SECONDS = int(os.environ.get("GEARING_SHARED_LEASE_MIN", "60")) * 60
+
+
+def estimate_nbytes(value, _seen=None):
+    """
+    Perkiraan memori (byte) DataFrame / Series / dict / list / tuple
+    bersarang; objek yang sama (mis. df dan df_agg identik) dihitung sekali.
+    """
+    seen = set() if _seen is None else _seen
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True, index=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True, index=True))
+    if isinstance(value, dict):
+        return sum(estimate_nbytes(v, seen) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(estimate_nbytes(v, seen) for v in value)
+    return sys.getsizeof(value)
+
+
+class _Entry:
+    __slots__ = ("value", "nbytes", "owners")
+
+    def __init__(self, value, nbytes):
+        self.value = value
+        self.nbytes = nbytes
+        self.owners = {}  # owner -> waktu terakhir dipakai
+
+
+class SharedDatasets:
+    """
+    Dataset hasil parsing yang dibagi antar sesi, dikunci oleh hash isi file.
+
+    Upload identik dari banyak sesi memakai satu objek yang sama (tanpa
+    salin, berbeda dengan st.cache_data yang mengembalikan salinan per
+    pemanggil). Objek harus diperlakukan read-only; dengan Copy-on-Write
+    pandas, turunan yang diubah tidak menyentuh data bersama.
+
+    Setiap pemilik (mis. sesi + halaman) memegang referensi lewat
+    acquire / release. Jika total memori melewati `max_bytes`, entri tanpa
+    referensi aktif dibuang mulai dari yang paling lama tidak dipakai
+    (LRU); entri yang masih dipegang tidak pernah dibuang. Aman thread:
+    beberapa sesi yang meminta kunci sama sekaligus hanya mem-parse sekali.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_SHARED_MAX_MB * 1024 * 1024, lease_seconds=DEFAULT_LEASE_SECONDS):
+        self.max_bytes = max_bytes
+        self.lease_seconds = lease_seconds
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._loading = {}
+        self._lock = threading.Lock()
+
+    def _aktif(self, entry, now):
+        # Buang referensi yang lease-nya habis, kembalikan jumlah referensi aktif
+        batas = now - self.lease_seconds
+        for owner in [o for o, ts in entry.owners.items() if ts < batas]:
+            del entry.owners[owner]
+        return len(entry.owners)
+
+    def _pegang(self, key, entry, owner):
+        self._entries.move_to_end(key)
+        if owner is not None:
+            entry.owners[owner] = time.time()
+        return entry.value
+
+    def acquire(self, key, owner, load):
+        """
+        Ambil dataset `key` dan catat `owner` sebagai pemegang referensi.
+
+        Jika belum ada, `load()` dipanggil sekali (sesi lain yang meminta
+        kunci sama menunggu hasilnya). Exception dari `load` diteruskan
+        dan tidak disimpan.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self.hits += 1
+                return self._pegang(key, entry, owner)
+            key_lock = self._loading.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self.hits += 1
+                    return self._pegang(key, entry, owner)
+            try:
+                value = load()
+            except BaseException:
+                with self._lock:
+                    self._loading.pop(key, None)
+                raise
+            entry = _Entry(value, estimate_nbytes(value))
+
+            # Entri dimasukkan sebelum penanda loading dihapus, dalam satu
+            # kuncian: peminta lain melihat entri atau menunggu key_lock ini
+            with self._lock:
+                self.misses += 1
+                self._entries[key] = entry
+                self._loading.pop(key, None)
+                self.total_bytes += entry.nbytes
+                value = self._pegang(key, entry, owner)
+                self._evict(keep=key)
+            return value
+
+    def release(self, key, owner):
+        """Lepas referensi `owner` atas `key` (entri tetap ada sampai tergusur)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.owners.pop(owner, None)
+            self._evict()
+
+    def release_others(self, owner, keep):
+        """Lepas semua referensi `owner` kecuali kunci di `keep` (mis. file lama yang diganti)."""
+        keep = set(keep)
+        with self._lock:
+            for key, entry in self._entries.items():
+                if key not in keep:
+                    entry.owners.pop(owner, None)
+            self._evict()
+
+    def _evict(self, keep=None):
+        if self.total_bytes <= self.max_bytes:
+            return
+        now = time.time()
+        for key in list(self._entries):
+            if self.total_bytes <= self.max_bytes:
+                break
+            entry = self._entries[key]
+            if key == keep or self._aktif(entry, now):
+                continue
+            del self._entries[key]
+            self.total_bytes -= entry.nbytes
+            self.evictions += 1
+
+    def refcount(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            return 0 if entry is None else self._aktif(entry, time.time())
+
+    def stats(self):
+        """Ringkasan untuk panel diagnostik: jumlah entri, memori, hit/miss."""
+        with self._lock:
+            now = time.time()
+            return {
+                "entries": len(self._entries),
+                "referenced": sum(1 for e in self._entries.values() if self._aktif(e, now)),
+                "mb": round(self.total_bytes / 1024 / 1024, 1),
+                "max_mb": round(self.max_bytes / 1024 / 1024, 1),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
@@ -0,0 +1,111 @@
+import threading
+
+import pandas as pd
+
+from gearing.engine import (
+    SEMUA_JENIS,
+    gearing_from_pivot,
+    period_audited,
+    period_labels,
+    pivot_periode_jenis,
+)
+
+# Kolom mentah yang menentukan hasil agregasi satu periode
+HASH_COLUMNS = ["SortKey", "Periode_Raw", "Jenis", "Value"]
+
+
+def period_hashes(df):
+    """
+    Sidik jari baris mentah per periode.
+
+    Hash tiap baris (vektor, hash_pandas_object) dijumlahkan per SortKey
+    sehingga tidak bergantung urutan baris. Mengembalikan DataFrame
+    ber-index SortKey dengan kolom row_hash dan n_rows.
+    """
+    cols = [c for c in HASH_COLUMNS if c in df.columns]
+    h = pd.util.hash_pandas_object(df[cols].astype(object), index=False)
+    return (
+        pd.DataFrame({"SortKey": df["SortKey"].to_numpy(), "row_hash": h.to_numpy()})
+        .groupby("SortKey")
+        .agg(row_hash=("row_hash", "sum"), n_rows=("row_hash", "size"))
+    )
+
+
+class AggregateStore:
+    """
+    Agregat Gearing Ratio per (SortKey, Jenis) di memori, satu per sesi
+    dashboard (tidak dibagi antar sesi dan tidak disimpan ke disk).
+
+    Setiap upload dianggap riwayat lengkap: hanya periode yang baris
+    mentahnya berubah (hash berbeda) atau periode baru yang dihitung
+    ulang, dan periode yang tidak ada lagi di upload dibuang. Hasil
+    gearing() selalu sama dengan compute_gearing(upload terakhir).
+    """
+
+    def __init__(self):
+        self.state = None
+        self._lock = threading.Lock()
+        # Naik setiap isi store berubah (dipakai sebagai bagian kunci cache)
+        self.version = 0
+
+    def update(self, df, hashes=None):
+        """
+        Ganti isi store dengan data bersih baru (riwayat lengkap).
+
+        `hashes` (hasil period_hashes data penuh) wajib diberikan jika `df`
+        hanya ringkasan, mis. hasil stream_gearing_csv. Mengembalikan list
+        SortKey yang dihitung ulang atau dibuang.
+        """
+        with self._lock:
+            return self._update(df, hashes)
+
+    def _update(self, df, hashes=None):
+        if hashes is None:
+            hashes = period_hashes(df)
+
+        if self.state is None:
+            changed = hashes.index
+            hilang = hashes.index[:0]
+        else:
+            old = self.state[["row_hash", "n_rows"]].reindex(hashes.index)
+            beda = (old["row_hash"] != hashes["row_hash"]) | (old["n_rows"] != hashes["n_rows"])
+            changed = hashes.index[beda.to_numpy()]
+            # Periode yang tidak ada lagi di upload (dikoreksi / dihapus)
+            hilang = self.state.index.difference(hashes.index)
+
+        if len(changed) == 0 and len(hilang) == 0:
+            return []
+        if len(changed) == 0:
+            self.state = self.state.drop(hilang)
+            self.version += 1
+            return list(hilang)
+
+        part = df[df["SortKey"].isin(changed)]
+        pivot = pivot_periode_jenis(part).reindex(changed)
+        baru = pivot.astype("float64")
+        baru["Periode_Label"] = period_labels(part).reindex(changed).astype(str)
+        baru["Is_Audited"] = period_audited(part).reindex(changed)
+        baru = baru.join(hashes.loc[changed])
+
+        if self.state is None:
+            state = baru
+        else:
+            state = pd.concat([self.state.drop(changed.union(hilang), errors="ignore"), baru])
+        self.state = state.sort_index()
+        self.version += 1
+        return list(changed) + list(hilang)
+
+    def gearing(self):
+        """Seri Gearing Ratio lengkap dari isi store (format = compute_gearing)."""
+        if self.state is None:
+            return gearing_from_pivot(
+                pd.DataFrame(columns=SEMUA_JENIS, dtype="float64"), pd.Series(dtype=object)
+            )
+        labels = self.state["Periode_Label"]
+        gear = gearing_from_pivot(
+            self.state[SEMUA_JENIS], labels, self.state.get("Is_Audited")
+        )
+        gear["Periode_Label"] = pd.Categorical(
+            gear["Periode_Label"], categories=gear["Periode_Label"].unique(), ordered=True
+        )
+        return gear
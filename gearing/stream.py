@@ -0,0 +1,216 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from gearing.clean import (
+    PENJAMINAN_KATEGORI,
+    clean_gearing,
+    clean_penjaminan_sheet,
+    order_periode_label,
+    to_categorical,
+)
+from gearing.cube import build_cube
+from gearing.loader import (
+    CSV_NA_VALUES,
+    PENJAMINAN_KOLOM,
+    PENJAMINAN_POSISI,
+    _as_buffer,
+    _pilih_kolom,
+)
+from gearing.store import period_hashes
+from gearing.worker import report
+
+# ===============================
+# BATAS MEMORI STREAMING CSV
+# ===============================
+# Jumlah baris per chunk dan ukuran sampel untuk preview
+CHUNK_ROWS = int(os.environ.get("GEARING_CHUNK_ROWS", "200000"))
+SAMPLE_ROWS = 10_000
+
+# CSV sebesar ini (atau lebih) dibaca per chunk, bukan sekaligus
+STREAM_MIN_BYTES = int(os.environ.get("GEARING_STREAM_MB", "100")) * 1024 * 1024
+
+# Kunci ringkasan Gearing: satu baris per (periode, Jenis, status audit)
+_GEARING_KEYS = ["SortKey", "Jenis", "Is_Audited"]
+
+
+def should_stream(name, size):
+    """True jika file CSV cukup besar untuk dibaca per chunk."""
+    return str(name).lower().endswith(".csv") and size is not None and size >= STREAM_MIN_BYTES
+
+
+class _Sampel:
+    """
+    Sampel acak seragam berukuran tetap dari aliran chunk (bottom-k).
+
+    Setiap baris diberi kunci acak; yang disimpan hanya `n` baris dengan
+    kunci terkecil, sehingga memori tidak tumbuh mengikuti ukuran file.
+    Hasil akhir diurutkan kembali sesuai urutan baris di file.
+    """
+
+    def __init__(self, n, seed=0):
+        self.n = n
+        self.rng = np.random.default_rng(seed)
+        self.df = None
+        self.offset = 0
+
+    def add(self, chunk):
+        chunk = chunk.assign(
+            _pos=np.arange(self.offset, self.offset + len(chunk)),
+            _key=self.rng.random(len(chunk)),
+        )
+        self.offset += len(chunk)
+        if self.df is not None:
+            chunk = pd.concat([self.df, chunk])
+        self.df = chunk.nsmallest(self.n, "_key") if len(chunk) > self.n else chunk
+
+    def result(self):
+        if self.df is None:
+            return pd.DataFrame()
+        return self.df.sort_values("_pos").drop(columns=["_pos", "_key"]).reset_index(drop=True)
+
+
+def _ringkas_gearing(df):
+    """
+    Satu baris per (SortKey, Jenis, Is_Audited): Value non-NaN terakhir.
+
+    Prioritas audited diterapkan kemudian oleh dedup_audited (lewat
+    compute_gearing / AggregateStore).
+    """
+    return (
+        df.groupby(_GEARING_KEYS, sort=False, dropna=False)
+        .agg(Value=("Value", "last"), Periode_Label=("Periode_Label", "first"))
+        .reset_index()
+    )
+
+
+def _iter_csv(file, chunksize, usecols=None, progress=None, stage="membaca chunk"):
+    """Chunk CSV; posisi baca buffer dilaporkan ke `progress` sebagai fraksi file."""
+    buf = _as_buffer(file)
+    size = getattr(file, "size", None) or _ukuran(buf)
+    chunks = pd.read_csv(
+        buf, chunksize=chunksize, usecols=usecols, na_values=CSV_NA_VALUES, keep_default_na=False
+    )
+    for i, chunk in enumerate(chunks):
+        if progress is not None:
+            frac = buf.tell() / size if size and hasattr(buf, "tell") else None
+            report(progress, f"{stage} {i + 1}", frac)
+        yield chunk
+
+
+def _ukuran(buf):
+    try:
+        pos = buf.tell()
+        end = buf.seek(0, 2)
+        buf.seek(pos)
+        return end
+    except (AttributeError, OSError):
+        return None
+
+
+def stream_gearing_csv(file, chunksize=CHUNK_ROWS, sample_rows=SAMPLE_ROWS, progress=None):
+    """
+    Baca + bersihkan CSV Gearing Ratio per chunk dengan memori terbatas.
+
+    Setiap chunk dibersihkan (clean_gearing) lalu diringkas menjadi satu
+    baris per (SortKey, Jenis, Is_Audited); hasil compute_gearing dari
+    ringkasan ini sama dengan dari data penuh. Hash baris per periode
+    (period_hashes) dijumlahkan lintas chunk untuk AggregateStore.
+
+    Mengembalikan tuple (sample, reduced, hashes, info) dengan info
+    berisi n_gagal dan n_rows (baris periode valid). Melempar ValueError
+    jika kolom wajib (termasuk Jenis) tidak ada. `progress` (opsional)
+    menerima nomor chunk dan fraksi file yang sudah dibaca.
+    """
+    sampel = _Sampel(sample_rows)
+    reduced, hashes = None, None
+    info = {"n_gagal": 0, "n_rows": 0}
+
+    for chunk in _iter_csv(file, chunksize, progress=progress):
+        if "Jenis" not in chunk.columns:
+            raise ValueError("Kolom 'Jenis' tidak ditemukan")
+        df, n_gagal = clean_gearing(chunk)
+        info["n_gagal"] += n_gagal
+        info["n_rows"] += len(df)
+        if df.empty:
+            continue
+
+        sampel.add(df.astype({"Jenis": object, "Periode_Raw": object, "Periode_Label": object}))
+
+        # Hash periode bersifat aditif (jumlah hash baris), cukup dijumlah;
+        # groupby-sum tetap uint64 (add + fill_value lewat float64 = presisi hilang)
+        h = period_hashes(df)
+        hashes = h if hashes is None else pd.concat([hashes, h]).groupby(level=0).sum()
+
+        part = _ringkas_gearing(df.astype({"Jenis": object, "Periode_Label": object}))
+        reduced = part if reduced is None else _ringkas_gearing(pd.concat([reduced, part]))
+
+    sample = sampel.result()
+    if reduced is None:
+        reduced = pd.DataFrame(columns=_GEARING_KEYS + ["Value", "Periode_Label"])
+        hashes = pd.DataFrame(
+            {"row_hash": pd.Series(dtype="uint64"), "n_rows": pd.Series(dtype="int64")}
+        ).rename_axis("SortKey")
+    else:
+        hashes["n_rows"] = hashes["n_rows"].astype("int64")
+        order_periode_label(reduced)
+        to_categorical(reduced, ["Jenis"])
+
+    if not sample.empty:
+        order_periode_label(sample)
+        to_categorical(sample, ["Jenis", "Periode_Raw"])
+    return sample, reduced, hashes, info
+
+
+def _gabung_cube(cube):
+    keys = [c for c in cube.columns if c not in ("Total_Value", "n_value")]
+    return (
+        cube.groupby(keys, sort=False, dropna=False)
+        .agg(Total_Value=("Total_Value", "sum"), n_value=("n_value", "sum"))
+        .reset_index()
+    )
+
+
+def stream_penjaminan_csv(file, chunksize=CHUNK_ROWS, sample_rows=SAMPLE_ROWS, tenor=False, progress=None):
+    """
+    Baca + bersihkan CSV Outstanding Penjaminan per chunk.
+
+    Cube agregat (build_cube) dibangun per chunk lalu dijumlahkan, karena
+    Total_Value dan n_value bersifat aditif. Jika `tenor` True, kolom ke-4
+    dipakai sebagai Tenor (seperti sheet Proyeksi). Mengembalikan tuple
+    (sample, cube, info) dengan info format clean_penjaminan_sheet
+    ditambah n_rows; cube None jika status bukan "ok".
+    """
+    header = pd.read_csv(_as_buffer(file), nrows=0).columns
+    usecols = _pilih_kolom(header, PENJAMINAN_POSISI, set(PENJAMINAN_KOLOM))
+
+    sampel = _Sampel(sample_rows)
+    cube = None
+    info = {"status": "kosong", "dimensi_label": None, "n_gagal": 0, "n_rows": 0}
+
+    for chunk in _iter_csv(file, chunksize, usecols=usecols, progress=progress):
+        df, chunk_info = clean_penjaminan_sheet(chunk)
+        if chunk_info["status"] == "kosong":
+            continue
+        if chunk_info["status"] != "ok":
+            info.update(chunk_info)
+            return df, None, info
+
+        info["status"] = "ok"
+        info["dimensi_label"] = chunk_info["dimensi_label"]
+        info["n_gagal"] += chunk_info["n_gagal"]
+        info["n_rows"] += len(df)
+
+        teks = [c for c in PENJAMINAN_KATEGORI if c in df.columns]
+        df = df.astype({c: object for c in teks})
+        sampel.add(df)
+
+        part = build_cube(df, tenor=df.columns[3] if tenor else None)
+        cube = part if cube is None else _gabung_cube(pd.concat([cube, part]))
+
+    sample = sampel.result()
+    if cube is not None:
+        to_categorical(cube, PENJAMINAN_KATEGORI)
+        to_categorical(sample, PENJAMINAN_KATEGORI)
+    return sample, cube, info
@@ -0,0 +1,210 @@
+import argparse
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+from gearing.engine import EKUITAS_JENIS, KUR_JENIS, PEN_JENIS
+from gearing.periode import bulan_id
+
+# ===============================
+# DATA SINTETIS (LAYOUT SAMA DENGAN CONTOH DI gambar/)
+# ===============================
+# Nama bulan lengkap seperti kolom Periode sheet Penjaminan ("Desember 2025")
+BULAN_PANJANG = {
+    1: "Januari", 2: "Februari", 3: "Maret", 4: "April",
+    5: "Mei", 6: "Juni", 7: "Juli", 8: "Agustus",
+    9: "September", 10: "Oktober", 11: "November", 12: "Desember"
+}
+
+GEARING_JENIS = KUR_JENIS + PEN_JENIS + [EKUITAS_JENIS]
+
+# Sheet Penjaminan: nama sheet -> (nama kolom Dimensi, nilai Dimensi)
+PENJAMINAN_SHEETS = {
+    "GEN": ("Gen", ["Gen 1", "Gen 2"]),
+    "Tenor": ("Tenor (Tahun)", ["1", "2", "3", "4", "5"]),
+    "Issued Year": ("Issued Year", [str(y) for y in range(2018, 2026)]),
+    "Jenis Polis": ("Jenis Polis", ["Polis Induk", "Polis Individu"]),
+    "Jenis Kredit (KUR)": ("Jenis Kredit KUR", ["Mikro", "Kecil", "Super Mikro", "TKI"]),
+    "Bank": ("Bank", ["BRI", "BNI", "Mandiri", "BSI", "BTN", "BPD Jatim"]),
+    "Kota": ("Kota", ["Jakarta", "Surabaya", "Bandung", "Medan", "Makassar", "Semarang"]),
+    "Proyeksi": ("Gross/Nett", ["OS Gross", "OS Nett"]),
+}
+PENJAMINAN_METRICS = ["Outstanding", "Jumlah Debitur", "Plafond"]
+
+# Batas baris satu sheet Excel (tanpa header)
+EXCEL_MAX_ROWS = 1_048_575
+
+
+def format_rupiah(values):
+    """Angka -> teks format Indonesia ("18.551.000.000.000,80")."""
+    teks = pd.Series(values).map("{:,.2f}".format)
+    return teks.str.translate(str.maketrans(",.", ".,"))
+
+
+def _periode_list(n_periode, start_year):
+    idx = np.arange(n_periode)
+    return start_year + idx // 12, idx % 12 + 1
+
+
+def make_gearing(n_rows, seed=0, start_year=2015, n_periode=None):
+    """
+    Tabel Gearing Ratio sintetis (layout Jenis / Periode / Value / Display
+    Period / Periode Mod, lihat gambar/ssXlsx.png).
+
+    Periode ditulis campuran: tanggal akhir bulan ("2021-12-31 00:00:00")
+    dan teks Indonesia ("Des 2021"); sebagian baris Desember berlabel
+    "(Audited)". Value berupa teks format Indonesia, sebagian kecil
+    kosong / tidak valid.
+    """
+    rng = np.random.default_rng(seed)
+    if n_periode is None:
+        n_periode = int(min(240, max(1, n_rows // len(GEARING_JENIS))))
+    years, months = _periode_list(n_periode, start_year)
+
+    per_idx = rng.integers(0, n_periode, n_rows)
+    jenis_idx = rng.integers(0, len(GEARING_JENIS), n_rows)
+    m = months[per_idx]
+
+    # Variasi penulisan Periode (dibentuk per periode unik, lalu dipetakan)
+    akhir = pd.to_datetime({"year": years, "month": months, "day": 1}) + pd.offsets.MonthEnd(0)
+    teks_tanggal = akhir.dt.strftime("%Y-%m-%d 00:00:00").to_numpy()
+    teks_id = np.array([f"{bulan_id[b]} {t}" for t, b in zip(years, months)], dtype=object)
+    teks_audit = np.array([f"{bulan_id[b]} {t} (Audited)" for t, b in zip(years, months)], dtype=object)
+    display = np.array([f"{t}-{b}" for t, b in zip(years, months)], dtype=object)
+    mod = np.array([f"{t}-{b:02d}" for t, b in zip(years, months)], dtype=object)
+
+    varian = rng.random(n_rows)
+    periode = np.where(varian < 0.5, teks_tanggal[per_idx], teks_id[per_idx]).astype(object)
+    audited = (m == 12) & (rng.random(n_rows) < 0.3)
+    periode[audited] = teks_audit[per_idx][audited]
+
+    # Nilai: Ekuitas ~ puluhan triliun, OS ~ ratusan triliun
+    skala = np.where(jenis_idx == len(GEARING_JENIS) - 1, 2e13, 1e14)
+    value = format_rupiah(np.round(skala * rng.uniform(0.5, 1.5, n_rows), 2)).to_numpy(dtype=object)
+    rusak = rng.random(n_rows)
+    value[rusak < 0.001] = ""
+    value[(rusak >= 0.001) & (rusak < 0.002)] = "n/a"
+
+    return pd.DataFrame({
+        "Jenis": np.asarray(GEARING_JENIS, dtype=object)[jenis_idx],
+        "Periode": periode,
+        "Value": value,
+        "Display Period": display[per_idx],
+        "Periode Mod": mod[per_idx],
+    })
+
+
+def make_penjaminan(n_rows, seed=0, start_year=2023, n_periode=24):
+    """
+    Workbook Outstanding Penjaminan sintetis: dict {sheet: DataFrame}
+    dengan layout Periode / KUR/PEN / <Dimensi> / Tenor / ... / Metrics /
+    Value (lihat gambar/xlsxPic2.png). `n_rows` dibagi rata ke semua sheet.
+    """
+    rng = np.random.default_rng(seed)
+    years, months = _periode_list(n_periode, start_year)
+    label = np.array([f"{BULAN_PANJANG[b]} {t}" for t, b in zip(years, months)], dtype=object)
+
+    sheets = {}
+    per_sheet = max(1, n_rows // len(PENJAMINAN_SHEETS))
+    for sheet, (dim_col, dims) in PENJAMINAN_SHEETS.items():
+        n = per_sheet
+        per_idx = rng.integers(0, n_periode, n)
+        metrics = np.asarray(PENJAMINAN_METRICS, dtype=object)[rng.integers(0, len(PENJAMINAN_METRICS), n)]
+        debitur = metrics == "Jumlah Debitur"
+        nilai = np.where(debitur, rng.integers(1, 50_000, n), np.round(rng.uniform(1e8, 1e13, n), 2))
+
+        df = pd.DataFrame({
+            "Periode": label[per_idx],
+            "KUR/PEN": np.where(rng.random(n) < 0.8, "KUR", "PEN").astype(object),
+            dim_col: np.asarray(dims, dtype=object)[rng.integers(0, len(dims), n)],
+            "Tenor": rng.integers(1, 6, n),
+        })
+        if sheet == "Proyeksi":
+            akhir = pd.to_datetime({"year": years[per_idx] + df["Tenor"], "month": 12, "day": 31})
+            df["Proyeksi as of"] = akhir.dt.strftime("%d-%b-%y")
+            df["Proyeksi as of Mod"] = akhir.dt.strftime("%Y-%m")
+        df["Metrics"] = metrics
+        df["Value"] = format_rupiah(nilai).to_numpy(dtype=object)
+        sheets[sheet] = df
+    return sheets
+
+
+# ===============================
+# TULIS FILE
+# ===============================
+def write_gearing(df, path):
+    """Tulis tabel Gearing ke .xlsx / .csv / .parquet (menurut ekstensi)."""
+    lower = path.lower()
+    if lower.endswith(".xlsx"):
+        if len(df) > EXCEL_MAX_ROWS:
+            raise ValueError(f"Excel maksimal {EXCEL_MAX_ROWS:,} baris per sheet")
+        df.to_excel(path, index=False)
+    elif lower.endswith(".parquet"):
+        df.to_parquet(path, index=False)
+    else:
+        df.to_csv(path, index=False)
+    return path
+
+
+def write_penjaminan(sheets, path):
+    """
+    Tulis workbook Penjaminan.
+
+    .xlsx -> satu workbook multi-sheet; selain itu `path` adalah direktori
+    berisi satu file per sheet (<sheet>.csv atau <sheet>.parquet, sesuai
+    ekstensi `path`, mis. "out.parquet" -> out.parquet/<sheet>.parquet).
+    """
+    lower = path.lower()
+    if lower.endswith(".xlsx"):
+        if max(len(d) for d in sheets.values()) > EXCEL_MAX_ROWS:
+            raise ValueError(f"Excel maksimal {EXCEL_MAX_ROWS:,} baris per sheet")
+        with pd.ExcelWriter(path) as xl:
+            for sheet, df in sheets.items():
+                df.to_excel(xl, sheet_name=sheet, index=False)
+        return [path]
+
+    ext = ".parquet" if lower.endswith(".parquet") else ".csv"
+    os.makedirs(path, exist_ok=True)
+    files = []
+    for sheet, df in sheets.items():
+        files.append(os.path.join(path, f"{sheet}{ext}"))
+        if ext == ".parquet":
+            df.to_parquet(files[-1], index=False)
+        else:
+            df.to_csv(files[-1], index=False)
+    return files
+
+
+def parse_rows(text):
+    """'10k' / '1.5m' / '10000' -> int."""
+    text = str(text).strip().lower().replace("_", "")
+    kali = {"k": 1_000, "m": 1_000_000}.get(text[-1:], 1)
+    if kali != 1:
+        text = text[:-1]
+    return int(float(text) * kali)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m gearing.synth",
+        description="Buat file sintetis Gearing Ratio / Outstanding Penjaminan.",
+    )
+    parser.add_argument("layout", choices=["gearing", "penjaminan"])
+    parser.add_argument("rows", help="Jumlah baris, mis. 10k, 1m, 10m")
+    parser.add_argument("-o", "--out", required=True, help="File tujuan (.xlsx / .csv / .parquet)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    n = parse_rows(args.rows)
+    if args.layout == "gearing":
+        write_gearing(make_gearing(n, seed=args.seed), args.out)
+    else:
+        write_penjaminan(make_penjaminan(n, seed=args.seed), args.out)
+    print(f"{args.layout}: {n:,} baris -> {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
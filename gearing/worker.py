@@ -0,0 +1,129 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# ===============================
+# WORKER LATAR BELAKANG (PARSING + CLEANING UPLOAD)
+# ===============================
+DEFAULT_WORKERS = int(os.environ.get("GEARING_WORKERS", "2"))
+
+
+class Cancelled(Exception):
+    """Pemrosesan dibatalkan (mis. file diganti upload baru)."""
+
+
+class Progress:
+    """
+    Status tahap sebuah job, diperbarui oleh worker dan dibaca halaman.
+
+    Memanggil ``progress("membaca file", 0.1)`` memperbarui status dan
+    melempar Cancelled jika job sudah dibatalkan; pembatalan bersifat
+    kooperatif di batas tahap / chunk.
+    """
+
+    def __init__(self):
+        self.stage = "menunggu antrean"
+        self.fraction = 0.0
+        self._cancel = threading.Event()
+
+    def __call__(self, stage, fraction=None):
+        self.check()
+        self.stage = stage
+        if fraction is not None:
+            self.fraction = min(max(float(fraction), 0.0), 1.0)
+
+    def check(self):
+        if self._cancel.is_set():
+            raise Cancelled("Pemrosesan dibatalkan")
+
+    def cancel(self):
+        self._cancel.set()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+
+def report(progress, stage, fraction=None):
+    """Laporkan tahap ke `progress` (boleh None, mis. dari CLI)."""
+    if progress is not None:
+        progress(stage, fraction)
+
+
+class Job:
+    __slots__ = ("key", "future", "progress", "owners")
+
+    def __init__(self, key, progress):
+        self.key = key
+        self.future = None
+        self.progress = progress
+        self.owners = set()
+
+    def done(self):
+        return self.future.done()
+
+    def result(self, timeout=None):
+        return self.future.result(timeout)
+
+
+class JobPool:
+    """
+    Pool thread untuk parsing upload di luar thread script Streamlit.
+
+    Job dikunci (mis. hash isi file): sesi yang meminta kunci sama
+    menunggu job yang sama. Job dibatalkan jika tidak ada lagi sesi yang
+    menunggunya (file diganti / tombol batal).
+    """
+
+    def __init__(self, max_workers=DEFAULT_WORKERS):
+        self._pool = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="gearing-load")
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def submit(self, key, owner, fn):
+        """
+        Jalankan ``fn(progress)`` di latar belakang (atau pakai job aktif
+        untuk kunci yang sama) dan catat `owner` sebagai penunggu.
+        """
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is None or job.progress.cancelled:
+                job = Job(key, Progress())
+                job.future = self._pool.submit(fn, job.progress)
+                self._jobs[key] = job
+                job.future.add_done_callback(lambda _f, job=job: self._selesai(job))
+            job.owners.add(owner)
+            return job
+
+    def _selesai(self, job):
+        with self._lock:
+            if self._jobs.get(job.key) is job:
+                del self._jobs[job.key]
+
+    def _lepas(self, job, owner):
+        job.owners.discard(owner)
+        if not job.owners:
+            job.progress.cancel()
+            job.future.cancel()  # belum mulai: langsung dibuang dari antrean
+            if self._jobs.get(job.key) is job:
+                del self._jobs[job.key]
+
+    def cancel(self, key, owner):
+        """`owner` berhenti menunggu `key`; job dibatalkan jika tanpa penunggu."""
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is not None:
+                self._lepas(job, owner)
+
+    def cancel_others(self, owner, keep):
+        """Batalkan penantian `owner` atas semua job kecuali kunci di `keep`."""
+        keep = set(keep)
+        with self._lock:
+            for job in list(self._jobs.values()):
+                if job.key not in keep and owner in job.owners:
+                    self._lepas(job, owner)
+
+    def active(self):
+        """Jumlah job yang sedang antre / berjalan."""
+        with self._lock:
+            return len(self._jobs)
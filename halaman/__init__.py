@@ -0,0 +1,3 @@
+"""
+Halaman dashboard Streamlit (dijalankan lewat st.navigation di New.py).
+"""
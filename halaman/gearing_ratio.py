@@ -0,0 +1,390 @@
+import os
+
+import streamlit as st
+
+from gearing.dataset import load_gearing, load_gearing_stream
+from gearing.downsample import MAX_POINTS, downsample
+from gearing.memory import estimate_load_bytes
+from gearing.metrics import StageTimer
+from gearing.periode import bulan_id
+from gearing.shared import estimate_nbytes
+from gearing.stream import should_stream
+from halaman.umum import (
+    UPLOAD_TYPES,
+    format_kolom,
+    get_disk_cache,
+    get_filter_cache,
+    lazy_expander,
+    muat_dataset,
+    plotly_chart,
+    session_aggregate_store,
+    session_budget,
+    tampilkan_diagnostik,
+    tampilkan_preview,
+    upload_digest,
+    upload_tersimpan,
+)
+
+
+def bagian_1_proyeksi():
+    import plotly.express as px
+    
+    # ===============================
+    # HEADER DENGAN LOGO
+    # ===============================
+    col_logo, col_title = st.columns([1, 8])
+    
+    with col_logo:
+        st.image("gambar/OIP.jpg", width=90)
+    
+    with col_title:
+        st.markdown(
+            """
+            <h1 style="margin-bottom:0; color:#1f4e79;">
+                Dashboard Gearing Ratio KUR & PEN
+            </h1>
+            <p style="margin-top:0; font-size:16px; color:gray;">
+                Analisis Outstanding, Ekuitas, dan Trend Gearing Ratio berbasis data periodik
+            </p>
+            """,
+            unsafe_allow_html=True
+        )
+    
+    st.info("Website ini akan otomatis menampilkan dashboard untuk perhitungan Trend Gearing Ratio setelah anda mengupload file dengan format xlxs atau csv, dan pastikan format tabel yang akan diinput sesuai dengan contoh")
+    # Tampilkan gambar contoh format Excel
+    st.image(
+        "gambar/ssXlsx.png",
+        caption="Contoh format file Excel (.xlsx) yang didukung",
+        use_container_width=True
+    )
+    st.title("📈 Summary Trend Gearing Ratio")
+    
+    # ===============================
+    # UPLOAD FILE
+    # ===============================
+    uploaded_file = st.file_uploader(
+        "📥 Upload file Excel / CSV / Parquet / Arrow",
+        type=UPLOAD_TYPES,
+        key="upload_Gearing"
+    )
+    uploaded_file = upload_tersimpan("gearing", uploaded_file)
+    
+    if uploaded_file is None:
+        st.info("Silakan upload file terlebih dahulu")
+        st.stop()
+    
+    # ===============================
+    # LOAD + CLEAN DATA (CACHE DISK BERBASIS HASH ISI FILE)
+    # ===============================
+    # CSV besar dibaca per chunk: df = sampel untuk preview, df_agg =
+    # ringkasan per (periode, Jenis) untuk perhitungan.
+    # Diproses di worker latar; hasil dibagi antar sesi (read-only).
+    budget = session_budget()
+    
+    def load_data(file, digest, stream):
+        def baca(progress):
+            if stream:
+                sample, reduced, hashes, info = load_gearing_stream(
+                    file, digest, cache=get_disk_cache(), progress=progress
+                )
+                return sample, info["n_gagal"], reduced, hashes, info["n_rows"]
+            df, n_gagal = load_gearing(
+                file, file.name, digest, cache=get_disk_cache(), progress=progress
+            )
+            return df, n_gagal, df, None, len(df)
+    
+        key = ("gearing", digest, stream)
+        return muat_dataset("gearing", {key: (file.name, baca)})[key]
+    
+    # Perkiraan memori dari ukuran file (Parquet: metadata) dicek sebelum
+    # parsing; CSV yang tidak muat di anggaran sesi dibaca per chunk
+    budget.release("gearing")
+    perkiraan = estimate_load_bytes(uploaded_file.name, uploaded_file.size, uploaded_file)
+    stream = should_stream(uploaded_file.name, uploaded_file.size) or (
+        uploaded_file.name.lower().endswith(".csv") and budget.used + perkiraan > budget.limit
+    )
+    
+    timer = StageTimer("gearing", budget=budget)
+    
+    # Validasi kolom (Periode, Value) dilakukan di clean_gearing
+    with timer.stage("load", expected_bytes=None if stream else perkiraan) as tahap:
+        try:
+            df, n_gagal, df_agg, row_hashes, n_rows = load_data(
+                uploaded_file, upload_digest(uploaded_file), stream
+            )
+        except ValueError as e:
+            st.error(f"❌ {e}")
+            st.stop()
+        tahap["rows"] = n_rows
+        tahap["bytes"] = estimate_nbytes([df, df_agg, row_hashes])
+    
+    # Dataset dipegang sesi ini (dihitung ke anggaran memori)
+    budget.hold("gearing", [df, df_agg, row_hashes])
+    
+    if n_gagal:
+        st.warning(f"⚠️ {n_gagal:,} nilai pada kolom Value tidak dapat dibaca dan diabaikan")
+    
+    if "Jenis" not in df_agg.columns:
+        st.error("❌ Kolom 'Jenis' tidak ditemukan")
+        st.stop()
+    
+    # ===============================
+    # STORE AGREGAT (HANYA PERIODE YANG BERUBAH DIHITUNG ULANG)
+    # ===============================
+    # Store per sesi: upload = riwayat lengkap, jadi hasilnya hanya
+    # bergantung pada isi upload (sama dengan compute_gearing / CLI / API)
+    digest = upload_digest(uploaded_file)
+    store = session_aggregate_store()
+    
+    if st.session_state.get("_store_digest") != digest:
+        with timer.stage("store_update", rows=len(df_agg)):
+            store.update(df_agg, row_hashes)
+        st.session_state["_store_digest"] = digest
+    
+    with timer.stage("gearing") as tahap:
+        df_gear_all = get_filter_cache().get_or_compute(("gear", digest, stream), store.gearing)
+        tahap["rows"] = len(df_gear_all)
+    
+    # ===============================
+    # SIDEBAR FILTER
+    # ===============================
+    st.sidebar.header("🔎 Filter Data")
+    
+    # ===============================
+    # FILTER TAHUN
+    # ===============================
+    available_years = sorted(set(df["Year"].unique()) | set(df_gear_all["SortKey"] // 100))
+    selected_years = st.sidebar.multiselect(
+        "Tahun",
+        available_years,
+        default=available_years
+    )
+    
+    # ===============================
+    # FILTER BULAN
+    # ===============================
+    selected_months = st.sidebar.multiselect(
+        "Bulan",
+        list(bulan_id.values()),
+        default=list(bulan_id.values())
+    )
+    
+    resolusi_penuh = st.sidebar.toggle(
+        "Resolusi penuh grafik",
+        value=False,
+        help=f"Jika mati, grafik dengan lebih dari {MAX_POINTS:,} periode di-downsample (LTTB) dan dirender dengan WebGL"
+    )
+    
+    # ===============================
+    # HASIL FILTER (CACHE LRU PER KOMBINASI FILTER)
+    # ===============================
+    def hitung_filter():
+        mask = (
+            df["Year"].isin(selected_years) &
+            df["Month"].map(bulan_id).isin(selected_months)
+        )
+        gear_mask = (
+            (df_gear_all["SortKey"] // 100).isin(selected_years) &
+            (df_gear_all["SortKey"] % 100).map(bulan_id).isin(selected_months)
+        )
+        return mask.to_numpy().nonzero()[0], df_gear_all[gear_mask]
+    
+    # `stream` ikut kunci: posisi baris mengacu ke sampel (stream) atau
+    # frame penuh, dan jalurnya bergantung pada anggaran memori tiap sesi
+    filter_key = (
+        "filter", digest, stream,
+        tuple(sorted(selected_years)), tuple(sorted(selected_months))
+    )
+    with timer.stage("filter") as tahap:
+        baris, df_gear = get_filter_cache().get_or_compute(filter_key, hitung_filter)
+        tahap["rows"] = len(baris)
+    
+    # ===============================
+    # PREVIEW DATA (MENTAH - TANPA AGREGASI)
+    # ===============================
+    exp, terbuka = lazy_expander("👀 Preview Data (Klik untuk tampil / sembunyi)", key="prev_gearing")
+    
+    with exp:
+        if terbuka:
+            if n_rows > len(df):
+                st.caption(f"File besar: preview menampilkan sampel acak {len(df):,} dari {n_rows:,} baris")
+            with timer.stage("preview", rows=len(baris)):
+                tampilkan_preview(
+                    df,
+                    key="prev_gearing",
+                    rows=baris,
+                    formatter=lambda v: format_kolom(
+                        v.assign(Bulan_Nama=v["Month"].map(bulan_id)), {"Value": "Rp {:,.2f}"}
+                    )
+                )
+    
+    
+    def tampilkan_seri(judul, data, y, chart, yaxis_title, ticksuffix,
+                       judul_tabel, formats, label_download, nama_file):
+        st.subheader(judul)
+        seri = os.path.splitext(nama_file)[0]  # nama tahap di metrik
+    
+        # ===============================
+        # GRAFIK (WEBGL + LTTB JIKA TITIK SANGAT BANYAK)
+        # ===============================
+        with timer.stage(f"chart:{seri}", rows=len(data)):
+            plot_data = data
+            if len(data) > MAX_POINTS and not resolusi_penuh:
+                import plotly.graph_objects as go
+        
+                audited = df_gear.loc[data.index, "Is_Audited"].to_numpy() == 1
+                plot_data = downsample(data, y, MAX_POINTS, keep_mask=audited)
+        
+                fig = go.Figure(go.Scattergl(
+                    x=plot_data["Periode_Label"],
+                    y=plot_data[y],
+                    mode="lines+markers",
+                    fill="tozeroy" if chart is px.area else None
+                ))
+                st.caption(
+                    f"Menampilkan {len(plot_data):,} dari {len(data):,} titik "
+                    "(LTTB, periode audited selalu ditampilkan). Persempit filter "
+                    "Tahun/Bulan atau aktifkan Resolusi penuh untuk semua titik."
+                )
+            else:
+                fig = chart(
+                    data,
+                    x="Periode_Label",
+                    y=y,
+                    markers=True
+                )
+        
+            fig.update_layout(
+                xaxis_title="Periode",
+                yaxis_title=yaxis_title,
+                yaxis=dict(ticksuffix=ticksuffix),
+                hovermode="x unified"
+            )
+        
+            fig.update_xaxes(
+                type="category",
+                categoryorder="array",
+                categoryarray=plot_data["Periode_Label"].tolist(),
+                tickangle=-45
+            )
+        
+        plotly_chart(timer, fig, seri)
+    
+        # ===============================
+        # TABEL HASIL OLAHAN
+        # ===============================
+        exp, terbuka = lazy_expander(judul_tabel, key=f"tabel_{nama_file}")
+    
+        with exp:
+            if terbuka:
+                with timer.stage(f"tabel:{seri}", rows=len(data)):
+                    tampilkan_preview(
+                        data,
+                        key=f"tabel_{nama_file}",
+                        formatter=lambda v: format_kolom(v, formats)
+                    )
+    
+                # ===============================
+                # DOWNLOAD
+                # ===============================
+                st.download_button(
+                    label_download,
+                    data.to_csv(index=False).encode("utf-8"),
+                    nama_file,
+                    "text/csv"
+                )
+    
+    # ===============================
+    # OS PENJAMINAN KUR
+    # ===============================
+    df_kur_agg = df_gear[["SortKey", "Periode_Label", "OS_KUR_Rp", "OS_KUR_T"]].dropna(subset=["OS_KUR_Rp"])
+    
+    tampilkan_seri(
+        "📈 OS Penjaminan KUR", df_kur_agg, "OS_KUR_T", px.area,
+        "Outstanding KUR (Triliun)", " T",
+        "📋 Tabel Hasil Pengolahan OS Penjaminan KUR",
+        {"OS_KUR_Rp": "Rp {:,.2f}", "OS_KUR_T": "{:.2f}"},
+        "⬇️ Download Hasil OS KUR", "os_penjaminan_kur.csv"
+    )
+    
+    # ===============================
+    # EKUITAS KUR
+    # ===============================
+    df_ekuitas_agg = df_gear[["SortKey", "Periode_Label", "Ekuitas_KUR_Rp", "Ekuitas_KUR_T"]].dropna(subset=["Ekuitas_KUR_Rp"])
+    
+    tampilkan_seri(
+        "📈 Ekuitas KUR", df_ekuitas_agg, "Ekuitas_KUR_T", px.area,
+        "Ekuitas KUR (Triliun)", " T",
+        "📋 Tabel Hasil Pengolahan Ekuitas KUR",
+        {"Ekuitas_KUR_Rp": "Rp {:,.2f}", "Ekuitas_KUR_T": "{:.2f}"},
+        "⬇️ Download Hasil Ekuitas KUR", "Ekuitas_kur.csv"
+    )
+    
+    # ===============================
+    # OS PENJAMINAN KUR DAN PEN
+    # ===============================
+    df_kurpen_agg = df_gear[["SortKey", "Periode_Label", "OS_KUR_PEN_Rp", "OS_KUR_PEN_T"]].dropna(subset=["OS_KUR_PEN_Rp"])
+    
+    tampilkan_seri(
+        "📈 OS Penjaminan KUR Dan PEN", df_kurpen_agg, "OS_KUR_PEN_T", px.area,
+        "Outstanding KUR_PEN (Triliun)", " T",
+        "📋 Tabel Hasil Pengolahan OS Penjaminan KUR & PEN",
+        {"OS_KUR_PEN_Rp": "Rp {:,.2f}", "OS_KUR_PEN_T": "{:.2f}"},
+        "⬇️ Download Hasil OS KUR_PEN", "os_penjaminan_kur_pen.csv"
+    )
+    
+    # ===============================
+    # GEARING RATIO KUR
+    # ===============================
+    df_gr_kur = (
+        df_gear[["Periode_Label", "OS_KUR_Rp", "Ekuitas_KUR_Rp", "Gearing_Ratio"]]
+        .dropna(subset=["OS_KUR_Rp"])
+        .rename(columns={"OS_KUR_Rp": "KUR_Total_Rp", "Ekuitas_KUR_Rp": "Ekuitas_Rp"})
+    )
+    
+    tampilkan_seri(
+        "📈 Gearing Ratio KUR", df_gr_kur, "Gearing_Ratio", px.line,
+        "Gearing Ratio KUR", "x",
+        "📋 Tabel Gearing Ratio KUR",
+        {"KUR_Total_Rp": "Rp {:,.2f}", "Ekuitas_Rp": "Rp {:,.2f}", "Gearing_Ratio": "{:.2f}"},
+        "⬇️ Download Hasil Gearing Ratio KUR", "gearing_ratio_kur.csv"
+    )
+    
+    # ===============================
+    # GEARING RATIO KUR & PEN
+    # ===============================
+    df_gr_kurpen = (
+        df_gear[["Periode_Label", "OS_KUR_PEN_Rp", "Ekuitas_KUR_Rp", "GR_KUR_PEN"]]
+        .dropna(subset=["OS_KUR_PEN_Rp"])
+        .rename(columns={"OS_KUR_PEN_Rp": "KUR_PEN_Total_Rp", "Ekuitas_KUR_Rp": "Ekuitas_Rp"})
+    )
+    
+    tampilkan_seri(
+        "📈 Gearing Ratio KUR & PEN", df_gr_kurpen, "GR_KUR_PEN", px.line,
+        "Gearing Ratio KUR dan PEN", "x",
+        "📋 Tabel Gearing Ratio KUR dan PEN",
+        {"KUR_PEN_Total_Rp": "Rp {:,.2f}", "Ekuitas_Rp": "Rp {:,.2f}", "GR_KUR_PEN": "{:.2f}"},
+        "⬇️ Download Hasil Gearing Ratio KUR dan PEN", "gearing_ratio_kurpen.csv"
+    )
+    
+    tampilkan_diagnostik(timer)
+    
+     # ===============================
+    # FOOTER
+    # ===============================
+    st.markdown("---")
+    
+    st.markdown(
+        """
+        <div style="text-align:center; color:gray; font-size:13px;">
+            © 2026 | PT.Askrindo<br>
+            by @Rehanda Umamil Hadi & @Rani Rahmawati<br>
+            Developed with ❤️ using <b>Streamlit</b> & <b>Plotly</b>
+        </div>
+        """,
+        unsafe_allow_html=True
+    )
+    #====================================================================================================================================================================
+
+
+bagian_1_proyeksi()
@@ -0,0 +1,516 @@
+import json
+
+import streamlit as st
+
+from gearing.cube import build_cube, rollup, rollup_numeric
+from gearing.dataset import load_penjaminan, load_penjaminan_duckdb, load_penjaminan_stream
+from gearing.duck import duckdb_supports
+from gearing.figures import bar_from_agg, figure_json, metrics_dual_figure
+from gearing.memory import MemoryBudgetExceeded, estimate_load_bytes
+from gearing.metrics import StageTimer
+from gearing.nilai import format_values
+from gearing.periode import sort_periode
+from gearing.shared import estimate_nbytes
+from gearing.stream import should_stream
+from halaman.umum import (
+    UPLOAD_TYPES,
+    get_disk_cache,
+    get_figure_cache,
+    get_filter_cache,
+    lazy_expander,
+    muat_dataset,
+    plotly_chart,
+    session_budget,
+    tampilkan_diagnostik,
+    tampilkan_preview,
+    upload_digest,
+    upload_tersimpan,
+)
+
+
+def bagian_2_penjaminan():
+    import plotly.graph_objects as go
+    # ===============================
+    # HEADER DENGAN LOGO
+    # ===============================
+    col_logo, col_title = st.columns([1, 8])
+    
+    with col_logo:
+        st.image("gambar/OIP.jpg", width=90)
+    
+    with col_title:
+        st.markdown(
+            """
+            <h1 style="margin-bottom:0; color:#1f4e79;">
+                Dashboard Outstending Penjamin
+            </h1>
+            <p style="margin-top:0; font-size:16px; color:gray;">
+                Analisis Outstending Penjamin (Tenor, Bank, Issued Year, Jenis Kredit, Kota, Jenis Polis dan Proyeksi)
+            </p>
+            """,
+            unsafe_allow_html=True
+        )
+    
+    st.info("Website ini akan otomatis menampilkan dashboard untuk perhitungan Outstending Penjamin setelah anda mengupload file dengan format xlxs atau csv, dan pastikan format tabel yang akan diinput sesuai dengan contoh")
+    st.image(
+        "gambar/xlsxPic2.png",
+        caption="Contoh format file Excel (.xlsx) yang didukung",
+        use_container_width=True
+    )
+    
+    st.title("📊 Dashboard Summary Outstanding Penjamin")
+    
+    # ===============================
+    # UPLOAD FILE
+    # ===============================
+    uploaded_files = st.file_uploader(
+        "📥 Upload file Excel / CSV / Parquet / Arrow",
+        type=UPLOAD_TYPES,
+        accept_multiple_files=True,
+        help="Parquet / Arrow: satu file per sheet (nama file = nama sheet) atau satu file dengan kolom 'Sheet'"
+    )
+    uploaded_files = upload_tersimpan("penjaminan", uploaded_files)
+    
+    if not uploaded_files:
+        st.info("Silakan upload file terlebih dahulu")
+        st.stop()
+    
+    # ===============================
+    # LOAD + CLEAN DATA (SEMUA SHEET, SEKALI BUKA FILE, CACHE DISK)
+    # ===============================
+    # Diproses di worker latar (semua file paralel); hasil dibagi antar sesi.
+    def baca(file, digest, progress):
+        cache = get_disk_cache()
+        # DuckDB (jika terpasang): agregasi out-of-core, hanya sampel + cube ke pandas
+        if duckdb_supports(file.name):
+            hasil = load_penjaminan_duckdb(file, file.name, digest, cache=cache, progress=progress)
+            if hasil is not None:
+                return hasil
+        # CSV besar: sampel baris + cube lengkap dibangun per chunk
+        if should_stream(file.name, file.size):
+            return load_penjaminan_stream(file, digest, cache=cache, progress=progress, name=file.name)
+        sheets, info = load_penjaminan(file, file.name, digest, cache=cache, progress=progress)
+        return sheets, info, {}
+    
+    budget = session_budget()
+    
+    def load_data(files):
+        # Nama file ikut kunci: nama sheet untuk CSV / Parquet berasal dari nama file
+        keys = [("penjaminan", upload_digest(f), f.name) for f in files]
+        tugas = {
+            key: (f.name, lambda progress, f=f, d=key[1]: baca(f, d, progress))
+            for key, f in zip(keys, files)
+        }
+        hasil = muat_dataset("penjaminan", tugas)
+        return [hasil[key] for key in keys]
+    
+    # File yang dibaca utuh ke pandas harus muat di anggaran memori sesi
+    # (CSV besar & DuckDB hanya menyimpan sampel + cube); dicek sebelum parsing
+    budget.release("penjaminan")
+    perkiraan = sum(
+        estimate_load_bytes(f.name, f.size, f) for f in uploaded_files
+        if not should_stream(f.name, f.size) and not duckdb_supports(f.name)
+    )
+    
+    timer = StageTimer("penjaminan", budget=budget)
+    
+    # Beberapa file digabung menjadi satu daftar sheet
+    sheets, sheet_info, stream_cubes = {}, {}, {}
+    with timer.stage("load", expected_bytes=perkiraan) as tahap:
+        for f, (f_sheets, f_info, f_cubes) in zip(uploaded_files, load_data(uploaded_files)):
+            for sheet in f_sheets:
+                nama = sheet if sheet not in sheets else f"{sheet} ({f.name})"
+                sheets[nama] = f_sheets[sheet]
+                sheet_info[nama] = f_info[sheet]
+                if sheet in f_cubes:
+                    stream_cubes[nama] = f_cubes[sheet]
+        tahap["rows"] = sum(
+            sheet_info[n].get("n_rows", len(sheets[n])) for n in sheets
+        )
+        tahap["bytes"] = estimate_nbytes([sheets, stream_cubes])
+    
+    # Dataset dipegang sesi ini (dihitung ke anggaran memori)
+    budget.hold("penjaminan", [sheets, stream_cubes])
+    
+    digest = "-".join(upload_digest(f) for f in uploaded_files)
+    sheet_names = list(sheets)
+    
+    # Skip sheet Proyeksi
+    #sheet_names = [s for s in sheet_names if s.lower() != "proyeksi"]
+    
+    # ===============================
+    # FIGURE DARI AGREGAT (JSON DI-CACHE PER HASH DATA)
+    # ===============================
+    def tampilkan_figure(build, data, nama, **opsi):
+        with timer.stage(f"figure:{nama}", rows=len(data)):
+            fig = go.Figure(json.loads(
+                figure_json(get_figure_cache(), build.__name__, data, build, **opsi)
+            ))
+        plotly_chart(timer, fig, nama)
+    
+    # ===============================
+    # RENDER PER SHEET (FRAGMENT: FILTER HANYA MERERUN SHEET INI)
+    # ===============================
+    @st.fragment
+    def tampilkan_sheet(sheet):
+        # Fragment dirender ulang sendiri: error anggaran ditampilkan di sini
+        try:
+            isi_sheet(sheet)
+        except MemoryBudgetExceeded as e:
+            st.error(f"❌ {e}")
+    
+    def isi_sheet(sheet):
+    
+        st.header(f"📘 by {sheet}")
+    
+        df = sheets[sheet]
+        info = sheet_info[sheet]
+    
+        if info["status"] == "kosong":
+            st.warning("Sheet kosong")
+            return
+    
+        if info["status"] == "struktur":
+            st.warning("Struktur kolom tidak memenuhi standar → dilewati")
+            return
+    
+        if info["status"] == "value":
+            st.warning("Kolom Value tidak ditemukan")
+            return
+    
+        dimensi_label = info["dimensi_label"]  # Untuk UI
+    
+        if info["n_gagal"]:
+            st.warning(f"⚠️ {info['n_gagal']:,} nilai Value tidak dapat dibaca dan diabaikan")
+    
+        # ===============================
+        # CUBE AGREGAT (DIBANGUN SEKALI PER SHEET)
+        # ===============================
+        is_proyeksi = sheet.lower() == "proyeksi"
+        with timer.stage(f"cube:{sheet}") as tahap:
+            cube = get_filter_cache().get_or_compute(
+                ("cube", digest, sheet),
+                lambda: stream_cubes[sheet] if sheet in stream_cubes
+                else build_cube(df, tenor=df.columns[3] if is_proyeksi else None)
+            )
+            tahap["rows"] = len(cube)
+            tahap["bytes"] = estimate_nbytes(cube)
+    
+        # ===============================
+        # PREVIEW DATA
+        # ===============================
+        def fmt(view):
+            if "Metrics" not in view.columns:
+                return view
+            # Debitur = jumlah (tanpa desimal), selain itu Rupiah
+            debitur = view["Metrics"].astype(str).str.lower().str.contains("debitur", na=False)
+            return view.assign(Value=format_values(view["Value"], "Rp {:,.2f}").where(
+                ~debitur, format_values(view["Value"], "{:,.0f}")
+            ))
+    
+        exp, terbuka = lazy_expander("👀 Preview Data", key=f"prev_{sheet}")
+    
+        with exp:
+            if terbuka:
+                if info.get("n_rows", len(df)) > len(df):
+                    st.caption(f"File besar: preview menampilkan sampel acak {len(df):,} dari {info['n_rows']:,} baris")
+                with timer.stage(f"preview:{sheet}", rows=len(df)):
+                    tampilkan_preview(df, key=f"prev_{sheet}", formatter=fmt)
+    
+        # ===============================
+        # FILTER (STRUKTURAL)
+        # ===============================
+        c1, c2, c3 = st.columns(3)
+    
+        with c1:
+            periode_opts = sort_periode(cube["Periode"].dropna().unique())
+            per = st.multiselect(
+                "📅 Periode",
+                periode_opts,
+                default=periode_opts,
+                key=f"per_{sheet}"
+            )
+    
+        with c2:
+            kp = st.multiselect(
+                "🏦 KUR / PEN",
+                sorted(cube["KUR/PEN"].dropna().unique()),
+                default=sorted(cube["KUR/PEN"].dropna().unique()),
+                key=f"kp_{sheet}"
+            )
+    
+        with c3:
+            dim = st.multiselect(
+                f"🏷️ {dimensi_label}",
+                sorted(cube["Dimensi"].dropna().unique()),
+                default=sorted(cube["Dimensi"].dropna().unique()),
+                key=f"dim_{sheet}"
+            )
+    
+        # Filter memotong cube, bukan baris mentah
+        with timer.stage(f"filter:{sheet}") as tahap:
+            df_f = cube[
+                cube["Periode"].isin(per) &
+                cube["KUR/PEN"].isin(kp) &
+                cube["Dimensi"].isin(dim)
+            ]
+            tahap["rows"] = len(df_f)
+    
+        if df_f.empty:
+            st.warning("Data kosong setelah filter")
+            return
+    #=============================================================================
+        # ===============================
+        # KHUSUS SHEET PROYEKSI
+        # OS GROSS & OS NET + FILTER TENOR
+        # ===============================
+        if is_proyeksi:
+        
+            # ===============================
+            # TENOR = KOLOM KE-4 (SUDAH ADA DI CUBE)
+            # ===============================
+            # FILTER TENOR (UI)
+            # ===============================
+            tenor_list = sorted(df_f["Tenor"].dropna().unique())
+        
+            selected_tenor = st.multiselect(
+                "⏳ Pilih Tenor",
+                tenor_list,
+                default=tenor_list,
+                key="tenor_proyeksi"
+            )
+        
+            df_f = df_f[df_f["Tenor"].isin(selected_tenor)]
+        
+            if df_f.empty:
+                st.warning("Data kosong setelah filter Tenor")
+                return
+        
+            col_dim = "Dimensi"
+            col_per = "Periode"
+        
+            # ===============================
+            # OS GROSS
+            # ===============================
+            # st.markdown("### 🔹 OS Gross")
+        
+            df_gross_agg = rollup(
+                df_f[df_f[col_dim].str.lower() == "os gross"], col_per
+            )
+        
+            if df_gross_agg.empty:
+                st.warning("Data OS Gross tidak tersedia")
+            else:
+        
+                tampilkan_figure(
+                    bar_from_agg, df_gross_agg, f"{sheet}/gross",
+                    x=col_per,
+                    text_format=",.0f",
+                    title="📊 Proyeksi OS Gross",
+                    yaxis_title="Nilai (Rp)",
+                    xaxis_title=col_per,
+                    height=450
+                )
+        
+            # ===============================
+            # OS NETT
+            # ===============================
+            # st.markdown("### 🔹 OS Nett")
+        
+            df_net_agg = rollup(
+                df_f[df_f[col_dim].str.lower() == "os nett"], col_per
+            )
+        
+            if df_net_agg.empty:
+                st.warning("Data OS Nett tidak tersedia")
+            else:
+        
+                tampilkan_figure(
+                    bar_from_agg, df_net_agg, f"{sheet}/net",
+                    x=col_per,
+                    text_format=",.0f",
+                    title="📊 Proyeksi OS Nett",
+                    yaxis_title="Nilai (Rp)",
+                    xaxis_title=col_per,
+                    height=450
+                )
+        
+            return  # ⬅️ PENTING
+    
+        # ===============================
+        # KHUSUS SHEET TENOR
+        # PLOT VALUE vs TENOR
+        # ===============================
+        if sheet.lower() == "tenor":   
+            # Agregasi per tenor (tenor numerik & urut)
+            df_tenor_agg = rollup_numeric(df_f, "Dimensi")
+        
+            tampilkan_figure(
+                bar_from_agg, df_tenor_agg, f"{sheet}/tenor",
+                x="Dimensi",
+                xaxis=dict(tickmode="linear", tick0=1, dtick=1),
+                xaxis_title="Tenor (Tahun)",
+                yaxis_title="Nilai (Rupiah)",
+                title="📊 Total Nilai per Tenor",
+                height=450
+            )
+    
+        #-------------------------------------------------------------------------------------------
+        # ===============================
+        # KHUSUS SHEET JENIS POLIS
+        # PLOT VALUE vs JENIS POLIS
+        # ===============================
+        if sheet.lower() == "jenis polis":    
+            # Agregasi per Jenis Polis (SPR, NEW, dll)
+            df_polis_agg = rollup(df_f, "Dimensi").sort_values("Dimensi")
+        
+            tampilkan_figure(
+                bar_from_agg, df_polis_agg, f"{sheet}/polis",
+                x="Dimensi",
+                xaxis_title="Jenis Polis",
+                yaxis_title="Nilai (Rupiah)",
+                title="📊 Total Nilai berdasarkan Jenis Polis",
+                height=450
+            )
+    
+        # ===============================
+        # KHUSUS SHEET JENIS KREDIT (KUR)
+        # PLOT VALUE vs JENIS KREDIT
+        # ===============================
+        if "jenis kredit" in sheet.lower():    
+            # Agregasi per Dimensi (baris tanpa Value diabaikan)
+            df_kredit_agg = rollup(df_f, "Dimensi").sort_values("Dimensi")
+        
+            if df_kredit_agg.empty:
+                st.warning("Data Jenis Kredit kosong setelah filter")
+            else:
+                tampilkan_figure(
+                    bar_from_agg, df_kredit_agg, f"{sheet}/kredit",
+                    x="Dimensi",
+                    xaxis_title="Jenis Kredit (KUR)",
+                    yaxis_title="Nilai (Rupiah)",
+                    title="📊 Total Nilai berdasarkan Jenis Kredit KUR",
+                    height=450
+                )
+    
+        # ===============================
+        # KHUSUS SHEET BANK
+        # PLOT VALUE vs BANK
+        # ===============================
+        if "bank" in sheet.lower():    
+            # Agregasi per Dimensi (baris tanpa Value diabaikan)
+            df_bank_agg = rollup(df_f, "Dimensi").sort_values("Dimensi")
+        
+            if df_bank_agg.empty:
+                st.warning("Data Jenis Kredit kosong setelah filter")
+            else:
+                tampilkan_figure(
+                    bar_from_agg, df_bank_agg, f"{sheet}/bank",
+                    x="Dimensi",
+                    xaxis_title="Bank",
+                    yaxis_title="Nilai (Rupiah)",
+                    title="📊 Total Nilai berdasarkan BANK",
+                    height=450
+                )
+    
+        # ===============================
+        # KHUSUS SHEET KOTA
+        # PLOT VALUE vs KOTA
+        # ===============================
+        sheet_norm = sheet.lower().strip()
+        
+        if "kota" in sheet_norm:    
+            # Bersihkan kolom Dimensi (Kota)
+            df_kota = df_f.assign(Dimensi=df_f["Dimensi"].astype(str).str.strip())
+        
+            df_kota = df_kota[
+                (df_kota["Dimensi"] != "") &
+                (df_kota["Dimensi"].str.lower() != "nan")
+            ]
+        
+            # Agregasi per Kota
+            df_kota_agg = (
+                rollup(df_kota, "Dimensi")
+                .sort_values("Total_Value", ascending=False)
+            )
+        
+            if df_kota_agg.empty:
+                st.warning("⚠️ Data Kota kosong setelah filter")
+            else:
+                tampilkan_figure(
+                    bar_from_agg, df_kota_agg, f"{sheet}/kota",
+                    x="Dimensi",
+                    xaxis_title="Kota",
+                    yaxis_title="Nilai (Rupiah)",
+                    title="📊 Total Nilai berdasarkan Kota",
+                    height=500
+                )
+    
+        
+    
+        # ===============================
+        # AGREGASI METRICS
+        # ===============================
+        df_agg = rollup(df_f, "Metrics", keep_empty=True)
+    
+        df_agg["Total_T"] = df_agg["Total_Value"] / 1_000_000_000_000
+    
+        # ===============================
+        # GRAFIK BATANG (TRILIUN)
+        # ===============================
+        tampilkan_figure(
+            bar_from_agg, df_agg, f"{sheet}/metrics",
+            x="Metrics",
+            y="Total_T",
+            text_suffix=" T",
+            title=f"📊 Summary Metrics berdasarkan {dimensi_label}",
+            yaxis_title="Nilai Finansial (Triliun)",
+            xaxis_title="Metrics"
+        )
+    
+        # ===============================
+        # GRAFIK DUAL AXIS (FOKUS DEBITUR)
+        # ===============================
+        tampilkan_figure(
+            metrics_dual_figure, df_agg, f"{sheet}/metrics_dual",
+            title=f"📊 Metrics vs Jumlah Debitur berdasarkan {dimensi_label}"
+        )
+    
+    
+    # ===============================
+    # TAB PER SHEET (HANYA TAB YANG DIBUKA YANG DIHITUNG)
+    # ===============================
+    try:
+        tabs = st.tabs(sheet_names, key="tab_sheet_penjaminan", on_change="rerun")
+    except TypeError:
+        # Streamlit lama: tab tidak lazy, semua sheet dirender
+        tabs = st.tabs(sheet_names)
+    
+    for sheet, tab in zip(sheet_names, tabs):
+        if getattr(tab, "open", True) is False:
+            continue
+        with tab:
+            with timer.stage(f"sheet:{sheet}"):
+                tampilkan_sheet(sheet)
+    
+    tampilkan_diagnostik(timer)
+    
+    #==========================================================================================================================
+    # ===============================
+    # FOOTER
+    # ===============================
+    st.markdown("---")
+    
+    st.markdown(
+        """
+        <div style="text-align:center; color:gray; font-size:13px;">
+            © 2026 | PT.Askrindo<br>
+            by @Rehanda Umamil Hadi & @Rani Rahmawati<br>
+            Developed with ❤️ using <b>Streamlit</b> & <b>Plotly</b>
+        </div>
+        """,
+        unsafe_allow_html=True
+    )
+
+
+bagian_2_penjaminan()
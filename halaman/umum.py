@@ -0,0 +1,239 @@
+import time
+import uuid
+from concurrent.futures import CancelledError
+
+import streamlit as st
+
+from gearing.cache import DiskCache, content_hash
+from gearing.loader import ARROW_EKSTENSI
+from gearing.lru import LRUCache
+from gearing.memory import MemoryBudget
+from gearing.metrics import export_text, read_log, summarize
+from gearing.nilai import format_values
+from gearing.shared import SharedDatasets
+from gearing.store import AggregateStore
+from gearing.worker import Cancelled, JobPool
+
+# ===============================
+# BAGIAN BERSAMA SEMUA HALAMAN
+# ===============================
+# Cache / store proses dan helper UI; modul khusus halaman (Plotly,
+# DuckDB, engine, cube) diimpor oleh halaman yang memakainya saja.
+
+# Format upload: Excel, CSV, serta Parquet / Arrow IPC (dibaca tanpa salin)
+UPLOAD_TYPES = ["csv", "xlsx"] + [e.lstrip(".") for e in ARROW_EKSTENSI]
+
+# ===============================
+# CACHE DISK (LINTAS SESI & RESTART)
+# ===============================
+@st.cache_resource
+def get_disk_cache():
+    try:
+        return DiskCache()
+    except OSError:
+        return None
+
+def session_aggregate_store():
+    # Store agregat per sesi (di memori), bukan per nama file: data sesi
+    # lain tidak pernah tercampur, upload baru menggantikan riwayat
+    return st.session_state.setdefault("_aggregate_store", AggregateStore())
+
+@st.cache_resource
+def get_shared_datasets():
+    # Dataset hasil parsing dibagi antar sesi: upload identik = satu salinan
+    return SharedDatasets()
+
+def session_budget():
+    # Anggaran memori per sesi (GEARING_SESSION_MEM_MB)
+    return st.session_state.setdefault("_mem_budget", MemoryBudget())
+
+def dataset_owner(halaman):
+    # Pemegang referensi dataset bersama: satu per (sesi, halaman)
+    sesi = st.session_state.setdefault("_owner_id", uuid.uuid4().hex)
+    return f"{sesi}:{halaman}"
+
+@st.cache_resource
+def get_job_pool():
+    # Parsing + cleaning upload berjalan di thread latar, bukan thread script
+    return JobPool()
+
+@st.cache_resource
+def get_figure_cache():
+    # JSON figure Penjaminan per hash data agregat, dibagi antar sesi
+    return LRUCache(maxsize=256)
+
+@st.cache_resource
+def get_filter_cache():
+    # Hasil filter Tahun/Bulan per (dataset, kombinasi filter), dibagi antar sesi
+    return LRUCache(maxsize=64)
+
+def lazy_expander(label, key):
+    # Isi expander hanya dihitung saat dibuka (Streamlit baru);
+    # Streamlit lama: selalu dihitung seperti expander biasa
+    try:
+        exp = st.expander(label, expanded=False, key=key, on_change="rerun")
+    except TypeError:
+        return st.expander(label, expanded=False), True
+    return exp, getattr(exp, "open", True) is not False
+
+def format_kolom(df, formats):
+    # Format kolom angka (pattern str.format) hanya pada baris df ini;
+    # assign tidak menyalin kolom lain (Copy-on-Write)
+    return df.assign(**{
+        col: format_values(df[col], pattern)
+        for col, pattern in formats.items() if col in df.columns
+    })
+
+def tampilkan_preview(df, key, formatter=None, rows=None):
+    # Preview berhalaman: hanya halaman yang tampil yang diformat & dikirim.
+    # `rows` = posisi baris hasil filter (mask), diambil per halaman tanpa
+    # membentuk DataFrame hasil filter utuh.
+    n = len(df) if rows is None else len(rows)
+    c1, c2, c3 = st.columns([1, 1, 3])
+    with c1:
+        page_size = st.selectbox("Baris per halaman", [50, 100, 500], index=1, key=f"{key}_size")
+    pages = max(1, -(-n // page_size))
+    with c2:
+        page = st.number_input("Halaman", min_value=1, max_value=pages, value=1, key=f"{key}_page")
+    with c3:
+        st.caption(f"{n:,} baris · {pages:,} halaman")
+    
+    potong = slice((page - 1) * page_size, page * page_size)
+    view = df.iloc[potong] if rows is None else df.iloc[rows[potong]]
+    if formatter is not None:
+        view = formatter(view)
+    st.dataframe(view, use_container_width=True)
+
+def plotly_chart(timer, fig, nama):
+    # Serialisasi + kirim figure Plotly diukur sebagai tahap tersendiri
+    with timer.stage(f"plotly:{nama}"):
+        st.plotly_chart(fig, use_container_width=True)
+
+def tampilkan_diagnostik(timer):
+    # Panel diagnostik: durasi per tahap run ini + p50/p95 dari log metrik
+    if not st.session_state.get("diagnostik"):
+        return
+    with st.expander("🛠️ Diagnostik", expanded=True):
+        st.markdown("**Tahap run ini**")
+        st.dataframe(timer.frame(), use_container_width=True)
+    
+        ringkas = summarize(read_log(timer.log_path))
+        st.markdown(f"**p50 / p95 (detik) dari log** `{timer.log_path}`")
+        st.dataframe(ringkas[ringkas["page"] == timer.page], use_container_width=True)
+        st.caption(f"Dataset bersama: {get_shared_datasets().stats()}")
+        budget = session_budget()
+        st.caption(
+            f"Memori sesi: {budget.used / 1024 / 1024:,.1f} MB dipegang · puncak "
+            f"{budget.peak / 1024 / 1024:,.1f} MB · anggaran {budget.limit / 1024 / 1024:,.0f} MB"
+        )
+        st.download_button(
+            "📥 Export p50/p95 (teks)",
+            export_text(ringkas),
+            file_name="gearing_metrics.txt",
+            mime="text/plain",
+            key=f"metrics_{timer.page}"
+        )
+
+def muat_dataset(halaman, tugas):
+    # tugas: {kunci: (label, baca(progress))}. Dataset yang belum ada di store
+    # bersama di-parse di worker pool; halaman hanya menampilkan progres per
+    # tahap sehingga navigasi / rerun tetap responsif. Job file lama yang
+    # diganti upload baru dibatalkan. Satu-satunya salinan ada di store
+    # bersama; referensi (sesi, halaman) menahannya dari penggusuran sehingga
+    # pindah halaman tidak mem-parse ulang selama lease masih berlaku.
+    owner = dataset_owner(halaman)
+    shared = get_shared_datasets()
+    pool = get_job_pool()
+    pool.cancel_others(owner, tugas)
+    shared.release_others(owner, tugas)
+    
+    batal = st.session_state.setdefault("_batal", {})
+    if batal.get(halaman) == tuple(tugas):
+        st.info("⏹️ Pemrosesan file dibatalkan")
+        if st.button("🔄 Proses ulang", key=f"ulang_{halaman}"):
+            batal.pop(halaman)
+            st.rerun()
+        st.stop()
+    batal.pop(halaman, None)
+    
+    jobs = {
+        key: pool.submit(
+            key, owner,
+            lambda progress, key=key, baca=baca: shared.acquire(key, owner, lambda: baca(progress))
+        )
+        for key, (label, baca) in tugas.items() if key not in shared
+    }
+    
+    if jobs:
+        wadah = st.empty()
+        with wadah.container():
+            bars = {key: st.progress(0.0, text=f"{tugas[key][0]}: menunggu antrean") for key in jobs}
+            if st.button("✖️ Batalkan", key=f"batal_{halaman}"):
+                for key in jobs:
+                    pool.cancel(key, owner)
+                batal[halaman] = tuple(tugas)
+                st.rerun()
+        
+        # Setiap update progress juga titik interupsi rerun Streamlit
+        while not all(job.done() for job in jobs.values()):
+            for key, job in jobs.items():
+                bars[key].progress(
+                    job.progress.fraction, text=f"{tugas[key][0]}: {job.progress.stage}"
+                )
+            time.sleep(0.2)
+        wadah.empty()
+        
+        try:
+            for job in jobs.values():
+                job.result()  # ValueError dari loader diteruskan ke halaman
+        except (Cancelled, CancelledError):
+            st.info("⏹️ Pemrosesan file dibatalkan")
+            st.stop()
+    
+    return {
+        key: shared.acquire(key, owner, lambda baca=baca: baca(None))
+        for key, (label, baca) in tugas.items()
+    }
+
+def upload_tersimpan(halaman, files):
+    # Widget file_uploader kosong lagi setelah pindah halaman: file terakhir
+    # disimpan di session_state dan dipakai kembali (tanpa upload ulang).
+    # Widget yang dikosongkan pengguna di halaman yang sama = file dilepas.
+    simpan = st.session_state.setdefault("_upload", {})
+    
+    def lepas():
+        del simpan[halaman]
+        get_shared_datasets().release_others(dataset_owner(halaman), ())
+        session_budget().release(halaman)
+    
+    sebelumnya = st.session_state.get("_halaman_upload")
+    st.session_state["_halaman_upload"] = halaman
+    
+    if files:
+        simpan[halaman] = (files, True)
+        return files
+    if halaman not in simpan:
+        return files
+    
+    files, dari_widget = simpan[halaman]
+    if dari_widget and sebelumnya == halaman:
+        lepas()
+        return None
+    
+    simpan[halaman] = (files, False)
+    nama = ", ".join(f.name for f in (files if isinstance(files, list) else [files]))
+    c1, c2 = st.columns([4, 1])
+    with c1:
+        st.caption(f"📎 Memakai file yang sudah diupload di sesi ini: {nama}")
+    with c2:
+        if st.button("✖️ Lepas file", key=f"lepas_{halaman}"):
+            lepas()
+            st.rerun()
+    return files
+
+def upload_digest(uploaded_file):
+    # Hash isi file dihitung sekali per upload, bukan setiap rerun
+    memo = st.session_state.setdefault("_upload_digest", {})
+    if uploaded_file.file_id not in memo:
+        memo[uploaded_file.file_id] = content_hash(uploaded_file.getvalue())
+    return memo[uploaded_file.file_id]
@@ -0,0 +1,87 @@
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from gearing.api import ApiError, GearingApi, make_server
+from gearing.cache import DiskCache
+from gearing.synth import make_gearing, make_penjaminan, write_gearing, write_penjaminan
+
+
+@pytest.fixture
+def penjaminan_csv(tmp_path):
+    files = write_penjaminan(make_penjaminan(2000, seed=0), str(tmp_path / "p.csv"))
+    with open(next(f for f in files if f.endswith("Tenor.csv")), "rb") as f:
+        return f.read()
+
+
+@pytest.fixture
+def server(tmp_path):
+    srv = make_server("127.0.0.1", 0, GearingApi(DiskCache(str(tmp_path / "cache"))), quiet=True)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{srv.server_port}"
+    srv.shutdown()
+    srv.server_close()
+
+
+def _req(url, data=None, headers=None):
+    req = urllib.request.Request(url, data=data, headers=headers or {}, method="POST" if data else "GET")
+    try:
+        with urllib.request.urlopen(req) as resp:
+            return resp.status, resp.headers, resp.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.headers, e.read()
+
+
+def test_upload_etag_304(server, tmp_path):
+    path = str(tmp_path / "gearing.csv")
+    write_gearing(make_gearing(500, seed=0), path)
+    with open(path, "rb") as f:
+        status, _, body = _req(f"{server}/datasets?name=gearing.csv", f.read())
+    assert status == 201
+    hasil = json.loads(body)
+    assert hasil["mode"] == "gearing" and hasil["results"] == ["gearing_ratio"]
+
+    url = f"{server}{hasil['url']}/gearing?columns=Periode_Label,Gearing_Ratio"
+    status, headers, body = _req(url)
+    assert status == 200
+    assert list(json.loads(body)["data"][0]) == ["Periode_Label", "Gearing_Ratio"]
+    etag = headers["ETag"]
+
+    status, _, body = _req(url, headers={"If-None-Match": etag})
+    assert status == 304 and body == b""
+
+
+def test_mode_dan_nama_file_ikut_id(penjaminan_csv, tmp_path):
+    api = GearingApi(DiskCache(str(tmp_path / "cache")))
+    id_data, hasil = api.upload(penjaminan_csv, "data.csv")
+    assert list(hasil["outputs"]) == ["penjaminan_data"]
+
+    id_proyeksi, hasil = api.upload(penjaminan_csv, "Proyeksi.csv")
+    assert id_proyeksi != id_data
+    assert list(hasil["outputs"]) == ["penjaminan_Proyeksi"]
+
+    # File Penjaminan tidak bisa dihitung sebagai Gearing Ratio
+    with pytest.raises(ApiError) as e:
+        api.upload(penjaminan_csv, "data.csv", mode="gearing")
+    assert e.value.status == 422
+
+    assert api.upload(penjaminan_csv, "data.csv")[0] == id_data
+    # Proses baru: hasil dari cache disk tetap per id
+    baru = GearingApi(DiskCache(str(tmp_path / "cache")))
+    assert list(baru.dataset(id_proyeksi)["outputs"]) == ["penjaminan_Proyeksi"]
+
+
+def test_request_salah(server, penjaminan_csv):
+    assert _req(f"{server}/datasets?name=x.txt", b"abc")[0] == 415
+    assert _req(f"{server}/datasets?name=data.csv&mode=lain", penjaminan_csv)[0] == 400
+    status, _, body = _req(f"{server}/datasets/{'0' * 64}")
+    assert status == 404 and "error" in json.loads(body)
+    assert _req(f"{server}/tidak-ada")[0] == 404
+
+    status, _, body = _req(f"{server}/datasets?name=data.csv", penjaminan_csv)
+    url = server + json.loads(body)["url"]
+    assert _req(f"{url}/gearing")[0] == 404
+    assert _req(f"{url}/penjaminan/data?columns=Nope")[0] == 400
@@ -0,0 +1,60 @@
+import os
+
+import pandas as pd
+
+from gearing.cli import _deteksi_mode, aggregate_file, main, nama_folder, process_file
+from gearing.loader import read_workbook, single_sheet_name
+from gearing.synth import make_gearing, make_penjaminan, write_gearing, write_penjaminan
+
+
+def test_nama_sheet_dari_nama_file():
+    assert single_sheet_name("data/Proyeksi.csv") == "Proyeksi"
+    assert single_sheet_name("Tenor.parquet") == "Tenor"
+
+
+def test_penjaminan_csv_per_sheet(tmp_path):
+    files = write_penjaminan(make_penjaminan(2000, seed=0), str(tmp_path / "out.csv"))
+    for path in files:
+        sheet = os.path.splitext(os.path.basename(path))[0]
+        assert list(read_workbook(path, os.path.basename(path))) == [sheet]
+        assert _deteksi_mode(path) == "penjaminan"
+
+        hasil = process_file(path, str(tmp_path / "hasil"))
+        assert hasil["status"] == "ok", hasil["error"]
+        assert hasil["mode"] == "penjaminan"
+
+
+def test_proyeksi_csv_memakai_tenor(tmp_path):
+    files = write_penjaminan(make_penjaminan(2000, seed=0), str(tmp_path / "out.csv"))
+    path = next(p for p in files if p.endswith("Proyeksi.csv"))
+    for chunksize in (None, 300):
+        out = aggregate_file(path, chunksize=chunksize)["outputs"]
+        assert list(out) == ["penjaminan_Proyeksi"]
+
+
+def test_gearing_csv_tetap_gearing(tmp_path):
+    path = str(tmp_path / "gearing.csv")
+    write_gearing(make_gearing(500, seed=0), path)
+    assert _deteksi_mode(path) == "gearing"
+    out = aggregate_file(path)["outputs"]["gearing_ratio"]
+    assert isinstance(out, pd.DataFrame) and len(out)
+
+
+def test_folder_hasil_tidak_bentrok(tmp_path):
+    for tahun in ("2024", "2025"):
+        os.makedirs(tmp_path / "in" / tahun)
+        write_gearing(make_gearing(300, seed=int(tahun)), str(tmp_path / "in" / tahun / "data.csv"))
+    out = tmp_path / "out"
+    assert main([str(tmp_path / "in"), "-o", str(out), "-j", "1"]) == 0
+    assert sorted(p.name for p in out.iterdir() if p.is_dir()) == ["2024_data.csv", "2025_data.csv"]
+
+    files = [str(tmp_path / "a" / "x y.csv"), str(tmp_path / "a" / "x_y.csv")]
+    assert len(set(nama_folder(files).values())) == 2
+    assert nama_folder([files[0]]) == {files[0]: "x_y.csv"}
+
+
+def test_xlsx_huruf_besar(tmp_path):
+    path = str(tmp_path / "DATA.XLSX")
+    write_gearing(make_gearing(200, seed=0), str(tmp_path / "data.xlsx"))
+    os.rename(tmp_path / "data.xlsx", path)
+    assert _deteksi_mode(path) == "gearing"
@@ -0,0 +1,112 @@
+import io
+
+import numpy as np
+import pandas as pd
+
+from gearing.clean import clean_gearing, clean_penjaminan_sheet
+from gearing.cube import aggregate_from_cube, build_cube, rollup, rollup_numeric
+from gearing.engine import PENJAMINAN_GROUP, aggregate_penjaminan, compute_gearing
+from gearing.loader import read_table
+from gearing.stream import stream_gearing_csv, stream_penjaminan_csv
+
+
+def _sheet(n=600, seed=0):
+    rng = np.random.default_rng(seed)
+    value = pd.Series(np.round(rng.uniform(1, 1e6, n), 2)).map("{:,.2f}".format)
+    value = value.str.replace(",", "_").str.replace(".", ",").str.replace("_", ".").astype(object)
+    value[rng.random(n) < 0.1] = None    # Value kosong
+    value[rng.random(n) < 0.02] = "n/a"  # gagal parse
+    raw = pd.DataFrame({
+        "Periode": rng.choice(["Januari 2024", "Februari 2024", "Maret 2024"], n),
+        "KUR/PEN": rng.choice(["KUR", "PEN"], n),
+        "Bank": rng.choice(["BRI", "BNI", "Mandiri", None], n),
+        "Tenor": rng.choice(["1", "2", "3", "5"], n),
+        "Metrics": rng.choice(["Plafon", "OS", "Jumlah Debitur"], n),
+        "Value": value,
+    })
+    # Baris duplikat: tetap dijumlahkan di kedua jalur
+    raw = pd.concat([raw, raw.iloc[:50]], ignore_index=True)
+    df, info = clean_penjaminan_sheet(raw)
+    assert info["status"] == "ok"
+    return raw, df
+
+
+def _urut(df, keys):
+    keys = [k for k in keys if k in df.columns]
+    df = df.astype({k: object for k in keys})
+    return df.sort_values(keys, na_position="last").reset_index(drop=True)
+
+
+def test_cube_sama_dengan_agregasi_baris():
+    _, df = _sheet()
+    for tenor in (None, "Tenor"):
+        cube = build_cube(df, tenor=tenor)
+        pd.testing.assert_frame_equal(
+            _urut(aggregate_from_cube(cube, PENJAMINAN_GROUP), PENJAMINAN_GROUP),
+            _urut(aggregate_penjaminan(df), PENJAMINAN_GROUP),
+            check_dtype=False,
+        )
+
+
+def test_rollup_slice_sama_dengan_filter_baris():
+    _, df = _sheet(seed=1)
+    cube = build_cube(df, tenor="Tenor")
+    per, dim = ["Januari 2024", "Maret 2024"], ["BRI", "Mandiri"]
+    rows = df[df["Periode"].isin(per) & df["Dimensi"].isin(dim)]
+    cells = cube[cube["Periode"].isin(per) & cube["Dimensi"].isin(dim)]
+
+    for by in ("Dimensi", "Metrics"):
+        # Grafik: grup yang Value-nya kosong semua dibuang (dropna sebelum groupby)
+        expected = rows.dropna(subset=["Value"]).groupby(by, observed=True, as_index=False)["Value"].sum()
+        got = rollup(cells, by)
+        pd.testing.assert_frame_equal(
+            _urut(got, [by]), _urut(expected.rename(columns={"Value": "Total_Value"}), [by]),
+            check_dtype=False,
+        )
+
+    # Ringkasan Metrics: grup tanpa Value tetap ada (total 0)
+    expected = rows.groupby("Metrics", observed=True, as_index=False)["Value"].sum()
+    got = rollup(cells, "Metrics", keep_empty=True)
+    assert got["Total_Value"].tolist() == expected["Value"].tolist()
+
+    # Tenor dalam tahun (sheet Proyeksi)
+    tenor = rollup_numeric(cells, "Tenor")
+    expected = (
+        rows.assign(Tenor=pd.to_numeric(rows["Tenor"].astype(str))).dropna(subset=["Value"])
+        .groupby("Tenor", as_index=False)["Value"].sum()
+    )
+    assert tenor["Tenor"].tolist() == expected["Tenor"].tolist()
+    np.testing.assert_allclose(tenor["Total_Value"], expected["Value"])
+
+
+def test_cube_stream_sama_dengan_data_penuh():
+    raw, _ = _sheet(seed=2)
+    data = raw.to_csv(index=False).encode()
+    _, cube, info = stream_penjaminan_csv(io.BytesIO(data), chunksize=97, tenor=True)
+    df, _ = clean_penjaminan_sheet(read_table(io.BytesIO(data), "Proyeksi.csv"))
+    expected = build_cube(df, tenor="Tenor")
+    assert info["n_rows"] == len(df)
+    keys = ["Periode", "KUR/PEN", "Dimensi", "Tenor", "Metrics"]
+    pd.testing.assert_frame_equal(
+        _urut(cube, keys)[keys + ["Total_Value", "n_value"]],
+        _urut(expected, keys)[keys + ["Total_Value", "n_value"]],
+        check_dtype=False,
+    )
+
+
+def test_gearing_stream_dengan_duplikat_audited():
+    rows = ["Periode,Jenis,Value"]
+    for bulan in ("Jan", "Feb", "Mar", "Des"):
+        rows += [f"{bulan} 2023,KUR Gen 1,100", f"{bulan} 2023,Ekuitas KUR,10", f"{bulan} 2023,PEN Gen 1,5"]
+    # Duplikat di chunk berbeda: audited menang walau muncul lebih dulu, lalu baris terakhir
+    rows += ["Des 2023 (Audited),KUR Gen 1,400", "Des 2023,KUR Gen 1,999", "Jan 2023,KUR Gen 1,150"]
+    rows += ["Jan 2023,KUR Gen 1,", "Des 2023 (Audited),Ekuitas KUR,20"]
+    data = "\n".join(rows).encode()
+
+    full, _ = clean_gearing(read_table(io.BytesIO(data), "data.csv"))
+    _, reduced, _, _ = stream_gearing_csv(io.BytesIO(data), chunksize=4)
+    expected = compute_gearing(full)
+    pd.testing.assert_frame_equal(compute_gearing(reduced), expected)
+    des = expected.set_index("SortKey").loc[202312]
+    assert des["Gearing_Ratio"] == 400 / 20
+    assert expected.set_index("SortKey").loc[202301, "Gearing_Ratio"] == 150 / 10
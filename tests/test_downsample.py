@@ -0,0 +1,36 @@
+import numpy as np
+import pandas as pd
+
+from gearing.downsample import downsample, lttb_indices
+
+
+def _seri(n=10_000):
+    x = np.arange(n)
+    y = np.sin(x / 300) + np.random.default_rng(0).normal(0, 0.05, n)
+    y[n // 3], y[2 * n // 3] = 50.0, -50.0
+    return y
+
+
+def test_lttb_titik_awal_akhir_dan_ekstrem():
+    y = _seri()
+    idx = lttb_indices(y, 500)
+    assert len(idx) == 500
+    assert idx[0] == 0 and idx[-1] == len(y) - 1
+    assert (np.diff(idx) > 0).all()
+    assert y.argmax() in idx and y.argmin() in idx
+
+
+def test_lttb_keep_dan_data_pendek():
+    y = _seri(2000)
+    idx = lttb_indices(y, 100, keep=[5, 1999, 5000])
+    assert 5 in idx and len(idx) <= 101
+    assert lttb_indices(y[:50], 100).tolist() == list(range(50))
+
+
+def test_downsample_frame():
+    df = pd.DataFrame({"SortKey": np.arange(5000), "Gearing_Ratio": _seri(5000)})
+    audited = df["SortKey"] % 1000 == 11
+    out = downsample(df, "Gearing_Ratio", n_out=200, keep_mask=audited)
+    assert len(out) <= 200 + audited.sum()
+    assert set(df.index[audited]) <= set(out.index)
+    assert len(downsample(df.iloc[:100], "Gearing_Ratio", n_out=200)) == 100
@@ -0,0 +1,42 @@
+import os
+
+import pandas as pd
+import pytest
+
+from gearing.clean import clean_penjaminan_sheet
+from gearing.cube import CUBE_KEYS, build_cube
+from gearing.loader import PENJAMINAN_KOLOM, PENJAMINAN_POSISI, read_workbook
+from gearing.synth import make_penjaminan, write_penjaminan
+
+pytest.importorskip("duckdb")
+
+from gearing.duck import penjaminan_duckdb  # noqa: E402
+
+
+def _urut(cube):
+    keys = [k for k in CUBE_KEYS if k in cube.columns]
+    cube = cube.astype({k: str for k in keys})
+    return cube.sort_values(keys).reset_index(drop=True)[keys + ["Total_Value", "n_value"]]
+
+
+@pytest.mark.parametrize("sheet", ["Tenor", "Proyeksi", "Kota"])
+def test_duckdb_sama_dengan_pandas(tmp_path, sheet):
+    data = make_penjaminan(3000, seed=2)
+    for df in data.values():
+        # Token NA pd.read_csv, sel kosong, dan satu teks yang benar-benar gagal
+        df.loc[df.index[:6], "Value"] = ["n/a", "NA", "NULL", "", "-", "abc"]
+    files = write_penjaminan(data, str(tmp_path / "p.csv"))
+    path = next(f for f in files if os.path.basename(f) == f"{sheet}.csv")
+    name = os.path.basename(path)
+
+    sheets = read_workbook(path, name, PENJAMINAN_POSISI, PENJAMINAN_KOLOM)
+    df, info = clean_penjaminan_sheet(sheets[sheet])
+    cube = build_cube(df, tenor=df.columns[3] if sheet == "Proyeksi" else None)
+
+    _, duck_cube, duck_info = penjaminan_duckdb(path, name)
+    # "n/a", "NA", "NULL" kosong di kedua jalur; hanya "-" dan "abc" gagal parse
+    assert duck_info["n_gagal"] == info["n_gagal"]
+    assert duck_info["status"] == info["status"]
+    assert duck_info["dimensi_label"] == info["dimensi_label"]
+    assert duck_info["n_rows"] == len(df)
+    pd.testing.assert_frame_equal(_urut(duck_cube), _urut(cube), check_dtype=False, rtol=1e-9)
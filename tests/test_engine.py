@@ -0,0 +1,81 @@
+import io
+
+import numpy as np
+import pandas as pd
+
+from gearing.clean import clean_gearing
+from gearing.engine import compute_gearing, dedup_audited
+from gearing.loader import read_table
+
+
+def _frame(rows):
+    return pd.DataFrame(rows, columns=["SortKey", "Jenis", "Value", "Is_Audited"])
+
+
+def _gearing(csv):
+    df, _ = clean_gearing(read_table(io.BytesIO(csv.encode()), "data.csv"))
+    return compute_gearing(df).set_index("Periode_Label")
+
+
+def test_dedup_audited_mengalahkan_unaudited():
+    df = _frame([
+        (202312, "KUR Gen 1", 1.0, 1),
+        (202312, "KUR Gen 1", 2.0, 0),
+    ])
+    assert dedup_audited(df)["Value"].tolist() == [1.0]
+
+
+def test_dedup_baris_terakhir_menang_jika_status_sama():
+    df = _frame([
+        (202301, "KUR Gen 1", 1.0, 0),
+        (202301, "KUR Gen 1", 2.0, 0),
+        (202312, "KUR Gen 1", 3.0, 1),
+        (202312, "KUR Gen 1", 4.0, 1),
+        (202312, "KUR Gen 1", 5.0, 0),
+    ])
+    assert dedup_audited(df)["Value"].tolist() == [2.0, 4.0]
+
+
+def test_dedup_value_kosong_diabaikan_dan_urutan_tetap():
+    df = _frame([
+        (202302, "KUR Gen 1", 7.0, 0),
+        (202301, "KUR Gen 1", 1.0, 0),
+        (202301, "KUR Gen 1", np.nan, 1),
+        (202301, "Ekuitas KUR", 9.0, 0),
+    ])
+    out = dedup_audited(df)
+    assert out["Value"].tolist() == [7.0, 1.0, 9.0]
+    assert out.index.tolist() == [0, 1, 3]
+
+
+def test_compute_gearing_audited_diutamakan():
+    hasil = _gearing(
+        "Periode,Jenis,Value\n"
+        "Des 2023 (Audited),KUR Gen 1,300\n"
+        "Des 2023,KUR Gen 1,100\n"
+        "Des 2023,KUR Gen 2,50\n"
+        "Des 2023,Ekuitas KUR,10\n"
+    )
+    row = hasil.loc["Des 2023"]
+    assert row["OS_KUR_Rp"] == 350
+    assert row["Gearing_Ratio"] == 35
+    assert row["Is_Audited"] == 1
+
+
+def test_compute_gearing_baris_terakhir_dan_kur_pen():
+    hasil = _gearing(
+        "Periode,Jenis,Value\n"
+        "Jan 2023,KUR Gen 1,100\n"
+        "Jan 2023,KUR Gen 1,120\n"
+        "Jan 2023,PEN Gen 1,30\n"
+        "Jan 2023,Ekuitas KUR,10\n"
+        "Feb 2023,KUR Gen 1,200\n"
+    )
+    jan = hasil.loc["Jan 2023"]
+    assert jan["OS_KUR_Rp"] == 120
+    assert jan["OS_KUR_PEN_Rp"] == 150
+    assert jan["Gearing_Ratio"] == 12
+    assert jan["GR_KUR_PEN"] == 15
+    # Periode tanpa Ekuitas: rasio kosong, bukan error
+    assert pd.isna(hasil.loc["Feb 2023", "Gearing_Ratio"])
+    assert list(hasil.index) == ["Jan 2023", "Feb 2023"]
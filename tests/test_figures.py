@@ -0,0 +1,39 @@
+import json
+
+import pandas as pd
+
+from gearing.figures import data_hash, figure_json
+from gearing.lru import LRUCache
+
+
+def _build(calls):
+    def build(df, **opsi):
+        calls.append(opsi)
+        return {"data": [{"y": df["Total_Value"].tolist()}], "layout": opsi}
+    return build
+
+
+def test_figure_json_dari_cache():
+    df = pd.DataFrame({"Dimensi": ["A", "B"], "Total_Value": [1.0, 2.0]})
+    cache, calls = LRUCache(maxsize=8), []
+    pertama = figure_json(cache, "bar", df, _build(calls), title="OS")
+    assert figure_json(cache, "bar", df.copy(), _build(calls), title="OS") == pertama
+    assert len(calls) == 1
+    assert json.loads(pertama)["layout"] == {"title": "OS"}
+
+
+def test_kunci_berubah_jika_data_atau_opsi_berubah():
+    df = pd.DataFrame({"Dimensi": ["A", "B"], "Total_Value": [1.0, 2.0]})
+    dasar = data_hash(df, title="OS")
+    assert data_hash(df.assign(Total_Value=[1.0, 3.0]), title="OS") != dasar
+    assert data_hash(df.rename(columns={"Dimensi": "Bank"}), title="OS") != dasar
+    assert data_hash(df, title="OS Nett") != dasar
+    assert data_hash(df, title="OS", log=True) != dasar
+    assert data_hash(df.copy(), title="OS") == dasar
+
+    cache, calls = LRUCache(maxsize=8), []
+    figure_json(cache, "bar", df, _build(calls), title="OS")
+    figure_json(cache, "bar", df, _build(calls), title="OS Nett")
+    figure_json(cache, "line", df, _build(calls), title="OS")
+    figure_json(cache, "bar", df.assign(Total_Value=[5.0, 6.0]), _build(calls), title="OS")
+    assert len(calls) == 4
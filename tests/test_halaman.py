@@ -0,0 +1,99 @@
+import io
+import os
+
+import pytest
+
+st = pytest.importorskip("streamlit")
+
+from streamlit.proto.Common_pb2 import FileURLs  # noqa: E402
+from streamlit.runtime.uploaded_file_manager import UploadedFile, UploadedFileRec  # noqa: E402
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+import halaman.umum  # noqa: E402
+from gearing.memory import MemoryBudget  # noqa: E402
+from gearing.metrics import StageTimer  # noqa: E402
+from gearing.synth import make_gearing  # noqa: E402
+
+APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "New.py")
+
+
+@pytest.fixture
+def upload(monkeypatch):
+    # Cache proses (st.cache_resource) bersih; tanpa cache disk & log metrik
+    st.cache_resource.clear()
+    monkeypatch.setattr(halaman.umum, "get_disk_cache", lambda: None)
+    monkeypatch.setattr(StageTimer.__init__, "__defaults__", (None, None, None))
+
+    buf = io.BytesIO()
+    make_gearing(20_000, seed=5).to_csv(buf, index=False)
+    data = buf.getvalue()
+
+    state = {"size": len(data), "aktif": True}
+
+    def file_uploader(*args, **kwargs):
+        if not state["aktif"]:
+            return None
+        return UploadedFile(UploadedFileRec("gearing", "gearing.csv", "text/csv", data), FileURLs())
+
+    monkeypatch.setattr(st, "file_uploader", file_uploader)
+    yield state
+    st.cache_resource.clear()
+
+
+def _sesi(limit=None):
+    at = AppTest.from_file(APP, default_timeout=120)
+    if limit is not None:
+        at.session_state["_mem_budget"] = MemoryBudget(limit_bytes=limit)
+    at.session_state["prev_gearing"] = True  # preview terbuka
+    return _jalan(at)
+
+
+def _jalan(at):
+    at.run()
+    assert not at.exception, [e.value for e in at.exception]
+    return at
+
+
+def _baris(at):
+    return [c.value for c in at.caption if "halaman" in c.value]
+
+
+@pytest.mark.parametrize("stream_dulu", [True, False])
+def test_dua_sesi_beda_jalur_stream(upload, stream_dulu):
+    # Anggaran kecil: CSV ini (~3x ukuran file di memori) dibaca per chunk,
+    # sesi lain (anggaran bawaan) membaca penuh; cache filter dibagi antar sesi
+    kecil = 2 * upload["size"]
+    sesi = {}
+    for stream in ([True, False] if stream_dulu else [False, True]):
+        sesi[stream] = _sesi(kecil if stream else None)
+    harapan = {True: "10,000 baris · 100 halaman", False: "20,000 baris · 200 halaman"}
+    for stream, at in sesi.items():
+        assert _baris(at) == [harapan[stream]]
+
+    cache = halaman.umum.get_filter_cache()
+    kunci = {key[2] for key in list(cache._data) if key[0] == "filter"}
+    assert kunci == {True, False}
+
+    # Entri tergusur (LRU) dihitung ulang dengan benar, tidak tertukar
+    cache.maxsize = 1
+    cache.put("lain", None)
+    for stream in (False, True, False):
+        assert _baris(_jalan(sesi[stream])) == [harapan[stream]]
+    assert len(cache) == 1
+
+
+def test_upload_identik_satu_salinan(upload):
+    a, b = _sesi(), _sesi()
+    shared = halaman.umum.get_shared_datasets()
+    (key,) = list(shared._entries)
+    assert shared.stats()["misses"] == 1
+    assert shared.refcount(key) == 2
+    assert "_dataset" not in a.session_state
+
+    # Widget dikosongkan di halaman yang sama = file dilepas sesi itu saja
+    upload["aktif"] = False
+    _jalan(a)
+    assert shared.refcount(key) == 1
+    upload["aktif"] = True
+    assert _baris(_jalan(b)) == ["20,000 baris · 200 halaman"]
+    assert shared.stats()["misses"] == 1
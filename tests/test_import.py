@@ -0,0 +1,23 @@
+import subprocess
+import sys
+
+import gearing
+
+
+def test_import_memory_tidak_memuat_modul_berat():
+    kode = (
+        "import sys, gearing.memory; "
+        "print(','.join(m for m in ('duckdb', 'gearing.duck', 'gearing.figures', "
+        "'gearing.synth', 'gearing.cube') if m in sys.modules))"
+    )
+    out = subprocess.run([sys.executable, "-c", kode], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == ""
+
+
+def test_ekspor_dimuat_saat_diakses():
+    from gearing.engine import compute_gearing
+
+    assert gearing.compute_gearing is compute_gearing
+    assert set(gearing.__all__) <= set(dir(gearing))
+    for nama in gearing.__all__:
+        getattr(gearing, nama)
@@ -0,0 +1,35 @@
+import io
+
+import pandas as pd
+import pytest
+
+from gearing.memory import MemoryBudget, MemoryBudgetExceeded, estimate_load_bytes
+from gearing.metrics import StageTimer
+
+
+def test_stage_menolak_sebelum_parsing():
+    timer = StageTimer("uji", log_path=None, budget=MemoryBudget(limit_bytes=1000))
+    jalan = []
+    with pytest.raises(MemoryBudgetExceeded):
+        with timer.stage("load", expected_bytes=5000):
+            jalan.append(1)
+    assert jalan == []
+    assert timer.records == []
+
+    with timer.stage("load", expected_bytes=500):
+        jalan.append(1)
+    assert jalan == [1]
+
+
+def test_perkiraan_parquet_dari_metadata():
+    df = pd.DataFrame({"a": range(200_000), "b": ["x"] * 200_000})
+    buf = io.BytesIO()
+    df.to_parquet(buf, compression="zstd")
+    size = buf.getbuffer().nbytes
+
+    tanpa_file = estimate_load_bytes("data.parquet", size)
+    dari_meta = estimate_load_bytes("data.parquet", size, buf)
+    # Parquet terkompresi jauh lebih kecil dari datanya: rasio file meremehkan
+    assert dari_meta > tanpa_file
+    assert dari_meta >= df["a"].nbytes
+    assert estimate_load_bytes("data.csv", 100, b"abc") == estimate_load_bytes("data.csv", 100)
@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from gearing import nilai
+from gearing.nilai import format_values, parse_value_series
+
+TEKS = pd.Series(
+    ["516.859.837.493,95", "1.000", "12,5", " 7 ", "-3,25", "1e3", "", None, "(1.000)", "12,5%", "abc"],
+    dtype=object,
+)
+HARAPAN = [516859837493.95, 1000.0, 12.5, 7.0, -3.25, 1000.0] + [np.nan] * 5
+
+
+def test_format_indonesia():
+    out, gagal = parse_value_series(TEKS)
+    np.testing.assert_allclose(out.to_numpy(), HARAPAN)
+    # Kosong / None bukan gagal; kurung, persen dan teks dihitung gagal
+    assert gagal == 3
+
+
+def test_jalur_pandas_sama_dengan_arrow():
+    if nilai.pa is None:
+        pytest.skip("pyarrow tidak terpasang")
+    np.testing.assert_allclose(nilai._parse_text_pandas(TEKS), nilai._parse_text_arrow(TEKS))
+
+
+def test_kolom_angka_dan_campuran():
+    out, gagal = parse_value_series(pd.Series([1, 2, None]))
+    assert out.tolist()[:2] == [1.0, 2.0] and gagal == 0
+
+    # Excel: angka asli bercampur teks format Indonesia
+    out, gagal = parse_value_series(pd.Series([1.5, "2.000,5", "x", None], dtype=object))
+    np.testing.assert_allclose(out.to_numpy(), [1.5, 2000.5, np.nan, np.nan])
+    assert gagal == 1
+
+
+def test_kolom_bool_tidak_error():
+    out, gagal = parse_value_series(pd.Series([True, False, True]))
+    assert out.isna().all() and gagal == 3
+
+    out, gagal = parse_value_series(pd.Series([True, "1.000", 5], dtype=object))
+    np.testing.assert_allclose(out.to_numpy(), [np.nan, 1000.0, 5.0])
+    assert gagal == 1
+
+
+def test_format_values():
+    out = format_values(pd.Series([1234.5, np.nan]), "Rp {:,.2f}")
+    assert out.tolist() == ["Rp 1,234.50", ""]
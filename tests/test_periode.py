@@ -0,0 +1,53 @@
+import io
+
+import pandas as pd
+
+from gearing.clean import clean_gearing
+from gearing.engine import compute_gearing
+from gearing.loader import read_table
+from gearing import periode
+from gearing.periode import add_periode_columns, parse_periode_series
+
+
+def test_periode_kosong_menjadi_na():
+    parsed = parse_periode_series(pd.Series(["Jan 2023", None, "Feb 2023", float("nan")]))
+    assert parsed["SortKey"].tolist()[0] == 202301
+    assert parsed["SortKey"].isna().tolist() == [False, True, False, True]
+    assert parsed["Periode_Label"].isna().tolist() == [False, True, False, True]
+
+
+def test_baris_periode_kosong_dibuang():
+    df = pd.DataFrame({"Periode": ["Jan 2023", None, "Feb 2023"], "Value": [1, 2, 3]})
+    out = add_periode_columns(df)
+    assert out["Value"].tolist() == [1, 3]
+    assert out["SortKey"].tolist() == [202301, 202302]
+
+
+def test_periode_kosong_tidak_masuk_periode_terakhir():
+    csv = (
+        "Periode,Jenis,Value\n"
+        "Jan 2023,KUR Gen 1,100\n"
+        "Jan 2023,Ekuitas KUR,10\n"
+        "Feb 2023,KUR Gen 1,200\n"
+        "Feb 2023,Ekuitas KUR,20\n"
+        ",KUR Gen 1,999999\n"
+    ).encode()
+    df, _ = clean_gearing(read_table(io.BytesIO(csv), "data.csv"))
+    hasil = compute_gearing(df).set_index("Periode_Label")
+    assert hasil.loc["Feb 2023", "OS_KUR_Rp"] == 200
+    assert hasil.loc["Feb 2023", "Gearing_Ratio"] == 10
+    assert len(hasil) == 2
+
+
+def test_memo_periode_terbatas(monkeypatch):
+    monkeypatch.setattr(periode._memo, "maxsize", 5)
+    periode.clear_periode_memo()
+    teks = pd.Series([f"{b}-{2000 + i}" for i in range(4) for b in ("Jan", "Feb", "Mar")])
+
+    hasil = parse_periode_series(teks)
+
+    assert len(periode._memo) == 5
+    assert hasil["Year"].tolist() == [2000 + i for i in range(4) for _ in range(3)]
+    assert hasil["Month"].tolist() == [1, 2, 3] * 4
+    periode.clear_periode_memo()
+    assert len(periode._memo) == 0
@@ -0,0 +1,50 @@
+import threading
+import time
+
+import pandas as pd
+
+import gearing.shared as shared_mod
+from gearing.shared import SharedDatasets
+
+
+def test_acquire_bersamaan_load_sekali(monkeypatch):
+    # estimate_nbytes lambat = jendela antara load selesai dan entri masuk
+    asli = shared_mod.estimate_nbytes
+
+    def lambat(value):
+        time.sleep(0.3)
+        return asli(value)
+
+    monkeypatch.setattr(shared_mod, "estimate_nbytes", lambat)
+    shared = SharedDatasets()
+    calls = []
+    sudah = threading.Event()
+
+    def load():
+        calls.append(1)
+        sudah.set()
+        return pd.DataFrame({"a": range(10)})
+
+    hasil = {}
+    a = threading.Thread(target=lambda: hasil.setdefault("a", shared.acquire("k", "a", load)))
+    a.start()
+    sudah.wait()
+    time.sleep(0.05)
+    hasil["b"] = shared.acquire("k", "b", load)
+    a.join()
+
+    assert len(calls) == 1
+    assert hasil["a"] is hasil["b"]
+    assert shared.refcount("k") == 2
+
+
+def test_owner_menahan_dan_melepas_entri():
+    df = pd.DataFrame({"a": range(1000)})
+    shared = SharedDatasets(max_bytes=0)
+    shared.acquire("k", "sesi:gearing", lambda: df)
+    shared.acquire("lain", None, lambda: df.copy())
+    assert "k" in shared and shared.refcount("k") == 1
+
+    shared.release_others("sesi:gearing", ())
+    shared.acquire("baru", None, lambda: df.copy())
+    assert "k" not in shared
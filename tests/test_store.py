@@ -0,0 +1,52 @@
+import io
+
+import pandas as pd
+
+from gearing.clean import clean_gearing
+from gearing.engine import compute_gearing
+from gearing.loader import read_table
+from gearing.store import AggregateStore
+
+
+def _bersih(periode):
+    rows = ["Periode,Jenis,Value"]
+    for i, p in enumerate(periode, start=1):
+        rows += [f"{p},KUR Gen 1,{100 * i}", f"{p},PEN Gen 1,{10 * i}", f"{p},Ekuitas KUR,{5 * i}"]
+    df, _ = clean_gearing(read_table(io.BytesIO("\n".join(rows).encode()), "data.csv"))
+    return df
+
+
+def _label_str(df):
+    return df.assign(Periode_Label=df["Periode_Label"].astype(str))
+
+
+def _sama(store, df):
+    pd.testing.assert_frame_equal(
+        _label_str(store.gearing()), _label_str(compute_gearing(df)), check_dtype=False
+    )
+
+
+def test_upload_baru_menggantikan_riwayat():
+    store = AggregateStore()
+    store.update(_bersih(["Jan 2015", "Jan 2016"]))
+    b = _bersih(["Jan 2030"])
+    store.update(b)
+    assert store.gearing()["SortKey"].tolist() == [203001]
+    _sama(store, b)
+
+
+def test_hanya_periode_baru_dihitung_ulang():
+    store = AggregateStore()
+    store.update(_bersih(["Jan 2023", "Feb 2023"]))
+    df = _bersih(["Jan 2023", "Feb 2023", "Mar 2023"])
+    assert store.update(df) == [202303]
+    _sama(store, df)
+
+
+def test_periode_yang_dihapus_dibuang():
+    store = AggregateStore()
+    store.update(_bersih(["Jan 2023", "Feb 2023", "Mar 2023"]))
+    df = _bersih(["Jan 2023", "Feb 2023"])
+    assert store.update(df) == [202303]
+    _sama(store, df)
+
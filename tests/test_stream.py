@@ -0,0 +1,26 @@
+import io
+
+import pandas as pd
+
+from gearing.clean import clean_gearing
+from gearing.loader import read_table
+from gearing.store import period_hashes
+from gearing.stream import stream_gearing_csv
+from gearing.synth import make_gearing
+
+
+def _csv(df):
+    buf = io.BytesIO()
+    df.to_csv(buf, index=False)
+    return buf.getvalue()
+
+
+def test_hash_stream_sama_dengan_data_penuh():
+    data = _csv(make_gearing(5000, seed=1))
+    full, _ = clean_gearing(read_table(io.BytesIO(data), "data.csv"))
+    _, _, hashes, _ = stream_gearing_csv(io.BytesIO(data), chunksize=700)
+
+    expected = period_hashes(full)
+    assert hashes["row_hash"].dtype == "uint64"
+    pd.testing.assert_frame_equal(hashes, expected, check_dtype=False)
+    assert (hashes["row_hash"].to_numpy() == expected["row_hash"].to_numpy()).all()